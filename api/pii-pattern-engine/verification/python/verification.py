@@ -234,11 +234,18 @@ def iban_mod97(value: str) -> bool:
         return False
 
 
+# Luhn: every second digit from the right counts doubled, minus 9 if above 9
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+
 def luhn(value: str) -> bool:
     """
     Verify using Luhn algorithm (mod-10 checksum).
 
-    Used for credit cards, some national IDs, etc.
+    Used for credit cards, some national IDs, etc. ASCII values are checked
+    on their bytes: the doubled digits are mapped through a lookup table and
+    both halves summed in C, instead of looping over digits in Python.
 
     Args:
         value: Numeric string to verify
@@ -246,6 +253,25 @@ def luhn(value: str) -> bool:
     Returns:
         True if passes Luhn check, False otherwise
     """
+    if not value.isascii():
+        return _luhn_unicode(value)
+
+    # Remove non-digits
+    digits = value.encode("ascii").translate(None, _NON_DIGIT_BYTES)
+
+    if not digits:
+        return False
+
+    # Digits at odd positions from the right count as-is (minus the ASCII
+    # offset), the others doubled via the lookup table
+    kept = digits[-1::-2]
+    checksum = sum(kept) - 0x30 * len(kept) + sum(digits[-2::-2].translate(_LUHN_DOUBLED))
+
+    return checksum % 10 == 0
+
+
+def _luhn_unicode(value: str) -> bool:
+    """Luhn check for values with non-ASCII characters (e.g. full-width digits)."""
     # Remove non-digits
     digits = [int(d) for d in value if d.isdigit()]
 
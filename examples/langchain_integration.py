@@ -90,13 +90,13 @@ class SecureLangChainWrapper:
         sanitized_docs = []
         token_maps = []
 
-        for doc in documents:
-            # Layer 2: Scan document before indexing
-            result = await self.security.scan_document(
-                doc,
-                namespaces=["comm", "us"],
-            )
+        # Layer 2: Scan all documents concurrently before indexing
+        results = await self.security.scan_documents(
+            documents,
+            namespaces=["comm", "us"],
+        )
 
+        for result in results:
             if not result.blocked:
                 sanitized_docs.append(result.sanitized_text)
                 if result.token_map:
@@ -172,8 +172,19 @@ async def main():
     # Store sanitized version in vector DB
     print("\n→ Store in vector DB: {sanitized}")
 
+    # Persist the token map (never alongside the vector DB) for later reversal
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        map_path = Path(tmp_dir) / "token_map.json"
+        tokenizer.save_token_map(token_map, map_path)
+        stored_map = tokenizer.load_token_map(map_path)
+
+    print(f"Token map persisted and reloaded ({len(stored_map.tokens)} tokens)")
+
     # Later, reverse if authorized
-    detokenized = tokenizer.detokenize(sanitized, token_map)
+    detokenized = tokenizer.detokenize(sanitized, stored_map)
     print(f"Detokenized (authorized): {detokenized}")
 
     print("\n" + "=" * 70)
@@ -6,94 +6,94 @@ This example uses utility functions to demonstrate YAML pattern management
 without cluttering the current directory with temporary files.
 """
 
+import argparse
+import sys
+
 from yaml_utils import YAMLPatternManager, run_all_examples
 
 
-def demonstrate_yaml_utilities():
+def demonstrate_yaml_utilities(manager: YAMLPatternManager):
     """Demonstrate YAML utilities with clean output."""
     print("\n" + "=" * 60)
     print("YAML Pattern Management - Clean Examples")
     print("=" * 60)
 
-    # Use the utility manager
-    manager = YAMLPatternManager()
+    # Example 1: Create pattern file
+    print("\n📝 Creating Pattern File")
+    result = manager.create_pattern_file()
+    print(f"   ✅ Created file with {result['pattern_count']} patterns")
+    print(f"   📁 Namespace: {result['namespace']}")
+    print(f"   📄 Description: {result['description']}")
+
+    # Example 2: Add pattern
+    print("\n➕ Adding New Pattern")
+    result = manager.add_pattern()
+    print(f"   ✅ Added '{result['added_pattern']}'")
+    print(f"   📊 Total patterns: {result['total_patterns']}")
+    print(f"   📋 Pattern IDs: {', '.join(result['pattern_ids'])}")
+
+    # Example 3: Update pattern
+    print("\n✏️  Updating Pattern")
+    result = manager.update_pattern()
+    if result["success"]:
+        print(f"   ✅ Updated '{result['pattern_id']}'")
+        print(f"   🔄 Severity: {result['old_severity']} → {result['new_severity']}")
+        print(f"   🔄 Action: redact → {result['new_action']}")
+
+    # Example 4: Query patterns
+    print("\n🔍 Querying Patterns")
+    patterns = manager.query_patterns()
+    print(f"   📊 Found {len(patterns)} patterns:")
+    for pattern in patterns:
+        print(f"   • {pattern['id']} ({pattern['category']}) - {pattern['severity']}")
+
+    # Example 5: Test with engine
+    print("\n🚀 Testing with Detection Engine")
+    result = manager.test_with_engine()
+    print(f"   ✅ Loaded {result['registry_size']} patterns")
+    print(f"   🔍 Found {result['match_count']} matches in {result['text_length']} chars")
+    print(f"   🔒 Made {result['redaction_count']} redactions")
+
+    print("\n   Detected patterns:")
+    for match in result["matches"]:
+        print(f"   • {match['pattern_id']} ({match['category']}) at {match['position']}")
+
+    # Example 6: Remove pattern
+    print("\n🗑️  Removing Pattern")
+    result = manager.remove_pattern()
+    if result["success"]:
+        print(f"   ✅ Removed '{result['removed_pattern']}'")
+        print(f"   📋 Remaining: {', '.join(result['remaining_patterns'])}")
+
+    # Example 7: Backup and restore
+    print("\n💾 Backup and Restore")
+    result = manager.backup_and_restore()
+    print("   ✅ Created backup")
+    print(f"   ➕ Added temp pattern: {result['temp_pattern_added']}")
+    print("   🔄 Restored from backup")
+    print(f"   ✅ Temp pattern removed: {result['temp_pattern_removed']}")
 
-    try:
-        # Example 1: Create pattern file
-        print("\n📝 Creating Pattern File")
-        result = manager.create_pattern_file()
-        print(f"   ✅ Created file with {result['pattern_count']} patterns")
-        print(f"   📁 Namespace: {result['namespace']}")
-        print(f"   📄 Description: {result['description']}")
-
-        # Example 2: Add pattern
-        print("\n➕ Adding New Pattern")
-        result = manager.add_pattern()
-        print(f"   ✅ Added '{result['added_pattern']}'")
-        print(f"   📊 Total patterns: {result['total_patterns']}")
-        print(f"   📋 Pattern IDs: {', '.join(result['pattern_ids'])}")
-
-        # Example 3: Update pattern
-        print("\n✏️  Updating Pattern")
-        result = manager.update_pattern()
-        if result["success"]:
-            print(f"   ✅ Updated '{result['pattern_id']}'")
-            print(f"   🔄 Severity: {result['old_severity']} → {result['new_severity']}")
-            print(f"   🔄 Action: redact → {result['new_action']}")
-
-        # Example 4: Query patterns
-        print("\n🔍 Querying Patterns")
-        patterns = manager.query_patterns()
-        print(f"   📊 Found {len(patterns)} patterns:")
-        for pattern in patterns:
-            print(f"   • {pattern['id']} ({pattern['category']}) - {pattern['severity']}")
-
-        # Example 5: Test with engine
-        print("\n🚀 Testing with Detection Engine")
-        result = manager.test_with_engine()
-        print(f"   ✅ Loaded {result['registry_size']} patterns")
-        print(f"   🔍 Found {result['match_count']} matches in {result['text_length']} chars")
-        print(f"   🔒 Made {result['redaction_count']} redactions")
-
-        print("\n   Detected patterns:")
-        for match in result["matches"]:
-            print(f"   • {match['pattern_id']} ({match['category']}) at {match['position']}")
-
-        # Example 6: Remove pattern
-        print("\n🗑️  Removing Pattern")
-        result = manager.remove_pattern()
-        if result["success"]:
-            print(f"   ✅ Removed '{result['removed_pattern']}'")
-            print(f"   📋 Remaining: {', '.join(result['remaining_patterns'])}")
-
-        # Example 7: Backup and restore
-        print("\n💾 Backup and Restore")
-        result = manager.backup_and_restore()
-        print("   ✅ Created backup")
-        print(f"   ➕ Added temp pattern: {result['temp_pattern_added']}")
-        print("   🔄 Restored from backup")
-        print(f"   ✅ Temp pattern removed: {result['temp_pattern_removed']}")
-
-        print("\n" + "=" * 60)
-        print("✅ All examples completed successfully!")
-        print("=" * 60)
+    print("\n" + "=" * 60)
+    print("✅ All examples completed successfully!")
+    print("=" * 60)
 
-    finally:
-        # Clean up
-        print("\n🧹 Cleaning up temporary files...")
-        cleaned = manager.cleanup()
-        for file_path in cleaned:
-            print(f"   ✅ Cleaned: {file_path}")
+
+def cleanup(manager: YAMLPatternManager):
+    """Remove the manager's temporary files."""
+    print("\n🧹 Cleaning up temporary files...")
+    cleaned = manager.cleanup()
+    for file_path in cleaned:
+        print(f"   ✅ Cleaned: {file_path}")
 
 
-def demonstrate_batch_processing():
+def demonstrate_batch_processing(manager: YAMLPatternManager):
     """Demonstrate running all examples in batch mode."""
     print("\n" + "=" * 60)
     print("Batch Processing Example")
     print("=" * 60)
 
     print("🚀 Running all examples in batch mode...")
-    results = run_all_examples()
+    results = run_all_examples(manager)
 
     print("\n📊 Summary:")
     print(f"   • Created file with {results['create_file']['pattern_count']} patterns")
@@ -108,20 +108,26 @@ def demonstrate_batch_processing():
 
 def main():
     """Run examples."""
-    print("Choose an example to run:")
-    print("1. Interactive demonstration")
-    print("2. Batch processing")
-    print("3. Both")
-
-    choice = input("\nEnter choice (1-3) or press Enter for option 1: ").strip()
-
-    if choice == "2":
-        demonstrate_batch_processing()
-    elif choice == "3":
-        demonstrate_yaml_utilities()
-        demonstrate_batch_processing()
-    else:
-        demonstrate_yaml_utilities()
+    parser = argparse.ArgumentParser(description="YAML pattern management examples")
+    parser.add_argument(
+        "--mode",
+        choices=["interactive", "batch", "both"],
+        # Without a terminal (CI, benchmarks) default to the batch run
+        default="interactive" if sys.stdin.isatty() else "batch",
+        help="interactive: step-by-step demonstration; batch: run_all_examples(); both",
+    )
+    args = parser.parse_args()
+
+    # One manager (and temporary directory) is shared by both demonstrations
+    manager = YAMLPatternManager()
+    try:
+        if args.mode in ("interactive", "both"):
+            demonstrate_yaml_utilities(manager)
+        if args.mode in ("batch", "both"):
+            demonstrate_batch_processing(manager)
+    finally:
+        # Idempotent: run_all_examples() may already have removed the files
+        cleanup(manager)
 
 
 if __name__ == "__main__":
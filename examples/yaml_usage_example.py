@@ -13,12 +13,13 @@ cluttering your current working directory.
 """
 
 import os
+import shutil
 import tempfile
 
+from yaml_utils import cached_engine
+
 from datadetector import (
-    Engine,
     PatternFileHandler,
-    load_registry,
     read_yaml,
     write_yaml,
 )
@@ -112,23 +113,17 @@ def example_3_update_pattern():
     print("Example 3: Updating a Pattern")
     print("=" * 60)
 
-    # Get current pattern
-    pattern = PatternFileHandler.get_pattern_from_file(PATTERN_FILE, "api_key_01")
-    print(f"Current severity: {pattern['policy']['severity']}")
+    # Load once, modify in place and write back once when the block exits
+    with PatternFileHandler.edit(PATTERN_FILE) as data:
+        pattern = next(p for p in data["patterns"] if p["id"] == "api_key_01")
+        print(f"Current severity: {pattern['policy']['severity']}")
 
-    # Update severity
-    success = PatternFileHandler.update_pattern_in_file(
-        file_path=PATTERN_FILE,
-        pattern_id="api_key_01",
-        updates={"policy": {"severity": "critical", "action_on_match": "tokenize"}},
-    )
+        # Update severity
+        pattern.update({"policy": {"severity": "critical", "action_on_match": "tokenize"}})
 
-    if success:
-        # Get updated pattern
-        updated = PatternFileHandler.get_pattern_from_file(PATTERN_FILE, "api_key_01")
-        print("✅ Updated api_key_01")
-        print(f"   New severity: {updated['policy']['severity']}")
-        print(f"   New action: {updated['policy']['action_on_match']}")
+    print("✅ Updated api_key_01")
+    print(f"   New severity: {pattern['policy']['severity']}")
+    print(f"   New action: {pattern['policy']['action_on_match']}")
 
 
 def example_4_query_patterns():
@@ -158,13 +153,11 @@ def example_5_use_with_engine():
     print("Example 5: Using Patterns with Engine")
     print("=" * 60)
 
-    # Load custom patterns (skip example validation for demo)
-    registry = load_registry(paths=[PATTERN_FILE], validate_schema=False, validate_examples=False)
+    # Load custom patterns (skip example validation for demo). The engine is
+    # cached per (path, mtime), so re-running this reuses the compiled patterns
+    engine = cached_engine([PATTERN_FILE])
 
-    print(f"✅ Loaded {len(registry)} patterns from custom namespace")
-
-    # Create engine
-    engine = Engine(registry)
+    print(f"✅ Loaded {len(engine.registry)} patterns from custom namespace")
 
     # Test detection
     test_text = """
@@ -257,16 +250,16 @@ def cleanup():
     ]
 
     for file in files_to_remove:
-        if os.path.exists(file):
-            os.remove(file)
-            print(f"🧹 Cleaned up: {file}")
-
-    # Try to remove temp directory if empty
-    try:
-        os.rmdir(TEMP_DIR)
-        print(f"🧹 Cleaned up temp directory: {TEMP_DIR}")
-    except OSError:
-        pass  # Directory not empty or doesn't exist
+        # One unlink per file instead of an exists() check followed by remove()
+        try:
+            os.unlink(file)
+        except FileNotFoundError:
+            continue
+        print(f"🧹 Cleaned up: {file}")
+
+    # The temp directory was created by this script, so remove it with anything left in it
+    shutil.rmtree(TEMP_DIR, ignore_errors=True)
+    print(f"🧹 Cleaned up temp directory: {TEMP_DIR}")
 
 
 def main():
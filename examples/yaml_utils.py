@@ -7,9 +7,12 @@ YAML utilities for pattern file management without creating files
 in the current directory.
 """
 
+import copy
+import functools
 import os
+import shutil
 import tempfile
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from datadetector import (
     Engine,
@@ -19,42 +22,105 @@ from datadetector import (
     write_yaml,
 )
 
+# Sample data shared by every YAMLPatternManager, built once at import time
+_APIKEY_MASK = "APIKEY-" + "*" * 32
+_SESSION_MASK = "SESSION_" + "*" * 40
+
+_SAMPLE_PATTERNS: List[Dict[str, Any]] = [
+    {
+        "id": "api_key_01",
+        "location": "custom",
+        "category": "token",
+        "description": "Custom API key format",
+        "pattern": r"APIKEY-[A-Z0-9]{32}",
+        "mask": _APIKEY_MASK,
+        "examples": {
+            "match": ["APIKEY-ABC123XYZ789ABC123XYZ789ABC123"],
+            "nomatch": ["APIKEY-SHORT", "API-KEY-ABC123"],
+        },
+        "policy": {"store_raw": False, "action_on_match": "redact", "severity": "critical"},
+    },
+    {
+        "id": "internal_id_01",
+        "location": "custom",
+        "category": "other",
+        "description": "Internal user ID",
+        "pattern": r"USR-\d{8}",
+        "mask": "USR-********",
+        "policy": {"store_raw": False, "action_on_match": "redact", "severity": "medium"},
+    },
+]
+
+_SESSION_TOKEN_PATTERN: Dict[str, Any] = {
+    "id": "session_token_01",
+    "location": "custom",
+    "category": "token",
+    "description": "Session token",
+    "pattern": r"SESSION_[A-F0-9]{40}",
+    "mask": _SESSION_MASK,
+    "policy": {"store_raw": False, "action_on_match": "redact", "severity": "high"},
+}
+
+_TEMP_PATTERN: Dict[str, Any] = {
+    "id": "temp_pattern_01",
+    "location": "custom",
+    "category": "other",
+    "pattern": "temp",
+    "policy": {"store_raw": False, "action_on_match": "redact", "severity": "low"},
+}
+
+_ENGINE_TEST_TEXT = """
+        Here are some sensitive items:
+        - API Key: APIKEY-ABC123XYZ789ABC123XYZ789ABC123
+        - User ID: USR-12345678
+        - Session: SESSION_1A2B3C4D5E6F7A8B9C0D1E2F3A4B5C6D7E8F9A0B
+        """
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_engine(paths_key: Tuple[Tuple[str, int, int], ...]) -> Engine:
+    """Build an Engine for pattern files, keyed by (path, mtime_ns, size)."""
+    registry = load_registry(
+        paths=[path for path, _, _ in paths_key], validate_schema=False, validate_examples=False
+    )
+    return Engine(registry)
+
+
+def cached_engine(paths: List[str]) -> Engine:
+    """
+    Get an Engine for custom pattern files, reusing compiled patterns.
+
+    Repeated calls for unchanged files return the same Engine; editing a file
+    changes its mtime/size and builds a new one.
+
+    Args:
+        paths: Pattern file paths
+
+    Returns:
+        Engine with the patterns from the files (schema/example validation skipped)
+    """
+    paths_key = []
+    for path in paths:
+        stat = os.stat(path)
+        paths_key.append((path, stat.st_mtime_ns, stat.st_size))
+    return _cached_engine(tuple(paths_key))
+
 
 class YAMLPatternManager:
     """A utility class for managing YAML pattern files in examples."""
 
     def __init__(self, temp_dir: Optional[str] = None):
         """Initialize with optional temporary directory."""
+        # Only a directory created here may be removed wholesale in cleanup()
+        self._owns_temp_dir = temp_dir is None
         self.temp_dir = temp_dir or tempfile.mkdtemp()
         self.pattern_file = os.path.join(self.temp_dir, "custom_patterns.yml")
         self.backup_file = os.path.join(self.temp_dir, "custom_patterns.backup.yml")
 
     def get_sample_patterns(self) -> List[Dict[str, Any]]:
         """Get sample patterns for demonstration."""
-        return [
-            {
-                "id": "api_key_01",
-                "location": "custom",
-                "category": "token",
-                "description": "Custom API key format",
-                "pattern": r"APIKEY-[A-Z0-9]{32}",
-                "mask": "APIKEY-" + "*" * 32,
-                "examples": {
-                    "match": ["APIKEY-ABC123XYZ789ABC123XYZ789ABC123"],
-                    "nomatch": ["APIKEY-SHORT", "API-KEY-ABC123"],
-                },
-                "policy": {"store_raw": False, "action_on_match": "redact", "severity": "critical"},
-            },
-            {
-                "id": "internal_id_01",
-                "location": "custom",
-                "category": "other",
-                "description": "Internal user ID",
-                "pattern": r"USR-\d{8}",
-                "mask": "USR-********",
-                "policy": {"store_raw": False, "action_on_match": "redact", "severity": "medium"},
-            },
-        ]
+        # Deep copies: callers (and the YAML writers) may modify the result
+        return copy.deepcopy(_SAMPLE_PATTERNS)
 
     def create_pattern_file(self) -> Dict[str, Any]:
         """Create a new pattern file from scratch."""
@@ -78,19 +144,11 @@ class YAMLPatternManager:
 
     def add_pattern(self) -> Dict[str, Any]:
         """Add a new pattern to existing file."""
-        new_pattern = {
-            "id": "session_token_01",
-            "location": "custom",
-            "category": "token",
-            "description": "Session token",
-            "pattern": r"SESSION_[A-F0-9]{40}",
-            "mask": "SESSION_" + "*" * 40,
-            "policy": {"store_raw": False, "action_on_match": "redact", "severity": "high"},
-        }
-
-        PatternFileHandler.add_pattern_to_file(self.pattern_file, new_pattern)
+        # One read and one write for the whole modification
+        with PatternFileHandler.edit(self.pattern_file) as data:
+            data["patterns"].append(copy.deepcopy(_SESSION_TOKEN_PATTERN))
+            pattern_ids = [p.get("id", "unknown") for p in data["patterns"]]
 
-        pattern_ids = PatternFileHandler.list_patterns_in_file(self.pattern_file)
         return {
             "added_pattern": "session_token_01",
             "total_patterns": len(pattern_ids),
@@ -99,28 +157,23 @@ class YAMLPatternManager:
 
     def update_pattern(self, pattern_id: str = "api_key_01") -> Dict[str, Any]:
         """Update an existing pattern."""
-        # Get current pattern
-        current = PatternFileHandler.get_pattern_from_file(self.pattern_file, pattern_id)
-        current_severity = current["policy"]["severity"]
+        with PatternFileHandler.edit(self.pattern_file) as data:
+            current = next((p for p in data["patterns"] if p.get("id") == pattern_id), None)
+            if current is None:
+                return {"success": False, "pattern_id": pattern_id}
 
-        # Update severity
-        success = PatternFileHandler.update_pattern_in_file(
-            file_path=self.pattern_file,
-            pattern_id=pattern_id,
-            updates={"policy": {"severity": "critical", "action_on_match": "tokenize"}},
-        )
+            current_severity = current["policy"]["severity"]
 
-        if success:
-            updated = PatternFileHandler.get_pattern_from_file(self.pattern_file, pattern_id)
-            return {
-                "success": True,
-                "pattern_id": pattern_id,
-                "old_severity": current_severity,
-                "new_severity": updated["policy"]["severity"],
-                "new_action": updated["policy"]["action_on_match"],
-            }
+            # Update severity
+            current.update({"policy": {"severity": "critical", "action_on_match": "tokenize"}})
 
-        return {"success": False, "pattern_id": pattern_id}
+        return {
+            "success": True,
+            "pattern_id": pattern_id,
+            "old_severity": current_severity,
+            "new_severity": current["policy"]["severity"],
+            "new_action": current["policy"]["action_on_match"],
+        }
 
     def query_patterns(self) -> List[Dict[str, Any]]:
         """Query and inspect patterns."""
@@ -143,27 +196,16 @@ class YAMLPatternManager:
 
     def test_with_engine(self) -> Dict[str, Any]:
         """Use custom patterns with detection engine."""
-        # Load custom patterns (skip example validation for demo)
-        registry = load_registry(
-            paths=[self.pattern_file], validate_schema=False, validate_examples=False
-        )
-
-        # Create engine
-        engine = Engine(registry)
-
-        # Test detection
-        test_text = """
-        Here are some sensitive items:
-        - API Key: APIKEY-ABC123XYZ789ABC123XYZ789ABC123
-        - User ID: USR-12345678
-        - Session: SESSION_1A2B3C4D5E6F7A8B9C0D1E2F3A4B5C6D7E8F9A0B
-        """
+        # Load custom patterns (skip example validation for demo); the engine
+        # is reused until the file changes
+        engine = cached_engine([self.pattern_file])
+        registry = engine.registry
 
         # Find PII
-        result = engine.find(test_text, namespaces=["custom"])
+        result = engine.find(_ENGINE_TEST_TEXT, namespaces=["custom"])
 
         # Redact PII
-        redacted = engine.redact(test_text, namespaces=["custom"])
+        redacted = engine.redact(_ENGINE_TEST_TEXT, namespaces=["custom"])
 
         matches_info = []
         for match in result.matches:
@@ -178,7 +220,7 @@ class YAMLPatternManager:
 
         return {
             "registry_size": len(registry),
-            "text_length": len(test_text),
+            "text_length": len(_ENGINE_TEST_TEXT),
             "match_count": result.match_count,
             "namespaces_searched": result.namespaces_searched,
             "matches": matches_info,
@@ -188,17 +230,17 @@ class YAMLPatternManager:
 
     def remove_pattern(self, pattern_id: str = "internal_id_01") -> Dict[str, Any]:
         """Remove a pattern."""
-        success = PatternFileHandler.remove_pattern_from_file(self.pattern_file, pattern_id)
+        with PatternFileHandler.edit(self.pattern_file) as data:
+            remaining = [p for p in data["patterns"] if p.get("id") != pattern_id]
+            if len(remaining) == len(data["patterns"]):
+                return {"success": False, "pattern_id": pattern_id}
+            data["patterns"] = remaining
 
-        if success:
-            pattern_ids = PatternFileHandler.list_patterns_in_file(self.pattern_file)
-            return {
-                "success": True,
-                "removed_pattern": pattern_id,
-                "remaining_patterns": pattern_ids,
-            }
-
-        return {"success": False, "pattern_id": pattern_id}
+        return {
+            "success": True,
+            "removed_pattern": pattern_id,
+            "remaining_patterns": [p.get("id", "unknown") for p in remaining],
+        }
 
     def backup_and_restore(self) -> Dict[str, Any]:
         """Backup and restore pattern files."""
@@ -209,16 +251,9 @@ class YAMLPatternManager:
         write_yaml(self.backup_file, current, overwrite=True)
 
         # Simulate modification
-        temp_pattern = {
-            "id": "temp_pattern_01",
-            "location": "custom",
-            "category": "other",
-            "pattern": "temp",
-            "policy": {"store_raw": False, "action_on_match": "redact", "severity": "low"},
-        }
-
-        PatternFileHandler.add_pattern_to_file(self.pattern_file, temp_pattern)
-        patterns_after_add = PatternFileHandler.list_patterns_in_file(self.pattern_file)
+        with PatternFileHandler.edit(self.pattern_file) as data:
+            data["patterns"].append(copy.deepcopy(_TEMP_PATTERN))
+            patterns_after_add = [p.get("id", "unknown") for p in data["patterns"]]
 
         # Restore from backup
         backup = read_yaml(self.backup_file)
@@ -238,24 +273,41 @@ class YAMLPatternManager:
         cleaned_files = []
 
         for file_path in [self.pattern_file, self.backup_file]:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                cleaned_files.append(file_path)
-
-        # Try to remove temp directory if empty
-        try:
-            os.rmdir(self.temp_dir)
-            cleaned_files.append(self.temp_dir)
-        except OSError:
-            pass  # Directory not empty or doesn't exist
+            # One unlink per file instead of an exists() check followed by remove()
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                continue
+            cleaned_files.append(file_path)
+
+        if self._owns_temp_dir:
+            if os.path.isdir(self.temp_dir):
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
+                cleaned_files.append(self.temp_dir)
+        else:
+            # Caller-provided directory: only remove it if it is now empty
+            try:
+                os.rmdir(self.temp_dir)
+                cleaned_files.append(self.temp_dir)
+            except OSError:
+                pass  # Directory not empty or doesn't exist
 
         return cleaned_files
 
 
-def run_all_examples() -> Dict[str, Any]:
-    """Run all YAML utility examples and return results."""
-    manager = YAMLPatternManager()
-    results = {}
+def run_all_examples(manager: Optional[YAMLPatternManager] = None) -> Dict[str, Any]:
+    """
+    Run all YAML utility examples and return results.
+
+    Args:
+        manager: Optional manager to reuse (and its temporary directory).
+                 A new one is created if not given. It is cleaned up either way.
+
+    Returns:
+        Results of each example step, keyed by step name
+    """
+    manager = manager or YAMLPatternManager()
+    results: Dict[str, Any] = {}
 
     try:
         results["create_file"] = manager.create_pattern_file()
@@ -265,9 +317,8 @@ def run_all_examples() -> Dict[str, Any]:
         results["engine_test"] = manager.test_with_engine()
         results["remove_pattern"] = manager.remove_pattern()
         results["backup_restore"] = manager.backup_and_restore()
-
         return results
-
     finally:
+        # No return here: a return in finally would swallow any exception from
+        # the steps above. The caller sees this entry through the returned dict.
         results["cleanup"] = manager.cleanup()
-        return results
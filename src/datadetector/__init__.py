@@ -5,37 +5,12 @@ This package provides tools for PII detection, validation, and redaction using
 pattern-based matching organized by country and information type.
 """
 
-__version__ = "0.0.2"
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from datadetector import context_presets
-from datadetector.async_engine import AsyncEngine
-from datadetector.bulk_generator import BulkDataGenerator
-from datadetector.context import (
-    ContextFilter,
-    ContextHint,
-    KeywordRegistry,
-    create_context_from_field_name,
-)
+__version__ = "0.0.2"
 
-# Resource scanning (adapters imported directly to avoid requiring optional deps)
-from datadetector.data_explorer import DataExplorer
-from datadetector.data_inventory import DataInventoryGenerator
-from datadetector.data_lineage import DataLineageTracer
 from datadetector.engine import Engine
-from datadetector.fake_file_generators import (
-    ImageGenerator,
-    OfficeFileGenerator,
-    PDFGenerator,
-    XMLGenerator,
-)
-from datadetector.fake_generator import FakeDataGenerator
-from datadetector.mlops import (
-    GateFinding,
-    GateReport,
-    scan_rag_records,
-    scan_text,
-    scan_training_data,
-)
 from datadetector.models import (
     FindResult,
     PrivyscopeConfig,
@@ -44,57 +19,7 @@ from datadetector.models import (
     TransformerConfig,
     ValidationResult,
 )
-from datadetector.nlp import (
-    ChineseTokenizer,
-    KoreanTokenizer,
-    LanguageDetector,
-    NLPConfig,
-    NLPProcessor,
-    PreprocessedText,
-    SmartTokenizer,
-    StopwordFilter,
-)
-from datadetector.privyscope_backend import PrivyscopeDetector
-from datadetector.rag_config import RAGPolicyConfig, load_rag_policy
-from datadetector.rag_middleware import RAGSecurityMiddleware
-from datadetector.rag_models import (
-    SecurityAction,
-    SecurityLayer,
-    SecurityPolicy,
-    SeverityLevel,
-)
-from datadetector.regex_compat import RegexEngine, get_engine, set_engine
 from datadetector.registry import PatternRegistry, load_registry
-from datadetector.resource_adapter import ResourceAdapter
-from datadetector.resource_models import (
-    ConnectionConfig,
-    ContainerInfo,
-    ContainerScanResult,
-    ContainerType,
-    DataInventory,
-    DataResource,
-    FieldInfo,
-    FieldRelationship,
-    FieldScanResult,
-    InventoryDiff,
-    InventoryEntry,
-    InventoryFormat,
-    LineageEdge,
-    LineageGraph,
-    LineageNode,
-    MaskingPolicy,
-    MaskingStrategy,
-    PIIConfidence,
-    RelationshipType,
-    ResourceScanResult,
-    ResourceType,
-    ScanMetadata,
-    ScanStatus,
-    ScanStrategy,
-)
-from datadetector.stream_engine import StreamEngine
-from datadetector.tokenization import SecureTokenizer
-from datadetector.transformer_ner import TransformerNERDetector
 from datadetector.utils.yaml_utils import (
     PatternFileHandler,
     YAMLHandler,
@@ -103,6 +28,176 @@ from datadetector.utils.yaml_utils import (
     write_yaml,
 )
 
+if TYPE_CHECKING:
+    # Lazily imported below; listed here so type checkers and IDEs see them
+    from datadetector import context_presets
+    from datadetector.async_engine import AsyncEngine
+    from datadetector.bulk_generator import BulkDataGenerator
+    from datadetector.context import (
+        ContextFilter,
+        ContextHint,
+        KeywordRegistry,
+        create_context_from_field_name,
+    )
+
+    # Resource scanning (adapters imported directly to avoid requiring optional deps)
+    from datadetector.data_explorer import DataExplorer
+    from datadetector.data_inventory import DataInventoryGenerator
+    from datadetector.data_lineage import DataLineageTracer
+    from datadetector.fake_file_generators import (
+        ImageGenerator,
+        OfficeFileGenerator,
+        PDFGenerator,
+        XMLGenerator,
+    )
+    from datadetector.fake_generator import FakeDataGenerator
+    from datadetector.mlops import (
+        GateFinding,
+        GateReport,
+        scan_rag_records,
+        scan_text,
+        scan_training_data,
+    )
+    from datadetector.nlp import (
+        ChineseTokenizer,
+        KoreanTokenizer,
+        LanguageDetector,
+        NLPConfig,
+        NLPProcessor,
+        PreprocessedText,
+        SmartTokenizer,
+        StopwordFilter,
+    )
+    from datadetector.privyscope_backend import PrivyscopeDetector
+    from datadetector.rag_config import RAGPolicyConfig, load_rag_policy
+    from datadetector.rag_middleware import RAGSecurityMiddleware
+    from datadetector.rag_models import (
+        SecurityAction,
+        SecurityLayer,
+        SecurityPolicy,
+        SeverityLevel,
+    )
+    from datadetector.regex_compat import RegexEngine, get_engine, set_engine
+    from datadetector.resource_adapter import ResourceAdapter
+    from datadetector.resource_models import (
+        ConnectionConfig,
+        ContainerInfo,
+        ContainerScanResult,
+        ContainerType,
+        DataInventory,
+        DataResource,
+        FieldInfo,
+        FieldRelationship,
+        FieldScanResult,
+        InventoryDiff,
+        InventoryEntry,
+        InventoryFormat,
+        LineageEdge,
+        LineageGraph,
+        LineageNode,
+        MaskingPolicy,
+        MaskingStrategy,
+        PIIConfidence,
+        RelationshipType,
+        ResourceScanResult,
+        ResourceType,
+        ScanMetadata,
+        ScanStatus,
+        ScanStrategy,
+    )
+    from datadetector.stream_engine import StreamEngine
+    from datadetector.tokenization import SecureTokenizer
+    from datadetector.transformer_ner import TransformerNERDetector
+
+# Everything else is imported on first attribute access (PEP 562), so that
+# `import datadetector` does not pull in NLP, RAG, file generators, etc.
+_LAZY: Dict[str, str] = {
+    "context_presets": "datadetector.context_presets",
+    "AsyncEngine": "datadetector.async_engine",
+    "BulkDataGenerator": "datadetector.bulk_generator",
+    "ContextFilter": "datadetector.context",
+    "ContextHint": "datadetector.context",
+    "KeywordRegistry": "datadetector.context",
+    "create_context_from_field_name": "datadetector.context",
+    "DataExplorer": "datadetector.data_explorer",
+    "DataInventoryGenerator": "datadetector.data_inventory",
+    "DataLineageTracer": "datadetector.data_lineage",
+    "ImageGenerator": "datadetector.fake_file_generators",
+    "OfficeFileGenerator": "datadetector.fake_file_generators",
+    "PDFGenerator": "datadetector.fake_file_generators",
+    "XMLGenerator": "datadetector.fake_file_generators",
+    "FakeDataGenerator": "datadetector.fake_generator",
+    "GateFinding": "datadetector.mlops",
+    "GateReport": "datadetector.mlops",
+    "scan_rag_records": "datadetector.mlops",
+    "scan_text": "datadetector.mlops",
+    "scan_training_data": "datadetector.mlops",
+    "ChineseTokenizer": "datadetector.nlp",
+    "KoreanTokenizer": "datadetector.nlp",
+    "LanguageDetector": "datadetector.nlp",
+    "NLPConfig": "datadetector.nlp",
+    "NLPProcessor": "datadetector.nlp",
+    "PreprocessedText": "datadetector.nlp",
+    "SmartTokenizer": "datadetector.nlp",
+    "StopwordFilter": "datadetector.nlp",
+    "PrivyscopeDetector": "datadetector.privyscope_backend",
+    "RAGPolicyConfig": "datadetector.rag_config",
+    "load_rag_policy": "datadetector.rag_config",
+    "RAGSecurityMiddleware": "datadetector.rag_middleware",
+    "SecurityAction": "datadetector.rag_models",
+    "SecurityLayer": "datadetector.rag_models",
+    "SecurityPolicy": "datadetector.rag_models",
+    "SeverityLevel": "datadetector.rag_models",
+    "RegexEngine": "datadetector.regex_compat",
+    "get_engine": "datadetector.regex_compat",
+    "set_engine": "datadetector.regex_compat",
+    "ResourceAdapter": "datadetector.resource_adapter",
+    "ConnectionConfig": "datadetector.resource_models",
+    "ContainerInfo": "datadetector.resource_models",
+    "ContainerScanResult": "datadetector.resource_models",
+    "ContainerType": "datadetector.resource_models",
+    "DataInventory": "datadetector.resource_models",
+    "DataResource": "datadetector.resource_models",
+    "FieldInfo": "datadetector.resource_models",
+    "FieldRelationship": "datadetector.resource_models",
+    "FieldScanResult": "datadetector.resource_models",
+    "InventoryDiff": "datadetector.resource_models",
+    "InventoryEntry": "datadetector.resource_models",
+    "InventoryFormat": "datadetector.resource_models",
+    "LineageEdge": "datadetector.resource_models",
+    "LineageGraph": "datadetector.resource_models",
+    "LineageNode": "datadetector.resource_models",
+    "MaskingPolicy": "datadetector.resource_models",
+    "MaskingStrategy": "datadetector.resource_models",
+    "PIIConfidence": "datadetector.resource_models",
+    "RelationshipType": "datadetector.resource_models",
+    "ResourceScanResult": "datadetector.resource_models",
+    "ResourceType": "datadetector.resource_models",
+    "ScanMetadata": "datadetector.resource_models",
+    "ScanStatus": "datadetector.resource_models",
+    "ScanStrategy": "datadetector.resource_models",
+    "StreamEngine": "datadetector.stream_engine",
+    "SecureTokenizer": "datadetector.tokenization",
+    "TransformerNERDetector": "datadetector.transformer_ner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name)
+    # Submodule exports (e.g. context_presets) resolve to the module itself
+    value = module if module_name == f"{__name__}.{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     "Engine",
     "AsyncEngine",
@@ -7,17 +7,105 @@ It validates and scores matches based on surrounding text, using:
 2. ML/LLM Analysis (Future Extension)
 """
 
+import hashlib
+import json
 import logging
+import os
+import re
+from bisect import bisect_left
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 import yaml
 
 from datadetector.heuristic import is_placeholder
-from datadetector.models import Match, ScoringConfig, TransformerConfig
+from datadetector.models import Category, Match, ScoringConfig, TransformerConfig
+from datadetector.utils.yaml_utils import SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Parsed keyword directories are cached as JSON, keyed by file names, mtimes and
+# sizes. DATADETECTOR_CACHE_DIR relocates the cache (default:
+# $XDG_CACHE_HOME/datadetector, or ~/.cache/datadetector); setting
+# DATADETECTOR_NO_CACHE to any non-empty value disables it
+CACHE_DIR_ENV = "DATADETECTOR_CACHE_DIR"
+NO_CACHE_ENV = "DATADETECTOR_NO_CACHE"
+_CONTEXT_CACHE_VERSION = 2
+
+
+def default_context_cache_dir() -> Optional[Path]:
+    """
+    Get the directory for cached keyword files, following the environment.
+
+    Returns:
+        Cache directory, or None if caching is disabled
+    """
+    if os.environ.get(NO_CACHE_ENV):
+        return None
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir:
+        return Path(cache_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "datadetector"
+
+
+# Try to import pyahocorasick for single-pass multi-keyword search
+try:
+    import ahocorasick
+
+    HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    HAS_AHOCORASICK = False
+
+
+def _lower_keep_offsets(text: str) -> str:
+    """
+    Lowercase text without shifting character offsets.
+
+    str.lower() can lengthen the text (e.g. "\u0130" becomes "i\u0307"), which would
+    misalign match offsets with the lowercased copy. Characters whose lowercase
+    form is longer are then kept as-is.
+
+    Args:
+        text: Original text
+
+    Returns:
+        Lowercased text of the same length
+    """
+    text_lower = text.lower()
+    if len(text_lower) == len(text):
+        return text_lower
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+# Country-specific keyword categories that also count as context for addresses
+_ADDRESS_SUBCATEGORIES = ("address_us", "address_kr", "address_jp")
+
+
+def _category_group(category: str) -> FrozenSet[str]:
+    """
+    Get the keyword categories that count as context for a match category.
+
+    Args:
+        category: Match category value
+
+    Returns:
+        The category itself (as-is and lowercased), plus the country-specific
+        address categories for addresses and zip codes
+    """
+    group = {category, category.lower()}
+    if category in ("address", "zipcode"):
+        group.update(_ADDRESS_SUBCATEGORIES)
+    return frozenset(group)
+
+
+# Precomputed for the built-in categories (keys also match their plain values)
+_CATEGORY_GROUPS: Dict[str, FrozenSet[str]] = {
+    category: _category_group(category.value) for category in Category
+}
+
 
 class ContextAnalyzer:
     """
@@ -33,6 +121,8 @@ class ContextAnalyzer:
         context_dir: Optional[Path] = None,
         transformer_config: Optional[TransformerConfig] = None,
         scoring_config: Optional[ScoringConfig] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize ContextAnalyzer.
@@ -42,10 +132,25 @@ class ContextAnalyzer:
                         If None, attempts to locate pii-pattern-engine/keyword.
             transformer_config: Optional Transformer config for ML context classification.
             scoring_config: Optional configuration for detection weights.
+            cache_dir: Directory for the parsed-keyword cache. If None, uses
+                      default_context_cache_dir().
+            use_cache: Whether to read and write the parsed-keyword cache.
         """
+        self._cache_dir: Optional[Path] = None
+        if use_cache:
+            self._cache_dir = (
+                Path(cache_dir) if cache_dir is not None else default_context_cache_dir()
+            )
+
         self.context_map: Dict[str, Set[str]] = {}  # category -> set of context phrases
         self._load_contexts(context_dir)
 
+        # Per category group: merged context phrases and keyword automata
+        # (pyahocorasick) or regexes, built on first use
+        self._merged_cache: Dict[FrozenSet[str], Set[str]] = {}
+        self._automata: Dict[FrozenSet[str], Any] = {}
+        self._keyword_regexes: Dict[FrozenSet[str], Tuple[Any, Dict[str, List[str]]]] = {}
+
         self.scoring_config = scoring_config or ScoringConfig()
 
         # Way 2: ML context classifier (lazy-loaded)
@@ -121,10 +226,17 @@ class ContextAnalyzer:
         # Load all YAML files in the directory
         yaml_files = sorted(context_dir.glob("*.yml")) + sorted(context_dir.glob("*.yaml"))
 
+        cache_path = self._context_cache_path(context_dir, yaml_files)
+        cached = self._read_context_cache(cache_path)
+        if cached is not None:
+            self.context_map = cached
+            logger.info(f"Loaded contexts for {len(self.context_map)} categories (cached)")
+            return
+
         for file_path in yaml_files:
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
+                with open(file_path, "rb") as f:
+                    data = yaml.load(f, Loader=SafeLoader)
                     if not data or "categories" not in data:
                         continue
 
@@ -136,8 +248,71 @@ class ContextAnalyzer:
             except Exception as e:
                 logger.error(f"Failed to load context file {file_path}: {e}")
 
+        self._write_context_cache(cache_path)
         logger.info(f"Loaded contexts for {len(self.context_map)} categories")
 
+    def _context_cache_path(self, context_dir: Path, yaml_files: List[Path]) -> Optional[Path]:
+        """
+        Get the JSON cache file for a keyword directory's current contents.
+
+        Args:
+            context_dir: Keyword directory
+            yaml_files: YAML files found in the directory
+
+        Returns:
+            Cache file path, or None if caching is disabled or the files
+            cannot be stat'ed
+        """
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.sha256(f"{_CONTEXT_CACHE_VERSION}:{context_dir.resolve()}".encode())
+        try:
+            for file_path in yaml_files:
+                st = file_path.stat()
+                digest.update(f"\0{file_path.name}:{st.st_mtime_ns}:{st.st_size}".encode())
+        except OSError:
+            return None
+        return self._cache_dir / f"contexts-{digest.hexdigest()[:16]}.json"
+
+    @staticmethod
+    def _read_context_cache(cache_path: Optional[Path]) -> Optional[Dict[str, Set[str]]]:
+        """Load a cached context map; returns None on a miss or unreadable cache."""
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable context cache {cache_path}: {e}")
+            return None
+
+        # Plain data only: anything other than category -> list of phrases is ignored
+        if not isinstance(data, dict) or not all(
+            isinstance(phrases, list) and all(isinstance(p, str) for p in phrases)
+            for phrases in data.values()
+        ):
+            logger.debug(f"Ignoring malformed context cache {cache_path}")
+            return None
+        return {category: set(phrases) for category, phrases in data.items()}
+
+    def _write_context_cache(self, cache_path: Optional[Path]) -> None:
+        """Save the context map to the cache; failures only cost the next cold start."""
+        if cache_path is None:
+            return
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            data = {category: sorted(phrases) for category, phrases in self.context_map.items()}
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write context cache {cache_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def _add_contexts(self, category: str, contexts: List[str]) -> None:
         """Add context phrases to a category."""
         if category not in self.context_map:
@@ -151,13 +326,19 @@ class ContextAnalyzer:
             if clean_ctx:
                 self.context_map[category].add(clean_ctx)
 
-    def analyze(self, text: str, matches: List[Match]) -> List[Match]:
+    def analyze(
+        self, text: str, matches: List[Match], collect_evidence: bool = True
+    ) -> List[Match]:
         """
         Run the full context analysis pipeline on a list of matches.
 
         Args:
             text: The original text containing the matches
             matches: List of preliminary matches (from Regex+Verification)
+            collect_evidence: Whether to record the context keywords found in
+                              match.context_evidence. Scores are the same either
+                              way; callers that never read the evidence can skip
+                              formatting it.
 
         Returns:
             List of matches with updated scores and evidence
@@ -172,7 +353,7 @@ class ContextAnalyzer:
             for m in matches:
                 val = m.matched_text or text[m.start : m.end]
                 if is_placeholder(val, str(m.category.value)):
-                    logger.debug(f"Filtered out placeholder match: {val} ({m.ns_id})")
+                    logger.debug("Filtered out placeholder match: %s (%s)", val, m.ns_id)
                     continue
                 filtered_matches.append(m)
             matches = filtered_matches
@@ -181,7 +362,7 @@ class ContextAnalyzer:
             return []
 
         # Step 1: Keyword-based Context Check
-        matches = self._keyword_context_check(text, matches)
+        matches = self._keyword_context_check(text, matches, collect_evidence)
 
         # Step 2: ML-based Context Check (Placeholder)
         matches = self._ml_context_check(text, matches)
@@ -192,7 +373,7 @@ class ContextAnalyzer:
         return matches
 
     def _keyword_context_check(
-        self, text: str, matches: List[Match]
+        self, text: str, matches: List[Match], collect_evidence: bool = True
     ) -> List[Match]:
         """
         Check for context keywords surrounding the match with proximity scoring.
@@ -200,82 +381,212 @@ class ContextAnalyzer:
         Args:
             text: Original text
             matches: List of matches
+            collect_evidence: Whether to record the keywords found in
+                              match.context_evidence (scores are updated either way)
         """
+        if not self.context_map:
+            return matches
+
         sc = self.scoring_config
         window_size = sc.keyword_window
-        text_lower = text.lower()
+        text_lower: Optional[str] = None  # lowercased on the first keyword scan
+
+        # Proximity boosts indexed by distance bucket:
+        # < 10 chars: High confidence (e.g., "Zip: 90210"), < 30 chars: far, else weak
+        pre_boosts = (
+            sc.keyword_pre_close_boost,
+            sc.keyword_pre_far_boost,
+            sc.keyword_pre_weak_boost,
+        )
+        post_boosts = (
+            sc.keyword_post_close_boost,
+            sc.keyword_post_far_boost,
+            sc.keyword_post_weak_boost,
+        )
+
+        # Whole-document keyword hits per category group, scanned once and
+        # shared by every match of that group
+        doc_hits: Dict[FrozenSet[str], Tuple[List[int], List[int], List[str]]] = {}
 
         for match in matches:
-            # Determine relevant categories to check
-            # For specific categories like 'address', we also check sub-categories like 'address_us'
-            categories_to_check = {str(match.category.value), str(match.category.value).lower()}
-            if match.category.value == "address":
-                categories_to_check.add("address_us")
-                categories_to_check.add("address_kr")
-                categories_to_check.add("address_jp")
-            elif match.category.value == "zipcode":  # If we add zipcode category
-                categories_to_check.add("address_us")
-                categories_to_check.add("address_kr")
-                categories_to_check.add("address_jp")
+            # Relevant categories to check (e.g. 'address' also checks 'address_us')
+            group = _CATEGORY_GROUPS.get(match.category)
+            if group is None:
+                group = _category_group(str(match.category.value))
 
             # Collect all valid context phrases
-            valid_contexts = set()
-            for cat in categories_to_check:
-                if cat in self.context_map:
-                    valid_contexts.update(self.context_map[cat])
+            valid_contexts = self._merged_cache.get(group)
+            if valid_contexts is None:
+                valid_contexts = set()
+                for cat in group:
+                    if cat in self.context_map:
+                        valid_contexts.update(self.context_map[cat])
+                self._merged_cache[group] = valid_contexts
 
             if not valid_contexts:
                 continue
 
+            hits = doc_hits.get(group)
+            if hits is None:
+                if text_lower is None:
+                    text_lower = _lower_keep_offsets(text)
+                hits = self._scan_text(group, valid_contexts, text_lower)
+                doc_hits[group] = hits
+
+            # No keyword of this group anywhere in the document
+            if not hits[2]:
+                continue
+
             # Define window
             start_idx = max(0, match.start - window_size)
             end_idx = min(len(text), match.end + window_size)
 
-            # Extract window texts
-            pre_window = text_lower[start_idx : match.start]
-            post_window = text_lower[match.end : end_idx]
+            # Distance from each keyword's closest occurrence to the match
+            pre_hits, post_hits = self._hits_near(hits, match.start, match.end, start_idx, end_idx)
 
-            found_evidence = []
-            max_boost = 0.0
+            if not pre_hits and not post_hits:
+                continue
 
-            for ctx in valid_contexts:
-                # Check pre-window (before match)
-                # Find the LAST occurrence to get the one closest to the match
-                pre_pos = pre_window.rfind(ctx)
-                if pre_pos != -1:
-                    distance = len(pre_window) - (pre_pos + len(ctx))
-                    found_evidence.append(f"{ctx} (dist: -{distance})")
-
-                    # Proximity scoring logic
-                    # < 10 chars: High confidence (e.g., "Zip: 90210")
-                    if distance < 10:
-                        max_boost = max(max_boost, sc.keyword_pre_close_boost)
-                    elif distance < 30:
-                        max_boost = max(max_boost, sc.keyword_pre_far_boost)
-                    else:
-                        max_boost = max(max_boost, sc.keyword_pre_weak_boost)
-
-                # Check post-window (after match)
-                # Find the FIRST occurrence
-                post_pos = post_window.find(ctx)
-                if post_pos != -1:
-                    distance = post_pos
-                    found_evidence.append(f"{ctx} (dist: +{distance})")
-
-                    if distance < 10:
-                        max_boost = max(max_boost, sc.keyword_post_close_boost)
-                    elif distance < 30:
-                        max_boost = max(max_boost, sc.keyword_post_far_boost)
-                    else:
-                        max_boost = max(max_boost, sc.keyword_post_weak_boost)
-
-            # Update match if evidence found
-            if found_evidence:
-                match.context_evidence.extend(found_evidence)
-                match.score = min(0.99, match.score + max_boost)
+            max_boost = 0.0
+            for distance in pre_hits.values():
+                max_boost = max(max_boost, pre_boosts[(distance >= 10) + (distance >= 30)])
+            for distance in post_hits.values():
+                max_boost = max(max_boost, post_boosts[(distance >= 10) + (distance >= 30)])
+            match.score = min(0.99, match.score + max_boost)
+
+            if collect_evidence:
+                match.context_evidence.extend(
+                    f"{ctx} (dist: -{distance})" for ctx, distance in pre_hits.items()
+                )
+                match.context_evidence.extend(
+                    f"{ctx} (dist: +{distance})" for ctx, distance in post_hits.items()
+                )
 
         return matches
 
+    def _scan_text(
+        self, group: FrozenSet[str], contexts: Set[str], text_lower: str
+    ) -> Tuple[List[int], List[int], List[str]]:
+        """
+        Find every occurrence of a category group's keywords in the text.
+
+        Uses a pyahocorasick automaton when installed, otherwise a regex scan.
+        Overlapping occurrences (e.g. "mail" inside "email") are all reported.
+
+        Args:
+            group: Category names the keywords belong to (cache key)
+            contexts: Merged context phrases of the group
+            text_lower: Lowercased document text
+
+        Returns:
+            (starts, ends, keywords): parallel lists of start offsets, exclusive
+            end offsets (ascending) and the keyword found there
+        """
+        starts: List[int] = []
+        ends: List[int] = []
+        keywords: List[str] = []
+
+        if HAS_AHOCORASICK:
+            automaton = self._automata.get(group)
+            if automaton is None:
+                automaton = ahocorasick.Automaton()
+                for ctx in contexts:
+                    automaton.add_word(ctx, ctx)
+                automaton.make_automaton()
+                self._automata[group] = automaton
+
+            for end_pos, ctx in automaton.iter(text_lower):
+                starts.append(end_pos + 1 - len(ctx))
+                ends.append(end_pos + 1)
+                keywords.append(ctx)
+            return starts, ends, keywords
+
+        cached = self._keyword_regexes.get(group)
+        if cached is None:
+            cached = self._compile_keywords(contexts)
+            self._keyword_regexes[group] = cached
+        pattern, by_first_char = cached
+
+        # Quick reject: substring tests run in C, the lookahead scan below
+        # visits every offset
+        if not any(first_char in text_lower for first_char in by_first_char):
+            return starts, ends, keywords
+
+        # The lookahead matches (empty) at every offset where some keyword
+        # starts; all keywords starting there are then checked exactly
+        found: List[Tuple[int, str]] = []
+        for m in pattern.finditer(text_lower):
+            pos = m.start()
+            for ctx in by_first_char[text_lower[pos]]:
+                if text_lower.startswith(ctx, pos):
+                    found.append((pos + len(ctx), ctx))
+        found.sort(key=lambda hit: hit[0])
+
+        for end, ctx in found:
+            starts.append(end - len(ctx))
+            ends.append(end)
+            keywords.append(ctx)
+        return starts, ends, keywords
+
+    @staticmethod
+    def _compile_keywords(contexts: Set[str]) -> Tuple["re.Pattern[str]", Dict[str, List[str]]]:
+        """
+        Compile a keyword set into a start-position regex.
+
+        Uses the standard re module: the pattern is an alternation of escaped
+        literals, so it cannot backtrack catastrophically.
+
+        Args:
+            contexts: Context phrases (non-empty, lowercase)
+
+        Returns:
+            (pattern, by_first_char): lookahead alternation of all keywords,
+            and the keywords grouped by their first character
+        """
+        ordered = sorted(contexts, key=len, reverse=True)
+        pattern = re.compile("(?=" + "|".join(re.escape(ctx) for ctx in ordered) + ")")
+        by_first_char: Dict[str, List[str]] = {}
+        for ctx in ordered:
+            by_first_char.setdefault(ctx[0], []).append(ctx)
+        return pattern, by_first_char
+
+    @staticmethod
+    def _hits_near(
+        hits: Tuple[List[int], List[int], List[str]],
+        match_start: int,
+        match_end: int,
+        window_start: int,
+        window_end: int,
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Select the keyword hits lying fully inside the windows around a match.
+
+        Args:
+            hits: Document hits from _scan_text()
+            match_start: Match start offset
+            match_end: Match end offset
+            window_start: Start of the pre-window
+            window_end: End of the post-window
+
+        Returns:
+            (pre_hits, post_hits) mapping each keyword found to the distance
+            between its closest occurrence and the match
+        """
+        starts, ends, keywords = hits
+
+        pre_hits: Dict[str, int] = {}
+        # Ascending end offsets: the last hit per keyword is the closest
+        for i in range(bisect_left(ends, window_start), bisect_left(ends, match_start + 1)):
+            if starts[i] >= window_start:
+                pre_hits[keywords[i]] = match_start - ends[i]
+
+        post_hits: Dict[str, int] = {}
+        for i in range(bisect_left(ends, match_end), bisect_left(ends, window_end + 1)):
+            if starts[i] >= match_end:
+                post_hits.setdefault(keywords[i], starts[i] - match_end)
+
+        return pre_hits, post_hits
+
     def _ml_context_check(self, text: str, matches: List[Match]) -> List[Match]:
         """
         ML-based context analysis using Transformer classifiers.
@@ -1,10 +1,12 @@
 """Asynchronous core detection and redaction engine."""
 
 import asyncio
-import hashlib
 import logging
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
+from datadetector import regex_compat
+from datadetector.engine import _apply_replacements, _resolve_hasher
 from datadetector.models import (
     FindResult,
     Match,
@@ -13,9 +15,13 @@ from datadetector.models import (
     ValidationResult,
 )
 from datadetector.registry import PatternRegistry
+from datadetector.utils.spans import SpanSet
 
 logger = logging.getLogger(__name__)
 
+# Texts handled per executor job by the batch methods
+DEFAULT_BATCH_CHUNK_SIZE = 64
+
 
 class AsyncEngine:
     """
@@ -25,6 +31,9 @@ class AsyncEngine:
     asynchronously, allowing for concurrent processing of multiple texts or
     patterns.
 
+    Work runs on a thread pool owned by the engine. Use the engine as an
+    (async) context manager, or call close() when done, to release it.
+
     Example:
         >>> import asyncio
         >>> from datadetector import load_registry
@@ -32,8 +41,8 @@ class AsyncEngine:
         >>>
         >>> async def main():
         >>>     registry = load_registry()
-        >>>     engine = AsyncEngine(registry)
-        >>>     result = await engine.find("text with PII")
+        >>>     async with AsyncEngine(registry) as engine:
+        >>>         result = await engine.find("text with PII")
         >>>     return result
         >>>
         >>> asyncio.run(main())
@@ -44,6 +53,7 @@ class AsyncEngine:
         registry: PatternRegistry,
         default_mask_char: str = "*",
         hash_algorithm: str = "sha256",
+        max_workers: Optional[int] = None,
     ) -> None:
         """
         Initialize async engine with pattern registry.
@@ -52,11 +62,56 @@ class AsyncEngine:
             registry: PatternRegistry with loaded patterns
             default_mask_char: Default character to use for masking
             hash_algorithm: Hash algorithm for hashing strategy
+            max_workers: Threads in the engine's executor (None uses the
+                         ThreadPoolExecutor default)
         """
         self.registry = registry
         self.default_mask_char = default_mask_char
         self.hash_algorithm = hash_algorithm
 
+        # Pattern matching runs here rather than in the event loop's default
+        # executor, so it does not compete with other blocking work
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="datadetector"
+        )
+
+    def close(self) -> None:
+        """Shut down the engine's executor, waiting for running jobs."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AsyncEngine":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Any,
+        exc_val: Any,
+        exc_tb: Any,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "AsyncEngine":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Any,
+        exc_val: Any,
+        exc_tb: Any,
+    ) -> None:
+        # Wait for running jobs off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    @property
+    def hash_algorithm(self) -> str:
+        """Hash algorithm for hashing strategy."""
+        return self._hash_algorithm
+
+    @hash_algorithm.setter
+    def hash_algorithm(self, algorithm: str) -> None:
+        self._hash_algorithm = algorithm
+        self._hasher_factory = _resolve_hasher(algorithm)
+
     async def find(
         self,
         text: str,
@@ -83,9 +138,9 @@ class AsyncEngine:
             FindResult with all matches
         """
         # Run the CPU-bound pattern matching in an executor to avoid blocking
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None,
+            self._executor,
             self._find_sync,
             text,
             namespaces,
@@ -107,55 +162,109 @@ class AsyncEngine:
             namespaces = list(self.registry.namespaces.keys())
 
         matches: List[Match] = []
+        accepted_spans = SpanSet()  # spans of matches, for the overlap check
 
-        # Collect patterns from requested namespaces
-        patterns = []
-        for ns in namespaces:
-            patterns.extend(self.registry.get_namespace_patterns(ns))
+        # Patterns from requested namespaces in priority groups (lower = higher
+        # priority), each with a union regex covering the whole group
+        groups = self.registry.get_priority_groups(namespaces)
 
-        # Sort patterns by priority (lower = higher priority)
-        patterns.sort(key=lambda p: (p.priority, p.full_id))
+        # Literal prefilter results, shared across patterns for this text
+        prefilter_cache: Dict[FrozenSet[str], bool] = {}
+        text_chars = regex_compat.literal_chars(text)
 
-        # Search for each pattern
-        for pattern in patterns:
-            for regex_match in pattern.compiled.finditer(text):
-                start, end = regex_match.span()
-                matched_value = regex_match.group(0)
-
-                # Apply verification function if specified
-                if pattern.verification_func is not None:
-                    if not pattern.verification_func(matched_value):
-                        logger.debug(
-                            f"Pattern {pattern.full_id} matched but failed "
-                            f"verification: {matched_value}"
-                        )
-                        continue
+        # Verification results per function for this text: the same values
+        # often recur (repeated records, log lines)
+        verify_cache: Dict[Callable[[str], bool], Dict[str, bool]] = {}
 
-                # Check for overlaps if not allowed
-                if not allow_overlaps:
-                    if any(self._spans_overlap((start, end), (m.start, m.end)) for m in matches):
-                        continue
+        # Patterns that may match at all, from one Hyperscan pass (if installed)
+        multi_prefilter = self.registry.get_multi_prefilter(namespaces)
+        candidates = multi_prefilter.candidates(text) if multi_prefilter is not None else None
 
-                # Get matched text if allowed by policy
-                matched_text = None
-                if include_matched_text and pattern.policy.store_raw:
-                    matched_text = matched_value
-
-                match = Match(
-                    ns_id=pattern.full_id,
-                    pattern_id=pattern.id,
-                    namespace=pattern.namespace,
-                    category=pattern.category,
-                    start=start,
-                    end=end,
-                    matched_text=matched_text,
-                    mask=pattern.mask,
-                    severity=pattern.policy.severity,
+        # Search for each pattern
+        for union, group in groups:
+            # Skip the regex scan for patterns Hyperscan ruled out, or when the
+            # text lacks a literal every match needs
+            patterns = [
+                pattern
+                for pattern in group
+                if (candidates is None or pattern.compiled in candidates)
+                and (
+                    not pattern.required_literals
+                    or regex_compat.literals_present(
+                        pattern.required_literals, text, prefilter_cache, text_chars
+                    )
                 )
-                matches.append(match)
+            ]
+            if not patterns:
+                continue
+
+            # One union scan finds the leftmost offset any pattern of the group
+            # matches at: none means the group has no matches at all
+            scan_from = 0
+            if union is not None and len(patterns) > 1:
+                first = union.search(text)
+                if first is None:
+                    continue
+                scan_from = first.start()
+
+            for pattern in patterns:
+                verify = pattern.verification_func
+                if verify is not None:
+                    verified = verify_cache.setdefault(verify, {})
+
+                # Get matched text if allowed by policy
+                store_raw = include_matched_text and pattern.policy.store_raw
+
+                for regex_match in pattern.compiled.finditer(text, scan_from):
+                    start = regex_match.start()
+                    end = regex_match.end()
+
+                    # Check for overlaps if not allowed (before the costlier
+                    # verification, which cannot save an overlapping match)
+                    if not allow_overlaps and accepted_spans.overlaps(start, end):
+                        continue
 
-                # Early termination: stop after first match if requested
-                if stop_on_first_match:
+                    # Apply verification function if specified
+                    if verify is not None:
+                        matched_value = regex_match.group(0)
+                        is_valid = verified.get(matched_value)
+                        if is_valid is None:
+                            is_valid = verified[matched_value] = verify(matched_value)
+                            if not is_valid:
+                                logger.debug(
+                                    "Pattern %s matched but failed verification: %s",
+                                    pattern.full_id,
+                                    matched_value,
+                                )
+                        if not is_valid:
+                            continue
+
+                    if not allow_overlaps:
+                        accepted_spans.add(start, end)
+
+                    matched_text = regex_match.group(0) if store_raw else None
+
+                    # Positional arguments, in Match field order: built once per
+                    # hit, and keyword binding roughly doubles construction cost
+                    match = Match(
+                        pattern.full_id,  # ns_id
+                        pattern.id,  # pattern_id
+                        pattern.namespace,
+                        pattern.category,
+                        start,
+                        end,
+                        matched_text,
+                        pattern.mask,
+                        pattern.policy.severity,
+                    )
+                    matches.append(match)
+
+                    # Early termination: stop after first match if requested
+                    if stop_on_first_match:
+                        break
+
+                # Break pattern loop if stopping on first match and we found one
+                if stop_on_first_match and matches:
                     break
 
             # Break outer loop if stopping on first match and we found one
@@ -178,12 +287,13 @@ class AsyncEngine:
         allow_overlaps: bool = False,
         include_matched_text: bool = False,
         stop_on_first_match: bool = False,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
     ) -> List[FindResult]:
         """
         Asynchronously find PII matches in multiple texts concurrently.
 
-        This method processes multiple texts in parallel, which is more efficient
-        than calling find() sequentially for each text.
+        Texts are split into chunks, and each chunk is searched by one executor
+        job, so short texts do not pay the scheduling overhead one by one.
 
         Args:
             texts: List of texts to search
@@ -191,21 +301,23 @@ class AsyncEngine:
             allow_overlaps: Whether to allow overlapping matches
             include_matched_text: Whether to include matched text in results
             stop_on_first_match: If True, stop searching after finding first match
+            chunk_size: Number of texts searched per executor job
 
         Returns:
             List of FindResult objects, one for each input text
+
+        Raises:
+            ValueError: If chunk_size is not positive
         """
-        tasks = [
-            self.find(
-                text,
-                namespaces=namespaces,
-                allow_overlaps=allow_overlaps,
-                include_matched_text=include_matched_text,
-                stop_on_first_match=stop_on_first_match,
-            )
-            for text in texts
-        ]
-        return await asyncio.gather(*tasks)
+        return await self._run_chunked(
+            self._find_sync,
+            texts,
+            chunk_size,
+            namespaces,
+            allow_overlaps,
+            include_matched_text,
+            stop_on_first_match,
+        )
 
     async def validate(self, text: str, ns_id: str) -> ValidationResult:
         """
@@ -221,8 +333,8 @@ class AsyncEngine:
         Raises:
             ValueError: If pattern not found
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._validate_sync, text, ns_id)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._validate_sync, text, ns_id)
 
     def _validate_sync(self, text: str, ns_id: str) -> ValidationResult:
         """Synchronous implementation of validate (called from executor)."""
@@ -237,7 +349,9 @@ class AsyncEngine:
         if is_valid and pattern.verification_func is not None:
             is_valid = pattern.verification_func(text)
             if not is_valid:
-                logger.debug(f"Pattern {pattern.full_id} matched but failed verification: {text}")
+                logger.debug(
+                    "Pattern %s matched but failed verification: %s", pattern.full_id, text
+                )
 
         match = None
         if is_valid and regex_match:
@@ -304,9 +418,9 @@ class AsyncEngine:
         Returns:
             RedactionResult with redacted text and match information
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None,
+            self._executor,
             self._redact_sync,
             text,
             namespaces,
@@ -343,12 +457,24 @@ class AsyncEngine:
                 redaction_count=0,
             )
 
-        # Build redacted text by replacing matches from end to start
-        redacted = text
-        for match in reversed(find_result.matches):
-            original = text[match.start : match.end]
-            replacement = self._get_replacement(original, match, strategy)
-            redacted = redacted[: match.start] + replacement + redacted[match.end :]
+        # Build redacted text in a single pass over the (position-sorted) matches
+        if strategy == RedactionStrategy.MASK:
+            # Masks depend only on span length, so skip slicing the original value
+            mask_char = self.default_mask_char
+            replacements = [
+                (match.start, match.end, match.mask or mask_char * (match.end - match.start))
+                for match in find_result.matches
+            ]
+        else:
+            replacements = [
+                (
+                    match.start,
+                    match.end,
+                    self._get_replacement(text, match, strategy),
+                )
+                for match in find_result.matches
+            ]
+        redacted = _apply_replacements(text, replacements)
 
         return RedactionResult(
             original_text=text,
@@ -364,46 +490,77 @@ class AsyncEngine:
         namespaces: Optional[List[str]] = None,
         strategy: Optional[RedactionStrategy] = None,
         allow_overlaps: bool = False,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
     ) -> List[RedactionResult]:
         """
         Asynchronously redact PII from multiple texts concurrently.
 
+        Texts are split into chunks, and each chunk is redacted by one executor
+        job.
+
         Args:
             texts: List of texts to redact
             namespaces: List of namespaces to search
             strategy: Redaction strategy (mask/hash/tokenize)
             allow_overlaps: Whether to allow overlapping matches
+            chunk_size: Number of texts redacted per executor job
 
         Returns:
             List of RedactionResult objects, one for each input text
+
+        Raises:
+            ValueError: If chunk_size is not positive
         """
-        tasks = [
-            self.redact(
-                text,
-                namespaces=namespaces,
-                strategy=strategy,
-                allow_overlaps=allow_overlaps,
+        return await self._run_chunked(
+            self._redact_sync, texts, chunk_size, namespaces, strategy, allow_overlaps
+        )
+
+    async def _run_chunked(
+        self,
+        func: Callable[..., Any],
+        texts: Sequence[str],
+        chunk_size: int,
+        *args: Any,
+    ) -> List[Any]:
+        """Run func(text, *args) for every text, one executor job per chunk."""
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        loop = asyncio.get_running_loop()
+        chunk_results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._executor, self._run_chunk, func, texts[i : i + chunk_size], args
+                )
+                for i in range(0, len(texts), chunk_size)
             )
-            for text in texts
-        ]
-        return await asyncio.gather(*tasks)
+        )
+        return [result for chunk in chunk_results for result in chunk]
 
-    def _get_replacement(self, original: str, match: Match, strategy: RedactionStrategy) -> str:
-        """Get replacement text for a match based on strategy."""
+    @staticmethod
+    def _run_chunk(
+        func: Callable[..., Any], chunk: Sequence[str], args: Tuple[Any, ...]
+    ) -> List[Any]:
+        """Synchronously run func over a chunk of texts (called from executor)."""
+        return [func(text, *args) for text in chunk]
+
+    def _get_replacement(self, text: str, match: Match, strategy: RedactionStrategy) -> str:
+        """Get replacement text for a match in text based on strategy."""
+        # Only hashing reads the matched value, so it is sliced there
         if strategy == RedactionStrategy.MASK:
             if match.mask:
                 return match.mask
-            return self.default_mask_char * len(original)
+            return self.default_mask_char * (match.end - match.start)
 
         elif strategy == RedactionStrategy.HASH:
-            hasher = hashlib.new(self.hash_algorithm)
-            hasher.update(original.encode("utf-8"))
-            return f"[HASH:{hasher.hexdigest()[:16]}]"
+            hasher = self._hasher_factory()
+            hasher.update(text[match.start : match.end].encode("utf-8"))
+            return f"[HASH:{hasher.digest()[:8].hex()}]"
 
         elif strategy == RedactionStrategy.TOKENIZE:
             return f"[TOKEN:{match.ns_id}:{match.start}]"
 
-        return self.default_mask_char * len(original)
+        return self.default_mask_char * (match.end - match.start)
 
     @staticmethod
     def _spans_overlap(span1: Tuple[int, int], span2: Tuple[int, int]) -> bool:
@@ -6,16 +6,125 @@ machine learning models or testing at scale.
 """
 
 import csv
+import functools
 import json
 import logging
+import os
 import secrets
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from datadetector.fake_generator import FakeDataGenerator
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for writing datasets when available (C extension, several times
+# faster than the stdlib json module)
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes (indented by 2 spaces if indent)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+# JSONL output is written in batches of about this many bytes, and CSV
+# output through a buffer of this size
+_WRITE_BATCH_BYTES = 1 << 20
+
+
+def _write_jsonl(f: BinaryIO, records: Iterable[Dict[str, Any]]) -> None:
+    """Write records as JSON lines to a binary file, one write() per batch."""
+    batch = bytearray()
+    for record in records:
+        batch += _dumps(record)
+        batch += b"\n"
+        if len(batch) >= _WRITE_BATCH_BYTES:
+            f.write(batch)
+            batch.clear()
+    f.write(batch)
+
+
+# Sentences placing a PII value in generated text
+_NAMED_PII_TEMPLATE = "Their {name} is {value}"
+_PII_TEMPLATES = (
+    "Contact information: {value}",
+    "Please use {value} for identification",
+    _NAMED_PII_TEMPLATE,
+    "You can reach them at {value}",
+    "Use this: {value}",
+    "{value}",  # Sometimes just the value alone
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _split_pattern_id(pattern_id: str) -> Tuple[str, str, str]:
+    """Split a pattern ID into namespace, pattern name, and the name as words."""
+    namespace, pattern_name = pattern_id.split("/")
+    return namespace, pattern_name, pattern_name.replace("_", " ")
+
+
+# Smallest number of records handed to a worker process at once
+_MIN_CHUNK_RECORDS = 100
+
+# Generator owned by each worker process of generate_bulk_labeled_data()
+_worker_generator: Optional["BulkDataGenerator"] = None
+
+
+def _init_bulk_worker(locale: str) -> None:
+    """Create the generator used by a worker process."""
+    global _worker_generator
+    _worker_generator = BulkDataGenerator(FakeDataGenerator(locale=locale))
+    # Forked workers inherit the parent's Faker random state; without an own
+    # seed, unseeded jobs would produce the same texts in every worker
+    _worker_generator.faker.seed_instance(secrets.randbits(64))
+
+
+def _seeded_worker_generator(seed: Optional[int]) -> "BulkDataGenerator":
+    """Return the worker process's generator, reseeded for a new chunk."""
+    generator = _worker_generator
+    if generator is None:
+        raise RuntimeError("Worker process was not initialized")
+    if seed is not None:
+        generator.faker.seed_instance(seed)
+    return generator
+
+
+def _generate_bulk_chunk(
+    seed: Optional[int],
+    count: int,
+    patterns_per_record: Tuple[int, int],
+    include_patterns: Optional[List[str]],
+) -> List[Dict[str, Any]]:
+    """Generate a chunk of labeled records in a worker process."""
+    generator = _seeded_worker_generator(seed)
+    return [
+        generator.generate_labeled_record(
+            include_patterns=include_patterns,
+            num_pii_items=generator._rng.randint(*patterns_per_record),
+        )
+        for _ in range(count)
+    ]
+
+
+def _generate_pairs_chunk(
+    seed: Optional[int], first_id: int, count: int, has_pii: bool
+) -> List[Dict[str, Any]]:
+    """Generate a chunk of positive or negative detection pairs in a worker process."""
+    generator = _seeded_worker_generator(seed)
+    return [generator._detection_pair(first_id + i, has_pii) for i in range(count)]
+
 
 class BulkDataGenerator:
     """Generate bulk training data with pattern metadata.
@@ -43,10 +152,14 @@ class BulkDataGenerator:
             self.gen = FakeDataGenerator(seed=seed)
         else:
             self.gen = faker_generator
+        self.seed = seed
 
         self.faker = self.gen.faker
         # Use cryptographically secure random number generator
         self._rng = secrets.SystemRandom()
+        # Patterns to sample from when none are given; the generator's set of
+        # patterns is fixed once it is created
+        self._available_patterns = tuple(self.gen.supported_patterns())
 
     def generate_labeled_record(
         self,
@@ -65,7 +178,7 @@ class BulkDataGenerator:
         """
         if include_patterns is None:
             # Select random patterns
-            available_patterns = self.gen.supported_patterns()
+            available_patterns = self._available_patterns
             include_patterns = self._rng.sample(
                 available_patterns, min(num_pii_items, len(available_patterns))
             )
@@ -76,27 +189,31 @@ class BulkDataGenerator:
         # Generate context text
         context = self.faker.paragraph(nb_sentences=self._rng.randint(2, 4))
         text_parts.append(context)
+        text_len = len(context)  # length of " ".join(text_parts)
+
+        # Templates for all items come from one draw, read as base-N digits
+        # (N templates), instead of one secure random call per item
+        num_templates = len(_PII_TEMPLATES)
+        template_draw = self._rng.randrange(num_templates ** len(include_patterns))
 
         # Generate PII items with metadata
         for pattern_id in include_patterns:
+            template_draw, template_index = divmod(template_draw, num_templates)
             try:
                 value = self.gen.from_pattern(pattern_id)
 
-                # Create context for this PII item
-                templates = [
-                    f"Contact information: {value}",
-                    f"Please use {value} for identification",
-                    f"Their {pattern_id.split('/')[-1].replace('_', ' ')} is {value}",
-                    f"You can reach them at {value}",
-                    f"Use this: {value}",
-                    value,  # Sometimes just the value alone
-                ]
-
-                text_with_pii = self._rng.choice(templates)
-                text_parts.append(text_with_pii)
-
                 # Extract category from pattern_id
-                namespace, pattern_name = pattern_id.split("/")
+                namespace, pattern_name, name_words = _split_pattern_id(pattern_id)
+
+                # Create context for this PII item, formatting only the chosen template
+                template = _PII_TEMPLATES[template_index]
+                if template is _NAMED_PII_TEMPLATE:
+                    text_with_pii = template.format(value=value, name=name_words)
+                else:
+                    text_with_pii = template.format(value=value)
+                text_parts.append(text_with_pii)
+                start_hint = text_len + 1  # after the joining space
+                text_len = start_hint + len(text_with_pii)
 
                 pii_items.append(
                     {
@@ -104,14 +221,12 @@ class BulkDataGenerator:
                         "namespace": namespace,
                         "pattern_name": pattern_name,
                         "value": value,
-                        "start_hint": (
-                            len(" ".join(text_parts[:-1])) + 1 if len(text_parts) > 1 else 0
-                        ),
+                        "start_hint": start_hint,
                     }
                 )
 
             except Exception as e:
-                logger.warning(f"Failed to generate pattern {pattern_id}: {e}")
+                logger.warning("Failed to generate pattern %s: %s", pattern_id, e)
                 continue
 
         # Combine all text parts
@@ -132,35 +247,143 @@ class BulkDataGenerator:
         num_records: int = 1000,
         patterns_per_record: Tuple[int, int] = (3, 8),
         include_patterns: Optional[List[str]] = None,
+        num_workers: Optional[int] = 1,
     ) -> List[Dict[str, Any]]:
         """
         Generate bulk labeled training data.
 
+        By default records are generated in this process. With more than one
+        worker, large jobs are split into chunks generated by worker
+        processes. Each worker uses its own FakeDataGenerator with the same locale, and each
+        chunk is seeded from the generator's seed (if any) plus its position.
+
         Args:
             num_records: Number of records to generate
             patterns_per_record: (min, max) number of PII items per record
             include_patterns: List of pattern IDs to use (None = use all)
+            num_workers: Worker processes to use (1 = this process only,
+                         None = one per CPU). Jobs too small to split run
+                         in this process.
 
         Returns:
             List of labeled records
         """
+        return list(
+            self._iter_labeled_records(
+                num_records, patterns_per_record, include_patterns, num_workers
+            )
+        )
+
+    def _iter_labeled_records(
+        self,
+        num_records: int,
+        patterns_per_record: Tuple[int, int],
+        include_patterns: Optional[List[str]],
+        num_workers: Optional[int] = 1,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate labeled records one at a time, numbered from 1.
+
+        Records are yielded as soon as they exist, so writers can stream them
+        to disk without holding the whole dataset in memory.
+
+        Args:
+            num_records: Number of records to generate
+            patterns_per_record: (min, max) number of PII items per record
+            include_patterns: List of pattern IDs to use (None = use all)
+            num_workers: Worker processes to use (1 = this process only,
+                         None = one per CPU)
+
+        Yields:
+            Labeled records with their record_id
+        """
         logger.info(f"Generating {num_records} labeled records...")
 
-        records = []
-        for i in range(num_records):
-            num_pii = self._rng.randint(patterns_per_record[0], patterns_per_record[1])
-            record = self.generate_labeled_record(
-                include_patterns=include_patterns,
-                num_pii_items=num_pii,
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        chunk_size = max(_MIN_CHUNK_RECORDS, num_records // (num_workers * 4))
+
+        if num_workers > 1 and num_records > chunk_size:
+            yield from self._iter_in_workers(
+                num_records, patterns_per_record, include_patterns, num_workers, chunk_size
             )
-            record["record_id"] = i + 1
-            records.append(record)
+        else:
+            for i in range(num_records):
+                num_pii = self._rng.randint(patterns_per_record[0], patterns_per_record[1])
+                record = self.generate_labeled_record(
+                    include_patterns=include_patterns,
+                    num_pii_items=num_pii,
+                )
+                record["record_id"] = i + 1
+                yield record
 
-            if (i + 1) % 100 == 0:
-                logger.info(f"  Generated {i + 1}/{num_records} records...")
+                if (i + 1) % 100 == 0:
+                    logger.info("  Generated %d/%d records...", i + 1, num_records)
 
         logger.info(f"✓ Generated {num_records} labeled records")
-        return records
+
+    def _iter_in_workers(
+        self,
+        num_records: int,
+        patterns_per_record: Tuple[int, int],
+        include_patterns: Optional[List[str]],
+        num_workers: int,
+        chunk_size: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """Generate records in chunks across worker processes, keeping their order."""
+        counts = [
+            min(chunk_size, num_records - start) for start in range(0, num_records, chunk_size)
+        ]
+        chunk_args = (
+            (self._chunk_seed(i), count, patterns_per_record, include_patterns)
+            for i, count in enumerate(counts)
+        )
+
+        record_id = 0
+        for chunk in self._map_in_workers(_generate_bulk_chunk, chunk_args, num_workers):
+            for record in chunk:
+                record_id += 1
+                record["record_id"] = record_id
+                yield record
+            logger.info("  Generated %d/%d records...", record_id, num_records)
+
+    def _chunk_seed(self, index: int) -> Optional[int]:
+        """Seed for the worker chunk at an index, derived from the generator's seed."""
+        return None if self.seed is None else self.seed + index + 1
+
+    def _map_in_workers(
+        self,
+        func: Callable[..., List[Dict[str, Any]]],
+        chunk_args: Iterator[Tuple[Any, ...]],
+        num_workers: int,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Run a chunk function in worker processes, yielding results in order.
+
+        Args:
+            func: Module-level function generating one chunk
+            chunk_args: Arguments for each chunk
+            num_workers: Worker processes to use
+
+        Yields:
+            Each chunk's generated items
+        """
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_bulk_worker,
+            initargs=(self.faker.locales[0],),
+        ) as executor:
+            # Keep two chunks per worker in flight: enough to keep workers busy
+            # without piling up finished chunks faster than they are consumed
+            pending = deque(
+                executor.submit(func, *args) for args in islice(chunk_args, num_workers * 2)
+            )
+            while pending:
+                chunk = pending.popleft().result()
+                next_args = next(chunk_args, None)
+                if next_args is not None:
+                    pending.append(executor.submit(func, *next_args))
+                yield chunk
 
     def save_bulk_data_jsonl(
         self,
@@ -185,15 +408,11 @@ class BulkDataGenerator:
         """
         output_path = Path(output_path)
 
-        records = self.generate_bulk_labeled_data(
-            num_records=num_records,
-            patterns_per_record=patterns_per_record,
-            include_patterns=include_patterns,
-        )
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            for record in records:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # Records are written as they are generated, never all held in memory
+        with open(output_path, "wb") as f:
+            _write_jsonl(
+                f, self._iter_labeled_records(num_records, patterns_per_record, include_patterns)
+            )
 
         logger.info(f"✓ Saved {num_records} records to {output_path}")
         logger.info(f"  File size: {output_path.stat().st_size:,} bytes")
@@ -236,8 +455,8 @@ class BulkDataGenerator:
             "records": records,
         }
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(dataset, f, indent=2, ensure_ascii=False)
+        with open(output_path, "wb") as f:
+            f.write(_dumps(dataset, indent=True))
 
         logger.info(f"✓ Saved {num_records} records to {output_path}")
         logger.info(f"  File size: {output_path.stat().st_size:,} bytes")
@@ -260,13 +479,12 @@ class BulkDataGenerator:
         """
         output_path = Path(output_path)
 
-        records = self.generate_bulk_labeled_data(
-            num_records=num_records,
-            patterns_per_record=patterns_per_record,
-            include_patterns=include_patterns,
-        )
+        records = self._iter_labeled_records(num_records, patterns_per_record, include_patterns)
 
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        # Rows are written as records are generated, through a large buffer
+        with open(
+            output_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BATCH_BYTES
+        ) as f:
             writer = csv.writer(f)
 
             # Header
@@ -282,17 +500,17 @@ class BulkDataGenerator:
             )
 
             # Data rows
-            for record in records:
-                writer.writerow(
-                    [
-                        record["record_id"],
-                        record["text"],
-                        record["metadata"]["num_pii_items"],
-                        record["metadata"]["text_length"],
-                        ",".join(record["metadata"]["patterns_used"]),
-                        json.dumps(record["pii_items"]),
-                    ]
+            writer.writerows(
+                (
+                    record["record_id"],
+                    record["text"],
+                    record["metadata"]["num_pii_items"],
+                    record["metadata"]["text_length"],
+                    ",".join(record["metadata"]["patterns_used"]),
+                    _dumps(record["pii_items"]).decode("utf-8"),
                 )
+                for record in records
+            )
 
         logger.info(f"✓ Saved {num_records} records to {output_path}")
         logger.info(f"  File size: {output_path.stat().st_size:,} bytes")
@@ -301,15 +519,21 @@ class BulkDataGenerator:
         self,
         num_pairs: int = 1000,
         positive_ratio: float = 0.7,
+        num_workers: Optional[int] = 1,
     ) -> List[Dict[str, Any]]:
         """
         Generate text pairs for binary classification (has PII / no PII).
 
         Useful for training binary classifiers or testing detection systems.
+        With more than one worker, large jobs are generated in chunks by
+        worker processes, as in generate_bulk_labeled_data().
 
         Args:
             num_pairs: Number of pairs to generate
             positive_ratio: Ratio of positive (has PII) examples
+            num_workers: Worker processes to use (1 = this process only,
+                         None = one per CPU). Jobs too small to split run
+                         in this process.
 
         Returns:
             List of dicts with 'text', 'has_pii', 'label' (0/1)
@@ -319,39 +543,30 @@ class BulkDataGenerator:
         num_positive = int(num_pairs * positive_ratio)
         num_negative = num_pairs - num_positive
 
-        pairs = []
-
-        # Generate positive examples (with PII)
-        for i in range(num_positive):
-            record = self.generate_labeled_record(num_pii_items=self._rng.randint(1, 5))
-            pairs.append(
-                {
-                    "pair_id": i + 1,
-                    "text": record["text"],
-                    "has_pii": True,
-                    "label": 1,
-                    "pii_count": len(record["pii_items"]),
-                    "patterns": [item["pattern_id"] for item in record["pii_items"]],
-                }
-            )
-
-        # Generate negative examples (no PII)
-        for i in range(num_negative):
-            text = " ".join(
-                [
-                    self.faker.paragraph(nb_sentences=self._rng.randint(2, 5))
-                    for _ in range(self._rng.randint(1, 3))
-                ]
-            )
-            pairs.append(
-                {
-                    "pair_id": num_positive + i + 1,
-                    "text": text,
-                    "has_pii": False,
-                    "label": 0,
-                    "pii_count": 0,
-                    "patterns": [],
-                }
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        chunk_size = max(_MIN_CHUNK_RECORDS, num_pairs // (num_workers * 4))
+
+        if num_workers > 1 and num_pairs > chunk_size:
+            # (first pair_id, count, has_pii) per chunk: positives, then negatives
+            chunks = [
+                (first_id, min(chunk_size, end + 1 - first_id), has_pii)
+                for start, end, has_pii in (
+                    (1, num_positive, True),
+                    (num_positive + 1, num_pairs, False),
+                )
+                for first_id in range(start, end + 1, chunk_size)
+            ]
+            chunk_args = ((self._chunk_seed(i), *chunk) for i, chunk in enumerate(chunks))
+            pairs = [
+                pair
+                for chunk in self._map_in_workers(_generate_pairs_chunk, chunk_args, num_workers)
+                for pair in chunk
+            ]
+        else:
+            pairs = [self._detection_pair(i + 1, True) for i in range(num_positive)]
+            pairs.extend(
+                self._detection_pair(num_positive + i + 1, False) for i in range(num_negative)
             )
 
         # Shuffle pairs
@@ -362,6 +577,39 @@ class BulkDataGenerator:
         )
         return pairs
 
+    def _detection_pair(self, pair_id: int, has_pii: bool) -> Dict[str, Any]:
+        """
+        Generate one positive (with PII) or negative (no PII) detection pair.
+
+        Args:
+            pair_id: Identifier of the pair
+            has_pii: Whether the text contains PII
+
+        Returns:
+            Dict with 'pair_id', 'text', 'has_pii', 'label', 'pii_count', 'patterns'
+        """
+        if has_pii:
+            record = self.generate_labeled_record(num_pii_items=self._rng.randint(1, 5))
+            return {
+                "pair_id": pair_id,
+                "text": record["text"],
+                "has_pii": True,
+                "label": 1,
+                "pii_count": len(record["pii_items"]),
+                "patterns": [item["pattern_id"] for item in record["pii_items"]],
+            }
+
+        # One paragraph with the sentences of 1-3 paragraphs of 2-5 sentences each
+        num_sentences = sum(self._rng.randint(2, 5) for _ in range(self._rng.randint(1, 3)))
+        return {
+            "pair_id": pair_id,
+            "text": self.faker.paragraph(nb_sentences=num_sentences),
+            "has_pii": False,
+            "label": 0,
+            "pii_count": 0,
+            "patterns": [],
+        }
+
     def save_detection_pairs(
         self,
         output_path: Union[str, Path],
@@ -382,14 +630,16 @@ class BulkDataGenerator:
         pairs = self.generate_detection_pairs(num_pairs, positive_ratio)
 
         if format == "jsonl":
-            with open(output_path, "w", encoding="utf-8") as f:
-                for pair in pairs:
-                    f.write(json.dumps(pair, ensure_ascii=False) + "\n")
+            with open(output_path, "wb") as f:
+                _write_jsonl(f, pairs)
         elif format == "json":
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(pairs, f, indent=2, ensure_ascii=False)
+            with open(output_path, "wb") as f:
+                f.write(_dumps(pairs, indent=True))
         elif format == "csv":
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
+            # Rows are small, so write them through a large buffer
+            with open(
+                output_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BATCH_BYTES
+            ) as f:
                 fieldnames = ["pair_id", "text", "has_pii", "label", "pii_count", "patterns"]
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
@@ -414,12 +664,9 @@ class BulkDataGenerator:
             Dictionary with dataset statistics
         """
         total_pii = sum(r["metadata"]["num_pii_items"] for r in records)
-        pattern_counts: Dict[str, int] = {}
-
-        for record in records:
-            for pii_item in record["pii_items"]:
-                pattern_id = pii_item["pattern_id"]
-                pattern_counts[pattern_id] = pattern_counts.get(pattern_id, 0) + 1
+        pattern_counts = Counter(
+            pii_item["pattern_id"] for record in records for pii_item in record["pii_items"]
+        )
 
         return {
             "total_records": len(records),
@@ -428,6 +675,6 @@ class BulkDataGenerator:
             "avg_text_length": (
                 sum(r["metadata"]["text_length"] for r in records) / len(records) if records else 0
             ),
-            "pattern_distribution": pattern_counts,
+            "pattern_distribution": dict(pattern_counts),
             "unique_patterns_used": len(pattern_counts),
         }
@@ -19,7 +19,8 @@ Available Presets:
     - General: PII_ALL, PII_CRITICAL_ONLY
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 
 from datadetector.context import ContextHint
 
@@ -431,29 +432,8 @@ DOCUMENT_PRESETS = {
 }
 """Dictionary of document scanning presets for easy lookup."""
 
-# ==============================================================================
-# HELPER FUNCTIONS
-# ==============================================================================
-
-
-def get_preset(name: str) -> ContextHint:
-    """Get a preset by name.
-
-    Args:
-        name: Preset name (e.g., 'database.ssn', 'korean.rrn', 'contact')
-
-    Returns:
-        ContextHint preset
-
-    Raises:
-        ValueError: If preset not found
-
-    Examples:
-        >>> preset = get_preset('database.ssn')
-        >>> preset = get_preset('korean.rrn')
-        >>> preset = get_preset('contact')
-    """
-    all_presets = {
+_ALL_PRESETS: Mapping[str, ContextHint] = MappingProxyType(
+    {
         # Database
         "database.ssn": DATABASE_SSN,
         "database.email": DATABASE_EMAIL,
@@ -487,13 +467,37 @@ def get_preset(name: str) -> ContextHint:
         "document.medical": DOCUMENT_MEDICAL,
         "document.financial": DOCUMENT_FINANCIAL,
     }
+)
+"""Read-only lookup of every preset by its get_preset() name."""
 
-    if name not in all_presets:
-        raise ValueError(
-            f"Preset '{name}' not found. Available presets: {', '.join(all_presets.keys())}"
-        )
+# ==============================================================================
+# HELPER FUNCTIONS
+# ==============================================================================
+
+
+def get_preset(name: str) -> ContextHint:
+    """Get a preset by name.
+
+    Args:
+        name: Preset name (e.g., 'database.ssn', 'korean.rrn', 'contact')
 
-    return all_presets[name]
+    Returns:
+        ContextHint preset
+
+    Raises:
+        ValueError: If preset not found
+
+    Examples:
+        >>> preset = get_preset('database.ssn')
+        >>> preset = get_preset('korean.rrn')
+        >>> preset = get_preset('contact')
+    """
+    try:
+        return _ALL_PRESETS[name]
+    except KeyError:
+        raise ValueError(
+            f"Preset '{name}' not found. Available presets: {', '.join(_ALL_PRESETS.keys())}"
+        ) from None
 
 
 def list_presets() -> Dict[str, List[str]]:
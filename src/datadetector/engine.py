@@ -1,17 +1,35 @@
 """Core detection and redaction engine."""
 
+import functools
 import hashlib
 import logging
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 if TYPE_CHECKING:
-    from datadetector.fake_generator import FakeDataGenerator
+    from datadetector.fake_generator import FakeValuePool
 
+from datadetector import regex_compat
 from datadetector.analysis import ContextAnalyzer
 from datadetector.context import ContextFilter, ContextHint, KeywordRegistry
 from datadetector.models import (
     FindResult,
     Match,
+    Pattern,
     PrivyscopeConfig,
     RedactionResult,
     RedactionStrategy,
@@ -21,28 +39,140 @@ from datadetector.models import (
 )
 from datadetector.nlp import NLPConfig, NLPProcessor
 from datadetector.registry import PatternRegistry
+from datadetector.utils.spans import SpanSet
 
 logger = logging.getLogger(__name__)
 
+# Try to import blake3 for the optional "blake3" hash algorithm
+try:
+    import blake3
+
+    HAS_BLAKE3 = True
+except ImportError:
+    blake3 = None
+    HAS_BLAKE3 = False
+
+# Number of (namespaces, context hint) pattern selections find() memoizes
+_CONTEXT_PATTERN_CACHE_SIZE = 256
+
+# Smallest priority group and text find() spreads over the scan pool; below
+# these, handing scans to threads costs more than it saves
+_PARALLEL_SCAN_MIN_PATTERNS = 8
+_PARALLEL_SCAN_MIN_LENGTH = 4096
+
 # Lazy import for fake data generator to avoid circular dependencies
-_fake_generator: Optional[Union["FakeDataGenerator", bool]] = None
+_fake_pool: Optional[Union["FakeValuePool", bool]] = None
 
 
-def _get_fake_generator() -> Optional["FakeDataGenerator"]:
-    """Get or create fake data generator instance."""
-    global _fake_generator
-    if _fake_generator is None:
+def _get_fake_pool() -> Optional["FakeValuePool"]:
+    """Get or create the shared fake value pool."""
+    global _fake_pool
+    if _fake_pool is None:
         try:
-            from datadetector.fake_generator import FakeDataGenerator
+            from datadetector.fake_generator import FakeDataGenerator, FakeValuePool
 
-            _fake_generator = FakeDataGenerator()
+            _fake_pool = FakeValuePool(FakeDataGenerator())
         except ImportError:
             logger.warning(
                 "FakeDataGenerator not available. Install faker package "
                 "to use FAKE redaction strategy."
             )
-            _fake_generator = False
-    return _fake_generator if _fake_generator is not False else None  # type: ignore[return-value]
+            _fake_pool = False
+    return _fake_pool if _fake_pool is not False else None  # type: ignore[return-value]
+
+
+def _resolve_hasher(algorithm: str) -> Callable[[], Any]:
+    """
+    Resolve a hash algorithm name to a hasher constructor.
+
+    Guaranteed hashlib algorithms resolve to their named constructor, which
+    skips hashlib.new()'s per-call name lookup. "blake3" needs the optional
+    blake3 package (pip install data-detector[blake3]).
+
+    Args:
+        algorithm: hashlib algorithm name, or "blake3"
+
+    Returns:
+        Zero-argument callable returning a new hasher
+
+    Raises:
+        ValueError: If "blake3" is requested but not installed
+    """
+    if algorithm == "blake3":
+        if not HAS_BLAKE3:
+            raise ValueError(
+                "blake3 hash algorithm requested but not available. "
+                "Install it with: pip install blake3"
+            )
+        return blake3.blake3
+    if algorithm in hashlib.algorithms_guaranteed:
+        return getattr(hashlib, algorithm)
+    return functools.partial(hashlib.new, algorithm)
+
+
+def _scan_target(
+    pattern: Pattern, text: str, buffer: Optional[bytes]
+) -> Tuple[Any, Union[str, bytes]]:
+    """
+    Pick the regex a pattern scans with and the subject it scans.
+
+    Args:
+        pattern: Pattern about to be scanned
+        text: Text being searched
+        buffer: regex_compat.ascii_buffer(text)
+
+    Returns:
+        (pattern.compiled_bytes, buffer) if both exist, else (pattern.compiled, text)
+    """
+    if buffer is not None and pattern.compiled_bytes is not None:
+        return pattern.compiled_bytes, buffer
+    return pattern.compiled, text
+
+
+def _matches_after(compiled: Any, text: Union[str, bytes], pos: int, first: Any) -> Iterator[Any]:
+    """
+    Yield a pattern's first match, then the rest of its matches from pos.
+
+    Lets find() take the first match with one search() call and only start
+    a finditer() scan if that match is rejected.
+
+    Args:
+        compiled: Compiled pattern (str or bytes mode, matching text)
+        text: Text being searched, or its ASCII buffer
+        pos: Offset the scan started at
+        first: compiled.search(text, pos), which finditer() also yields first
+    """
+    yield first
+    yield from islice(compiled.finditer(text, pos), 1, None)
+
+
+def _apply_replacements(text: str, replacements: List[Tuple[int, int, str]]) -> str:
+    """
+    Splice replacement strings into text.
+
+    Args:
+        text: Original text
+        replacements: (start, end, replacement) tuples sorted by position,
+                      with spans referring to the original text
+
+    Returns:
+        Text with every span replaced
+    """
+    parts: List[str] = []
+    prev_end = 0
+    for start, end, replacement in replacements:
+        if start < prev_end:
+            # Overlapping spans (allow_overlaps=True): splice from the end so
+            # positions stay valid, as each span refers to the original text
+            result = text
+            for o_start, o_end, o_replacement in reversed(replacements):
+                result = result[:o_start] + o_replacement + result[o_end:]
+            return result
+        parts.append(text[prev_end:start])
+        parts.append(replacement)
+        prev_end = end
+    parts.append(text[prev_end:])
+    return "".join(parts)
 
 
 class Engine:
@@ -50,6 +180,9 @@ class Engine:
     Core engine for PII detection, validation, and redaction.
 
     The engine uses a PatternRegistry to perform pattern matching operations.
+    With scan_workers set it owns a thread pool; use it as a context manager
+    (``with Engine(registry, scan_workers=4) as engine:``) or call close() to
+    release the threads.
     """
 
     def __init__(
@@ -63,6 +196,8 @@ class Engine:
         transformer_config: Optional[TransformerConfig] = None,
         scoring_config: Optional[ScoringConfig] = None,
         privyscope_config: Optional[PrivyscopeConfig] = None,
+        detection_cache_size: int = 0,
+        scan_workers: int = 0,
     ) -> None:
         """
         Initialize engine with pattern registry.
@@ -70,7 +205,8 @@ class Engine:
         Args:
             registry: PatternRegistry with loaded patterns
             default_mask_char: Default character to use for masking
-            hash_algorithm: Hash algorithm for hashing strategy
+            hash_algorithm: Hash algorithm for hashing strategy (any hashlib
+                          algorithm, or "blake3" with the blake3 extra)
             keyword_registry: Optional keyword registry for context filtering.
                             If None and enable_context_filtering=True, creates default.
             enable_context_filtering: Whether to enable context-aware filtering.
@@ -87,6 +223,18 @@ class Engine:
                           two are alternatives, never both). Requires the pii-engine
                           submodule plus a language pack:
                           pip install -e pii-engine && pip install privyscope-ko
+            detection_cache_size: Number of find() and validate() results to memoize
+                          (LRU). Repeated calls on the same text (e.g. redacting one
+                          document with several strategies, or validating recurring
+                          tokens) then skip detection. Cached matches are shared
+                          between calls, and the cache is dropped whenever the
+                          registry version changes. 0 disables caching.
+            scan_workers: Threads that run the patterns of a priority group over
+                          large texts (4096+ characters) concurrently. Only RE2
+                          releases the GIL while matching, so this helps with the
+                          RE2 backend and just adds overhead with re or PCRE2.
+                          0 scans sequentially. Call close(), or use the
+                          engine as a context manager, when done.
         """
         self.registry = registry
         self.default_mask_char = default_mask_char
@@ -121,6 +269,148 @@ class Engine:
         self.privyscope_config = privyscope_config
         self._ner_detector: Any = None  # None=not loaded, False=failed
 
+        # Memoized find() results, keyed by text and search options, and
+        # validate() results, keyed by (ns_id, text)
+        self.detection_cache_size = detection_cache_size
+        self._detection_cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+        self._detection_cache_version = registry.version
+        self._detection_cache_lock = threading.Lock()
+
+        # Pattern IDs selected by context hints, keyed by namespaces and hint
+        self._context_pattern_ids: Dict[Tuple[Any, ...], FrozenSet[str]] = {}
+        self._context_pattern_ids_version = registry.version
+
+        # Threads for concurrent pattern scans of large texts
+        self._scan_pool: Optional[ThreadPoolExecutor] = None
+        if scan_workers > 0:
+            self._scan_pool = ThreadPoolExecutor(
+                max_workers=scan_workers, thread_name_prefix="datadetector-scan"
+            )
+
+    def close(self) -> None:
+        """Shut down the scan pool (if any), waiting for running scans."""
+        if self._scan_pool is not None:
+            self._scan_pool.shutdown(wait=True)
+
+    def __enter__(self) -> "Engine":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Any,
+        exc_val: Any,
+        exc_tb: Any,
+    ) -> None:
+        self.close()
+
+    @property
+    def hash_algorithm(self) -> str:
+        """Hash algorithm for hashing strategy."""
+        return self._hash_algorithm
+
+    @hash_algorithm.setter
+    def hash_algorithm(self, algorithm: str) -> None:
+        self._hash_algorithm = algorithm
+        self._hasher_factory = _resolve_hasher(algorithm)
+
+    def clear_detection_cache(self) -> None:
+        """Drop all memoized find() and validate() results."""
+        with self._detection_cache_lock:
+            self._detection_cache.clear()
+            self._detection_cache_version = self.registry.version
+
+    def _cached_result(self, key: Tuple[Any, ...]) -> Any:
+        """Look up a memoized result, invalidating on registry changes."""
+        with self._detection_cache_lock:
+            if self._detection_cache_version != self.registry.version:
+                self._detection_cache.clear()
+                self._detection_cache_version = self.registry.version
+                return None
+            result = self._detection_cache.get(key)
+            if result is not None:
+                self._detection_cache.move_to_end(key)
+            return result
+
+    def _store_result(self, key: Tuple[Any, ...], result: Any) -> None:
+        """Memoize a find() or validate() result, evicting the least recently used entry."""
+        with self._detection_cache_lock:
+            if self._detection_cache_version != self.registry.version:
+                return
+            self._detection_cache[key] = result
+            if len(self._detection_cache) > self.detection_cache_size:
+                self._detection_cache.popitem(last=False)
+
+    def _select_context_patterns(
+        self,
+        namespaces: List[str],
+        groups: List[Tuple[Any, List[Pattern]]],
+        context: ContextHint,
+        context_filter: ContextFilter,
+    ) -> FrozenSet[str]:
+        """Get the IDs of the patterns a context hint selects, memoized per hint."""
+        if self._context_pattern_ids_version != self.registry.version:
+            self._context_pattern_ids = {}
+            self._context_pattern_ids_version = self.registry.version
+
+        key = (tuple(namespaces), context.cache_key())
+        selected = self._context_pattern_ids.get(key)
+        if selected is None:
+            all_pattern_ids = [p.full_id for _, group in groups for p in group]
+            selected = frozenset(context_filter.filter_patterns(context, all_pattern_ids))
+            logger.debug(
+                "Context filtering: %d -> %d patterns (keywords=%s, categories=%s)",
+                len(all_pattern_ids),
+                len(selected),
+                context.keywords,
+                context.categories,
+            )
+            if len(self._context_pattern_ids) >= _CONTEXT_PATTERN_CACHE_SIZE:
+                self._context_pattern_ids.clear()
+            self._context_pattern_ids[key] = selected
+        return selected
+
+    def bind_presets(self, namespaces: Optional[List[str]] = None) -> int:
+        """
+        Precompute the pattern selections of the built-in context presets.
+
+        find() memoizes the patterns each context hint selects, so only the
+        first call with a given preset runs keyword and category filtering.
+        Binding does that work up front (e.g. at service startup) for every
+        preset in context_presets. Selections are dropped when the registry
+        changes, so bind again after adding patterns.
+
+        Args:
+            namespaces: Namespaces the presets will be searched with, as passed
+                       to find(). If None, all namespaces.
+
+        Returns:
+            Number of presets bound (0 if context filtering is disabled)
+        """
+        if not (self.enable_context_filtering and self.context_filter):
+            return 0
+
+        from datadetector import context_presets
+
+        if namespaces is None:
+            namespaces = list(self.registry.namespaces.keys())
+        groups = self.registry.get_priority_groups(namespaces)
+
+        hints = [
+            hint
+            for presets in (
+                context_presets.DATABASE_PRESETS,
+                context_presets.KOREAN_PRESETS,
+                context_presets.CATEGORY_PRESETS,
+                context_presets.COMPREHENSIVE_PRESETS,
+                context_presets.API_PRESETS,
+                context_presets.DOCUMENT_PRESETS,
+            )
+            for hint in presets.values()
+        ]
+        for hint in hints:
+            self._select_context_patterns(namespaces, groups, hint, self.context_filter)
+        return len(hints)
+
     def _get_ner_detector(self) -> Any:
         """Lazy-load the NER detector. Returns None if unavailable.
 
@@ -185,10 +475,31 @@ class Engine:
         Returns:
             FindResult with all matches
         """
+        # Only context-free calls are memoized; with a hint, the pattern
+        # selection is memoized per ContextHint.cache_key() instead (see
+        # _select_context_patterns) and the text is scanned every time
+        cache_key: Optional[Tuple[Any, ...]] = None
+        if self.detection_cache_size > 0 and context is None:
+            cache_key = (
+                text,
+                tuple(namespaces) if namespaces is not None else None,
+                allow_overlaps,
+                include_matched_text,
+                stop_on_first_match,
+            )
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return FindResult(
+                    text=text,
+                    matches=list(cached.matches),
+                    namespaces_searched=list(cached.namespaces_searched),
+                )
+
         if namespaces is None:
             namespaces = list(self.registry.namespaces.keys())
 
         matches: List[Match] = []
+        accepted_spans = SpanSet()  # spans of matches, for the overlap check
 
         # Apply NLP preprocessing if enabled
         search_text = text
@@ -197,132 +508,188 @@ class Engine:
             preprocessed = self.nlp_processor.preprocess(text)
             search_text = preprocessed.processed_text
             logger.debug(
-                f"NLP preprocessing: lang={preprocessed.detected_language}, "
-                f"tokens={len(preprocessed.tokens) if preprocessed.tokens else 'N/A'}"
+                "NLP preprocessing: lang=%s, tokens=%s",
+                preprocessed.detected_language,
+                len(preprocessed.tokens) if preprocessed.tokens else "N/A",
             )
 
-        # Collect patterns from requested namespaces
-        patterns = []
-        for ns in namespaces:
-            patterns.extend(self.registry.get_namespace_patterns(ns))
+        # Patterns from requested namespaces in priority groups (lower = higher
+        # priority). This ensures high-priority patterns are checked first. When
+        # allow_overlaps=False, higher-priority matches will take precedence at
+        # overlapping positions, saving redundant regex checks. Each group comes
+        # with a union regex covering all of its patterns.
+        groups = self.registry.get_priority_groups(namespaces)
 
         # Apply context filtering if enabled and context provided
+        allowed_ids: Optional[FrozenSet[str]] = None
         if context is not None and self.enable_context_filtering and self.context_filter:
-            # Get pattern IDs before filtering
-            all_pattern_ids = [p.full_id for p in patterns]
-
-            # Filter pattern IDs based on context
-            filtered_pattern_ids = self.context_filter.filter_patterns(context, all_pattern_ids)
-
-            # Keep only filtered patterns
-            patterns = [p for p in patterns if p.full_id in filtered_pattern_ids]
-
-            logger.debug(
-                f"Context filtering: {len(all_pattern_ids)} -> {len(patterns)} patterns "
-                f"(keywords={context.keywords}, categories={context.categories})"
+            allowed_ids = self._select_context_patterns(
+                namespaces, groups, context, self.context_filter
             )
 
-        # Sort patterns by priority (lower = higher priority)
-        # This ensures high-priority patterns are checked first.
-        # When allow_overlaps=False, higher-priority matches will take precedence
-        # at overlapping positions, saving redundant regex checks.
-        patterns.sort(key=lambda p: (p.priority, p.full_id))
+        # Literal prefilter results, shared across patterns for this text
+        prefilter_cache: Dict[FrozenSet[str], bool] = {}
+        text_chars = regex_compat.literal_chars(search_text)
 
-        # Search for each pattern
-        for pattern in patterns:
-            for regex_match in pattern.compiled.finditer(search_text):
-                start, end = regex_match.span()
-                matched_value = regex_match.group(0)
-
-                # For exactly_matches patterns, enforce token boundaries:
-                # the match must not be embedded in a larger alphanumeric token,
-                # and must not be a plain alphabetic word (to avoid false positives
-                # from broad patterns like generic passport matching "Contact")
-                if pattern.match_type == "exactly_matches":
-                    if start > 0 and search_text[start - 1].isalnum():
-                        continue
-                    if end < len(search_text) and search_text[end].isalnum():
-                        continue
-                    if matched_value.isascii() and matched_value.isalpha():
-                        continue
+        # Patterns that may match at all, from one Hyperscan pass (if installed)
+        multi_prefilter = self.registry.get_multi_prefilter(namespaces)
+        candidates = (
+            multi_prefilter.candidates(search_text) if multi_prefilter is not None else None
+        )
 
-                # Map back to original positions if NLP preprocessing was used
-                if preprocessed:
-                    start, end = preprocessed.map_to_original(start, end)
-                    matched_value = text[start:end]
-
-                # Apply verification function if specified
-                has_verification = pattern.verification_func is not None
-                passed_verification = False
-                if has_verification:
-                    if not pattern.verification_func(matched_value):
-                        logger.debug(
-                            f"Pattern {pattern.full_id} matched but failed "
-                            f"verification: {matched_value}"
-                        )
-                        continue
-                    passed_verification = True
+        # ASCII texts are encoded once and scanned as bytes by every pattern
+        # with a bytes-mode copy; spans are the same in both modes
+        search_buffer = regex_compat.ascii_buffer(search_text)
 
-                # Check for overlaps if not allowed
-                if not allow_overlaps:
-                    if any(self._spans_overlap((start, end), (m.start, m.end)) for m in matches):
-                        # Since patterns are sorted by priority, we already have
-                        # the best match for this span.
-                        continue
+        search_len = len(search_text)
+        initial_verified = self.scoring.initial_verified
+        initial_unverified = self.scoring.initial_unverified
 
-                # Get matched text if allowed by policy
-                matched_text = None
-                if include_matched_text and pattern.policy.store_raw:
-                    matched_text = matched_value
-
-                # Verified matches start at higher confidence
-                initial_score = (
-                    self.scoring.initial_verified if passed_verification
-                    else self.scoring.initial_unverified
+        # Search for each pattern
+        for union, group in groups:
+            # Skip the regex scan for patterns filtered out by context or ruled
+            # out by Hyperscan, or when the text lacks a literal every match needs
+            patterns = [
+                pattern
+                for pattern in group
+                if (allowed_ids is None or pattern.full_id in allowed_ids)
+                and (candidates is None or pattern.compiled in candidates)
+                and (
+                    not pattern.required_literals
+                    or regex_compat.literals_present(
+                        pattern.required_literals, search_text, prefilter_cache, text_chars
+                    )
                 )
-
-                match = Match(
-                    ns_id=pattern.full_id,
-                    pattern_id=pattern.id,
-                    namespace=pattern.namespace,
-                    category=pattern.category,
-                    start=start,
-                    end=end,
-                    matched_text=matched_text,
-                    mask=pattern.mask,
-                    severity=pattern.policy.severity,
-                    score=initial_score,
-                    verified=passed_verification,
+            ]
+            if not patterns:
+                continue
+
+            # One union scan finds the leftmost offset any pattern of the group
+            # matches at: none means the group has no matches at all
+            scan_from = 0
+            if union is not None and len(patterns) > 1:
+                first = union.search(search_text)
+                if first is None:
+                    continue
+                scan_from = first.start()
+
+            # Run the group's regex scans on the pool for large texts; matches
+            # are still checked below one pattern at a time, in priority order
+            targets = [_scan_target(p, search_text, search_buffer) for p in patterns]
+            prefetched: Optional[List[List[Any]]] = None
+            if (
+                self._scan_pool is not None
+                and not stop_on_first_match
+                and len(patterns) >= _PARALLEL_SCAN_MIN_PATTERNS
+                and search_len >= _PARALLEL_SCAN_MIN_LENGTH
+            ):
+                prefetched = list(
+                    self._scan_pool.map(
+                        lambda target: list(target[0].finditer(target[1], scan_from)), targets
+                    )
                 )
-                matches.append(match)
 
-                # Early termination: stop after first match if requested
+            for index, pattern in enumerate(patterns):
+                exactly_matches = pattern.match_type == "exactly_matches"
+                verify = pattern.verification_func
+                store_raw = include_matched_text and pattern.policy.store_raw
+                compiled, subject = targets[index]
+
+                # When stopping at the first match, most patterns match nothing
+                # or have their first match accepted: one search() answers both
                 if stop_on_first_match:
+                    first_match = compiled.search(subject, scan_from)
+                    if first_match is None:
+                        continue
+                    regex_matches = _matches_after(compiled, subject, scan_from, first_match)
+                elif prefetched is not None:
+                    regex_matches = iter(prefetched[index])
+                else:
+                    regex_matches = compiled.finditer(subject, scan_from)
+
+                for regex_match in regex_matches:
+                    start, end = regex_match.span()
+
+                    # For exactly_matches patterns, enforce token boundaries:
+                    # the match must not be embedded in a larger alphanumeric
+                    # token, and must not be a plain alphabetic word (to avoid
+                    # false positives from broad patterns like generic passport
+                    # matching "Contact")
+                    if exactly_matches:
+                        if start > 0 and search_text[start - 1].isalnum():
+                            continue
+                        if end < search_len and search_text[end].isalnum():
+                            continue
+                        word = search_text[start:end]
+                        if word.isascii() and word.isalpha():
+                            continue
+
+                    # Map back to original positions if NLP preprocessing was used
+                    if preprocessed:
+                        start, end = preprocessed.map_to_original(start, end)
+
+                    # Check for overlaps if not allowed (before the costlier
+                    # verification, which cannot save an overlapping match).
+                    # Since patterns are sorted by priority, we already have
+                    # the best match for this span.
+                    if not allow_overlaps and accepted_spans.overlaps(start, end):
+                        continue
+
+                    # Only verification and the stored text need the value, so
+                    # it is sliced only for them. The span is in original
+                    # coordinates (text is search_text unless preprocessing
+                    # mapped it back)
+
+                    # Apply verification function if specified
+                    passed_verification = False
+                    if verify is not None:
+                        matched_value = text[start:end]
+                        if not verify(matched_value):
+                            logger.debug(
+                                "Pattern %s matched but failed verification: %s",
+                                pattern.full_id,
+                                matched_value,
+                            )
+                            continue
+                        passed_verification = True
+
+                    if not allow_overlaps:
+                        accepted_spans.add(start, end)
+
+                    # Positional arguments, in Match field order: built once per
+                    # hit, and keyword binding roughly doubles construction cost
+                    match = Match(
+                        pattern.full_id,  # ns_id
+                        pattern.id,  # pattern_id
+                        pattern.namespace,
+                        pattern.category,
+                        start,
+                        end,
+                        # matched_text, if allowed by policy
+                        text[start:end] if store_raw else None,
+                        pattern.mask,
+                        pattern.policy.severity,
+                        # score: verified matches start at higher confidence
+                        initial_verified if passed_verification else initial_unverified,
+                        passed_verification,  # verified
+                    )
+                    matches.append(match)
+
+                    # Early termination: stop after first match if requested
+                    if stop_on_first_match:
+                        break
+
+                # Break pattern loop if stopping on first match and we found one
+                if stop_on_first_match and matches:
                     break
 
             # Break outer loop if stopping on first match and we found one
             if stop_on_first_match and matches:
                 break
 
-        # Step 2.5: Resolve overlaps if multiple matches were collected
-        if not allow_overlaps and len(matches) > 1:
-            # Re-sort matches by position then length (longer first)
-            matches.sort(key=lambda m: (m.start, m.end - m.start), reverse=True)
-
-            # This is a bit complex if we want to honor priority AND position.
-            # But since we collected matches in priority order, we can keep the
-            # ones that came first.
-
-            resolved_matches: List[Match] = []
-            # We already have them in a mostly priority-first order from the loop.
-            # Let's re-verify and filter out overlapping ones that were added later.
-            for m in matches:
-                if not any(
-                    self._spans_overlap((m.start, m.end), (rm.start, rm.end))
-                    for rm in resolved_matches
-                ):
-                    resolved_matches.append(m)
-            matches = resolved_matches
+        # Step 2.5: Overlaps need no separate pass. The scan above accepted
+        # matches in priority order and rejected any that overlapped, and the
+        # final sort puts them in position order
 
         # Step 2.75: NER Detection (Way 1 - Transformer)
         # Run NER model alongside regex to find entities regex might miss.
@@ -360,11 +727,17 @@ class Engine:
         # Sort matches by position
         matches.sort(key=lambda m: (m.start, m.end))
 
-        return FindResult(
+        result = FindResult(
             text=text,
             matches=matches,
             namespaces_searched=namespaces,
         )
+        if cache_key is not None:
+            self._store_result(
+                cache_key,
+                FindResult(text=text, matches=list(matches), namespaces_searched=list(namespaces)),
+            )
+        return result
 
     def validate(self, text: str, ns_id: str) -> ValidationResult:
         """
@@ -380,6 +753,16 @@ class Engine:
         Raises:
             ValueError: If pattern not found
         """
+        # Keys are 2-tuples, so they never collide with find()'s 5-tuples
+        cache_key: Optional[Tuple[str, str]] = None
+        if self.detection_cache_size > 0:
+            cache_key = (ns_id, text)
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return ValidationResult(
+                    text=text, ns_id=ns_id, is_valid=cached.is_valid, match=cached.match
+                )
+
         pattern = self.registry.get_pattern(ns_id)
         if pattern is None:
             raise ValueError(f"Pattern not found: {ns_id}")
@@ -391,7 +774,9 @@ class Engine:
         if is_valid and pattern.verification_func is not None:
             is_valid = pattern.verification_func(text)
             if not is_valid:
-                logger.debug(f"Pattern {pattern.full_id} matched but failed verification: {text}")
+                logger.debug(
+                    "Pattern %s matched but failed verification: %s", pattern.full_id, text
+                )
 
         match = None
         if is_valid and regex_match:
@@ -411,12 +796,15 @@ class Engine:
                 severity=pattern.policy.severity,
             )
 
-        return ValidationResult(
+        result = ValidationResult(
             text=text,
             ns_id=ns_id,
             is_valid=is_valid,
             match=match,
         )
+        if cache_key is not None:
+            self._store_result(cache_key, result)
+        return result
 
     def redact(
         self,
@@ -461,13 +849,16 @@ class Engine:
                 redaction_count=0,
             )
 
-        # Build redacted text by replacing matches from end to start
-        # (to preserve positions)
-        redacted = text
-        for match in reversed(find_result.matches):
-            original = text[match.start : match.end]
-            replacement = self._get_replacement(original, match, strategy)
-            redacted = redacted[: match.start] + replacement + redacted[match.end :]
+        # Build redacted text in a single pass over the (position-sorted)
+        # matches. Without overlaps, replacements go straight into the output
+        if not allow_overlaps and strategy != RedactionStrategy.FAKE:
+            redacted = self._redact_streaming(text, find_result.matches, strategy)
+        else:
+            replacements = [
+                (match.start, match.end, self._get_replacement(text, match, strategy))
+                for match in find_result.matches
+            ]
+            redacted = _apply_replacements(text, replacements)
 
         return RedactionResult(
             original_text=text,
@@ -477,18 +868,58 @@ class Engine:
             redaction_count=len(find_result.matches),
         )
 
-    def _get_replacement(self, original: str, match: Match, strategy: RedactionStrategy) -> str:
-        """Get replacement text for a match based on strategy."""
+    def _redact_streaming(
+        self, text: str, matches: List[Match], strategy: RedactionStrategy
+    ) -> str:
+        """
+        Splice replacements into text as each match is reached.
+
+        Unlike _apply_replacements(), no (start, end, replacement) list is
+        built first. Matches must be sorted by position and must not overlap
+        (find() with allow_overlaps=False).
+
+        Args:
+            text: Original text
+            matches: Matches found in text
+            strategy: MASK, HASH or TOKENIZE (FAKE lookups may fail and fall
+                      back per match, so redact() keeps the two-pass path)
+
+        Returns:
+            Redacted text
+        """
+        parts: List[str] = []
+        append = parts.append
+        cursor = 0
+        if strategy == RedactionStrategy.MASK:
+            # Masks depend only on span length, so skip slicing the original value
+            mask_char = self.default_mask_char
+            for match in matches:
+                start = match.start
+                append(text[cursor:start])
+                append(match.mask or mask_char * (match.end - start))
+                cursor = match.end
+        else:
+            get_replacement = self._get_replacement
+            for match in matches:
+                append(text[cursor : match.start])
+                append(get_replacement(text, match, strategy))
+                cursor = match.end
+        append(text[cursor:])
+        return "".join(parts)
+
+    def _get_replacement(self, text: str, match: Match, strategy: RedactionStrategy) -> str:
+        """Get replacement text for a match in text based on strategy."""
+        # Only hashing and fake data read the matched value, so it is sliced there
         if strategy == RedactionStrategy.MASK:
             # Use pattern mask if available, otherwise use default masking
             if match.mask:
                 return match.mask
-            return self.default_mask_char * len(original)
+            return self.default_mask_char * (match.end - match.start)
 
         elif strategy == RedactionStrategy.HASH:
             # Return hash of original text
-            hasher = hashlib.new(self.hash_algorithm)
-            hasher.update(original.encode("utf-8"))
+            hasher = self._hasher_factory()
+            hasher.update(text[match.start : match.end].encode("utf-8"))
             return f"[HASH:{hasher.hexdigest()[:16]}]"
 
         elif strategy == RedactionStrategy.TOKENIZE:
@@ -497,24 +928,24 @@ class Engine:
 
         elif strategy == RedactionStrategy.FAKE:
             # Generate realistic fake data based on pattern type
-            fake_gen = _get_fake_generator()
-            if fake_gen is None:
+            fake_pool = _get_fake_pool()
+            if fake_pool is None:
                 # Fallback to masking if faker not available
                 logger.warning("FAKE strategy requested but faker not available, using MASK")
-                return self.default_mask_char * len(original)
+                return self.default_mask_char * (match.end - match.start)
 
             try:
-                # Generate fake data from pattern
-                fake_value = fake_gen.from_pattern(match.ns_id)
+                # Same original value always maps to the same pooled fake value
+                fake_value = fake_pool.get(match.ns_id, text[match.start : match.end])
                 if fake_value:
                     return fake_value
             except Exception as e:
                 logger.warning(f"Failed to generate fake data for {match.ns_id}: {e}")
 
             # Fallback to masking
-            return self.default_mask_char * len(original)
+            return self.default_mask_char * (match.end - match.start)
 
-        return self.default_mask_char * len(original)
+        return self.default_mask_char * (match.end - match.start)
 
     @staticmethod
     def _spans_overlap(span1: Tuple[int, int], span2: Tuple[int, int]) -> bool:
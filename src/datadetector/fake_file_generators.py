@@ -7,9 +7,10 @@ This module extends the fake data generator with support for:
 - XML files
 """
 
+import functools
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, List, Sequence, Tuple, Union
 
 if TYPE_CHECKING:
     from datadetector.fake_generator import FakeDataGenerator
@@ -19,9 +20,50 @@ try:
 except ImportError:
     Image = ImageDraw = ImageFont = None  # type: ignore[assignment]
 
+# lxml (optional) streams XML files; ElementTree is used without it
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 logger = logging.getLogger(__name__)
 
 
+def _invoice_totals(
+    quantities: Sequence[int], prices: Sequence[float]
+) -> Tuple[List[float], float]:
+    """
+    Compute invoice line totals and their subtotal in one pass.
+
+    Args:
+        quantities: Quantity of each line item
+        prices: Unit price of each line item
+
+    Returns:
+        Tuple of (line totals, subtotal)
+    """
+    line_totals = [qty * price for qty, price in zip(quantities, prices)]
+    return line_totals, sum(line_totals)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font(path: str, size: int) -> "Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]":
+    """
+    Load a TrueType font once per (path, size), falling back to Pillow's default.
+
+    Args:
+        path: Font file path
+        size: Font size in points
+
+    Returns:
+        Loaded font, or the default font if the file cannot be opened
+    """
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
 class OfficeFileGenerator:
     """Generate Office files (Word, Excel, PowerPoint) with fake data."""
 
@@ -81,7 +123,7 @@ class OfficeFileGenerator:
                     ("Name", self.faker.name()),
                     ("Email", self.faker.email()),
                     ("Phone", self.faker.phone_number()),
-                    ("SSN", self.faker.ssn() if include_pii else "XXX-XX-XXXX"),
+                    ("SSN", self.faker.ssn()),
                     ("Address", self.faker.address()),
                 ]
 
@@ -113,7 +155,9 @@ class OfficeFileGenerator:
         """
         try:
             from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, PatternFill
+            from openpyxl.utils import get_column_letter
         except ImportError:
             raise ImportError(
                 "openpyxl is required for Excel file generation. "
@@ -121,51 +165,72 @@ class OfficeFileGenerator:
             )
 
         output_path = Path(output_path)
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Users"
+        # Write-only mode streams rows to the file instead of keeping every
+        # cell of the sheet in memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Users")
 
         # Headers
         headers = ["ID", "Name", "Email", "Phone", "City", "Country"]
         if include_pii:
             headers.extend(["SSN", "Credit Card", "IP Address"])
 
+        # Faker resolves provider methods through __getattr__ on every access,
+        # so bind them once for the row loop
+        faker = self.faker
+        name, email, phone, city, country = (
+            faker.name,
+            faker.email,
+            faker.phone_number,
+            faker.city,
+            faker.country,
+        )
+        ssn, credit_card, ipv4 = faker.ssn, faker.credit_card_number, faker.ipv4
+
+        # Generate the data column by column, one tight loop per provider,
+        # with the include_pii check made once rather than per row
+        numbers = range(1, rows + 1)
+        columns: List[List[Any]] = [
+            list(numbers),
+            [name() for _ in numbers],
+            [email() for _ in numbers],
+            [phone() for _ in numbers],
+            [city() for _ in numbers],
+            [country() for _ in numbers],
+        ]
+        if include_pii:
+            columns.extend(
+                [
+                    [ssn() for _ in numbers],
+                    [credit_card() for _ in numbers],
+                    [ipv4() for _ in numbers],
+                ]
+            )
+
+        # Adjust column widths (written before the first row) to the longest
+        # value: the IDs are the numbers up to rows, the other columns strings
+        max_lengths = [len(str(rows))] + [
+            max(map(len, column), default=0) for column in columns[1:]
+        ]
+        for col_idx, (header, max_length) in enumerate(zip(headers, max_lengths), 1):
+            width = min(max(len(header), max_length) + 2, 50)
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+
         # Style headers
         header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
         header_font = Font(bold=True, color="FFFFFF")
 
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx)
-            cell.value = header
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
             cell.fill = header_fill
             cell.font = header_font
+            header_row.append(cell)
+        ws.append(header_row)
 
         # Data rows
-        for row_idx in range(2, rows + 2):
-            ws.cell(row=row_idx, column=1, value=row_idx - 1)
-            ws.cell(row=row_idx, column=2, value=self.faker.name())
-            ws.cell(row=row_idx, column=3, value=self.faker.email())
-            ws.cell(row=row_idx, column=4, value=self.faker.phone_number())
-            ws.cell(row=row_idx, column=5, value=self.faker.city())
-            ws.cell(row=row_idx, column=6, value=self.faker.country())
-
-            if include_pii:
-                ws.cell(row=row_idx, column=7, value=self.faker.ssn())
-                ws.cell(row=row_idx, column=8, value=self.faker.credit_card_number())
-                ws.cell(row=row_idx, column=9, value=self.faker.ipv4())
-
-        # Adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column = list(column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except (TypeError, AttributeError):
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column[0].column_letter].width = adjusted_width
+        for values in zip(*columns):
+            ws.append(values)
 
         wb.save(output_path)
         logger.info(f"Created Excel file: {output_path} ({rows} rows)")
@@ -282,12 +347,8 @@ class ImageGenerator:
         draw = ImageDraw.Draw(img)
 
         # Try to use a nice font, fall back to default
-        try:
-            font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 32)
-            font_small = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20)
-        except OSError:
-            font_large = ImageFont.load_default()  # type: ignore[assignment]
-            font_small = ImageFont.load_default()  # type: ignore[assignment]
+        font_large = _get_font("/System/Library/Fonts/Helvetica.ttc", 32)
+        font_small = _get_font("/System/Library/Fonts/Helvetica.ttc", 20)
 
         # Add title
         title = "Fake Document"
@@ -339,10 +400,7 @@ class ImageGenerator:
         draw = ImageDraw.Draw(img)
 
         # Try to load font
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", 14)
-        except OSError:
-            font = ImageFont.load_default()  # type: ignore[assignment]
+        font = _get_font("/System/Library/Fonts/Menlo.ttc", 14)
 
         # Draw fake terminal/editor look
         draw.rectangle([(50, 50), (width - 50, height - 50)], fill=(30, 30, 30))
@@ -395,36 +453,84 @@ class XMLGenerator:
         """
         Create an XML file with fake data.
 
+        With lxml installed, records are streamed to the file one at a time
+        instead of building the whole document in memory first.
+
         Args:
             output_path: Output file path
             records: Number of records
             include_pii: Whether to include PII
         """
-        try:
-            import xml.etree.ElementTree as ET
-        except ImportError:
-            raise ImportError("xml.etree.ElementTree is required")
-
         output_path = Path(output_path)
 
-        root = ET.Element("users")
+        if lxml_etree is not None:
+            self._write_xml_streaming(output_path, records, include_pii)
+        else:
+            self._write_xml_tree(output_path, records, include_pii)
+
+        logger.info(f"Created XML file: {output_path} ({records} records)")
 
-        for i in range(records):
-            user = ET.SubElement(root, "user", id=str(i + 1))
+    def _write_xml_streaming(self, output_path: Path, records: int, include_pii: bool) -> None:
+        """Write the records with lxml's incremental writer."""
+        element, sub_element = lxml_etree.Element, lxml_etree.SubElement
 
-            ET.SubElement(user, "name").text = self.faker.name()
-            ET.SubElement(user, "email").text = self.faker.email()
-            ET.SubElement(user, "phone").text = self.faker.phone_number()
+        # Bind Faker provider methods once for the record loop
+        faker = self.faker
+        name, email, phone = faker.name, faker.email, faker.phone_number
+        ssn, credit_card = faker.ssn, faker.credit_card_number
 
-            if include_pii:
-                ET.SubElement(user, "ssn").text = self.faker.ssn()
-                ET.SubElement(user, "credit_card").text = self.faker.credit_card_number()
+        with lxml_etree.xmlfile(str(output_path), encoding="utf-8") as xf:
+            xf.write_declaration()
+            with xf.element("users"):
+                # Each <user> is serialized and dropped before the next one;
+                # include_pii is checked once, outside the record loop
+                if include_pii:
+                    for i in range(records):
+                        user = element("user", id=str(i + 1))
+                        sub_element(user, "name").text = name()
+                        sub_element(user, "email").text = email()
+                        sub_element(user, "phone").text = phone()
+                        sub_element(user, "ssn").text = ssn()
+                        sub_element(user, "credit_card").text = credit_card()
+                        xf.write(user)
+                else:
+                    for i in range(records):
+                        user = element("user", id=str(i + 1))
+                        sub_element(user, "name").text = name()
+                        sub_element(user, "email").text = email()
+                        sub_element(user, "phone").text = phone()
+                        xf.write(user)
+
+    def _write_xml_tree(self, output_path: Path, records: int, include_pii: bool) -> None:
+        """Build the document with ElementTree and write it at once."""
+        import xml.etree.ElementTree as ET
+
+        root = ET.Element("users")
+
+        # Bind Faker provider methods once for the record loop
+        faker = self.faker
+        name, email, phone = faker.name, faker.email, faker.phone_number
+        ssn, credit_card = faker.ssn, faker.credit_card_number
+
+        # include_pii is checked once, outside the record loop
+        if include_pii:
+            for i in range(records):
+                user = ET.SubElement(root, "user", id=str(i + 1))
+                ET.SubElement(user, "name").text = name()
+                ET.SubElement(user, "email").text = email()
+                ET.SubElement(user, "phone").text = phone()
+                ET.SubElement(user, "ssn").text = ssn()
+                ET.SubElement(user, "credit_card").text = credit_card()
+        else:
+            for i in range(records):
+                user = ET.SubElement(root, "user", id=str(i + 1))
+                ET.SubElement(user, "name").text = name()
+                ET.SubElement(user, "email").text = email()
+                ET.SubElement(user, "phone").text = phone()
 
         tree = ET.ElementTree(root)
         tree.write(output_path, encoding="utf-8", xml_declaration=True)
 
-        logger.info(f"Created XML file: {output_path} ({records} records)")
-
 
 class PDFGenerator:
     """Generate PDF files with fake data."""
@@ -508,24 +614,31 @@ class PDFGenerator:
         story.append(Paragraph(f"Generated: {self.faker.date()}", styles["Normal"]))
         story.append(Spacer(1, 0.5 * inch))
 
+        # Bind Faker provider methods and the RNG once for the page loop
+        faker = self.faker
+        rng = self.gen._rng
+        catch_phrase, paragraph_text, sentence = faker.catch_phrase, faker.paragraph, faker.sentence
+        name, email, phone, address = faker.name, faker.email, faker.phone_number, faker.address
+        ssn, credit_card, ipv4 = faker.ssn, faker.credit_card_number, faker.ipv4
+
         # Generate pages
         for page_num in range(pages):
             if page_num > 0:
                 story.append(PageBreak())
 
             # Page heading
-            section_title = f"Section {page_num + 1}: {self.faker.catch_phrase()}"
+            section_title = f"Section {page_num + 1}: {catch_phrase()}"
             story.append(Paragraph(section_title, heading_style))
             story.append(Spacer(1, 0.2 * inch))
 
             # Add paragraphs
-            for _ in range(self.gen._rng.randint(2, 4)):
-                paragraph = self.faker.paragraph(nb_sentences=self.gen._rng.randint(3, 6))
+            for _ in range(rng.randint(2, 4)):
+                paragraph = paragraph_text(nb_sentences=rng.randint(3, 6))
                 story.append(Paragraph(paragraph, styles["Normal"]))
                 story.append(Spacer(1, 0.1 * inch))
 
             # Add PII table on some pages
-            if include_pii and self.gen._rng.random() > 0.4:
+            if include_pii and rng.random() > 0.4:
                 story.append(Spacer(1, 0.2 * inch))
                 story.append(Paragraph("Contact Information", heading_style))
                 story.append(Spacer(1, 0.1 * inch))
@@ -533,21 +646,15 @@ class PDFGenerator:
                 # Create table data
                 table_data = [
                     ["Field", "Value"],
-                    ["Name", self.faker.name()],
-                    ["Email", self.faker.email()],
-                    ["Phone", self.faker.phone_number()],
-                    ["Address", self.faker.address().replace("\n", ", ")],
+                    ["Name", name()],
+                    ["Email", email()],
+                    ["Phone", phone()],
+                    ["Address", address().replace("\n", ", ")],
+                    ["SSN", ssn()],
+                    ["Credit Card", credit_card()],
+                    ["IP Address", ipv4()],
                 ]
 
-                if include_pii:
-                    table_data.extend(
-                        [
-                            ["SSN", self.faker.ssn()],
-                            ["Credit Card", self.faker.credit_card_number()],
-                            ["IP Address", self.faker.ipv4()],
-                        ]
-                    )
-
                 # Create table
                 table = Table(table_data, colWidths=[2 * inch, 4 * inch])
                 table.setStyle(
@@ -572,13 +679,13 @@ class PDFGenerator:
                 story.append(Spacer(1, 0.3 * inch))
 
             # Add some bullet points
-            if self.gen._rng.random() > 0.5:
+            if rng.random() > 0.5:
                 story.append(Spacer(1, 0.2 * inch))
                 story.append(Paragraph("Key Points:", heading_style))
                 story.append(Spacer(1, 0.1 * inch))
 
-                for _ in range(self.gen._rng.randint(3, 5)):
-                    bullet = f"• {self.faker.sentence()}"
+                for _ in range(rng.randint(3, 5)):
+                    bullet = f"• {sentence()}"
                     story.append(Paragraph(bullet, styles["Normal"]))
                     story.append(Spacer(1, 0.05 * inch))
 
@@ -647,15 +754,24 @@ class PDFGenerator:
         story.append(Paragraph("Items:", styles["Heading2"]))
         story.append(Spacer(1, 0.1 * inch))
 
+        # Draw each line item (name, quantity, price, in the original order),
+        # then total them in one pass
+        rng = self.gen._rng
+        catch_phrase = self.faker.catch_phrase
+        items: List[str] = []
+        quantities: List[int] = []
+        prices: List[float] = []
+        for _ in range(rng.randint(3, 8)):
+            items.append(catch_phrase())
+            quantities.append(rng.randint(1, 10))
+            prices.append(rng.uniform(10, 500))
+        line_totals, total = _invoice_totals(quantities, prices)
+
         items_data = [["Item", "Quantity", "Price", "Total"]]
-        total = 0.0
-        for _ in range(self.gen._rng.randint(3, 8)):
-            item = self.faker.catch_phrase()
-            qty = self.gen._rng.randint(1, 10)
-            price = self.gen._rng.uniform(10, 500)
-            item_total = qty * price
-            total += item_total
-            items_data.append([item, str(qty), f"${price:.2f}", f"${item_total:.2f}"])
+        items_data.extend(
+            [item, str(qty), f"${price:.2f}", f"${item_total:.2f}"]
+            for item, qty, price, item_total in zip(items, quantities, prices, line_totals)
+        )
 
         items_data.append(["", "", "Subtotal:", f"${total:.2f}"])
         tax = total * 0.08
@@ -8,9 +8,10 @@ import json
 import logging
 import secrets
 import sqlite3
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 try:
     from faker import Faker
@@ -19,6 +20,32 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_UPPER_DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+_TOKEN_ALNUM = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def _secure_token(alphabet: str, length: int) -> str:
+    """
+    Generate a cryptographically secure random string.
+
+    All characters come from one secrets.randbelow() draw, read as base-N
+    digits (N = alphabet size), rather than one OS entropy read per character.
+
+    Args:
+        alphabet: Characters to draw from
+        length: Number of characters
+
+    Returns:
+        Random string of the given length
+    """
+    base = len(alphabet)
+    value = secrets.randbelow(base**length)
+    chars = []
+    for _ in range(length):
+        value, index = divmod(value, base)
+        chars.append(alphabet[index])
+    return "".join(chars)
+
 
 class FakeDataGenerator:
     """
@@ -98,28 +125,9 @@ class FakeDataGenerator:
             # URLs
             "comm/url_01": lambda: self.faker.url(),
             # Tokens - using secrets for cryptographically secure generation
-            "comm/aws_access_key_01": lambda: (
-                "AKIA"
-                + "".join(secrets.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789") for _ in range(16))
-            ),
-            "comm/github_token_01": lambda: (
-                "ghp_"
-                + "".join(
-                    secrets.choice(
-                        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_"
-                    )
-                    for _ in range(36)
-                )
-            ),
-            "comm/google_api_key_01": lambda: (
-                "AIza"
-                + "".join(
-                    secrets.choice(
-                        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
-                    )
-                    for _ in range(35)
-                )
-            ),
+            "comm/aws_access_key_01": lambda: "AKIA" + _secure_token(_TOKEN_UPPER_DIGITS, 16),
+            "comm/github_token_01": lambda: "ghp_" + _secure_token(_TOKEN_ALNUM + "_", 36),
+            "comm/google_api_key_01": lambda: "AIza" + _secure_token(_TOKEN_ALNUM + "-_", 35),
             # Coordinates
             "comm/latitude_01": lambda: f"{self.faker.latitude()}",
             "comm/longitude_01": lambda: f"{self.faker.longitude()}",
@@ -517,3 +525,83 @@ class FakeDataGenerator:
             List of pattern IDs
         """
         return list(self._pattern_generators.keys())
+
+
+class FakeValuePool:
+    """
+    Fixed-size pool of fake values per pattern for fast pseudonymization.
+
+    Each original value is hashed to one of ``size`` slots; a slot is filled
+    by the wrapped FakeDataGenerator the first time it is used and reused
+    afterwards. Repeated redaction therefore stops paying Faker's per-call
+    cost, and the same original value always maps to the same fake value.
+
+    Example:
+        >>> pool = FakeValuePool(FakeDataGenerator(seed=0))
+        >>> pool.get("comm/email_01", "john@corp.com") == pool.get(
+        ...     "comm/email_01", "john@corp.com"
+        ... )
+        True
+    """
+
+    def __init__(self, generator: FakeDataGenerator, size: int = 1024):
+        """
+        Initialize the pool.
+
+        Args:
+            generator: Generator used to fill pool slots
+            size: Number of distinct fake values kept per pattern
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.generator = generator
+        self.size = size
+        self._supported = set(generator.supported_patterns())
+        self._pools: Dict[str, Dict[int, str]] = {}
+
+    def get(self, pattern_id: str, original: str) -> str:
+        """
+        Get the fake value standing in for an original value.
+
+        Args:
+            pattern_id: Pattern ID (e.g., "comm/email_01")
+            original: Original matched text
+
+        Returns:
+            Fake value for the pattern
+
+        Raises:
+            ValueError: If pattern_id is not supported
+        """
+        pool = self._pools.get(pattern_id)
+        if pool is None:
+            if pattern_id not in self._supported:
+                raise ValueError(
+                    f"Pattern '{pattern_id}' is not supported for fake data generation"
+                )
+            pool = self._pools.setdefault(pattern_id, {})
+
+        slot = zlib.crc32(original.encode("utf-8")) % self.size
+        value = pool.get(slot)
+        if value is None:
+            # setdefault keeps the mapping stable if two threads race on a slot
+            value = pool.setdefault(slot, self.generator.from_pattern(pattern_id))
+        return value
+
+    def prefill(self, pattern_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Fill every slot up front so later lookups never call Faker.
+
+        Args:
+            pattern_ids: Patterns to fill (None = all supported patterns)
+        """
+        for pattern_id in pattern_ids if pattern_ids is not None else sorted(self._supported):
+            if pattern_id not in self._supported:
+                raise ValueError(
+                    f"Pattern '{pattern_id}' is not supported for fake data generation"
+                )
+            pool = self._pools.setdefault(pattern_id, {})
+            for slot in range(self.size):
+                if slot not in pool:
+                    pool[slot] = self.generator.from_pattern(pattern_id)
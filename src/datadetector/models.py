@@ -1,8 +1,13 @@
 """Data models for data-detector."""
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+# Result objects are created per match, so give them __slots__ (faster
+# attribute access, smaller instances) where dataclasses support it (3.10+).
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class Category(str, Enum):
@@ -95,6 +100,11 @@ class Pattern:
     verification_func: Optional[Callable[[str], bool]] = None  # Compiled verification function
     priority: int = 100  # Search priority (lower = higher priority, default = 100)
     match_type: str = "contains"  # "contains" (default) or "exactly_matches"
+    # Literal prefilter: each entry is a set of strings, one of which must occur
+    # in the text for the pattern to possibly match (see regex_compat)
+    required_literals: Tuple[FrozenSet[str], ...] = ()
+    # Bytes-mode copy of compiled for ASCII texts, or None (see regex_compat)
+    compiled_bytes: Any = None
 
     @property
     def full_id(self) -> str:
@@ -102,7 +112,7 @@ class Pattern:
         return f"{self.namespace}/{self.id}"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Match:
     """Single pattern match result."""
 
@@ -126,7 +136,7 @@ class Match:
         return (self.start, self.end)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FindResult:
     """Result from find operation."""
 
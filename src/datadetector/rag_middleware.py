@@ -1,8 +1,9 @@
 """RAG security middleware for three-layer PII protection."""
 
 import asyncio
+import functools
 import logging
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, TypeVar
 
 from datadetector.engine import Engine
 from datadetector.rag_models import (
@@ -19,6 +20,8 @@ from datadetector.tokenization import SecureTokenizer
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class RAGSecurityMiddleware:
     """
@@ -93,9 +96,15 @@ class RAGSecurityMiddleware:
             ...     raise ValueError("Query contains PII")
             >>> # Use result.sanitized_text for processing
         """
-        # Yield control to event loop (makes function truly async)
-        await asyncio.sleep(0)
+        return await self._run_in_executor(self._scan_query_sync, query, namespaces, policy)
 
+    def _scan_query_sync(
+        self,
+        query: str,
+        namespaces: Optional[List[str]],
+        policy: Optional[SecurityPolicy],
+    ) -> QueryScanResult:
+        """Synchronous implementation of scan_query (called from executor)."""
         policy = policy or self.input_policy
 
         # Find PII in query
@@ -189,9 +198,19 @@ class RAGSecurityMiddleware:
             >>> # Store result.sanitized_text in vector DB
             >>> # Store result.token_map securely for later reversal
         """
-        # Yield control to event loop (makes function truly async)
-        await asyncio.sleep(0)
+        return await self._run_in_executor(
+            self._scan_document_sync, document, namespaces, policy, chunk_id, total_chunks
+        )
 
+    def _scan_document_sync(
+        self,
+        document: str,
+        namespaces: Optional[List[str]],
+        policy: Optional[SecurityPolicy],
+        chunk_id: Optional[int],
+        total_chunks: Optional[int],
+    ) -> DocumentScanResult:
+        """Synchronous implementation of scan_document (called from executor)."""
         policy = policy or self.storage_policy
 
         # Find PII in document
@@ -255,6 +274,45 @@ class RAGSecurityMiddleware:
             total_chunks=total_chunks,
         )
 
+    async def scan_documents(
+        self,
+        documents: List[str],
+        namespaces: Optional[List[str]] = None,
+        policy: Optional[SecurityPolicy] = None,
+    ) -> List[DocumentScanResult]:
+        """
+        Layer 2: Scan multiple documents (or chunks of one) concurrently.
+
+        Each document is scanned in the default executor, so a server ingesting
+        many documents can overlap the scans instead of running them one by one.
+        Documents are treated as chunks of one upload: chunk_id is the position
+        in ``documents`` and total_chunks is its length.
+
+        Args:
+            documents: Document texts to scan
+            namespaces: Pattern namespaces to search
+            policy: Override default storage policy
+
+        Returns:
+            List of DocumentScanResult, in the same order as ``documents``
+
+        Example:
+            >>> results = await middleware.scan_documents(chunks)
+            >>> safe = [r.sanitized_text for r in results if not r.blocked]
+        """
+        total = len(documents)
+        tasks = [
+            self.scan_document(
+                document,
+                namespaces=namespaces,
+                policy=policy,
+                chunk_id=i,
+                total_chunks=total,
+            )
+            for i, document in enumerate(documents)
+        ]
+        return list(await asyncio.gather(*tasks))
+
     async def scan_response(
         self,
         response: str,
@@ -282,9 +340,18 @@ class RAGSecurityMiddleware:
             ...     return "[RESPONSE BLOCKED: Contains PII]"
             >>> return result.sanitized_text
         """
-        # Yield control to event loop (makes function truly async)
-        await asyncio.sleep(0)
+        return await self._run_in_executor(
+            self._scan_response_sync, response, namespaces, policy, token_map
+        )
 
+    def _scan_response_sync(
+        self,
+        response: str,
+        namespaces: Optional[List[str]],
+        policy: Optional[SecurityPolicy],
+        token_map: Optional[TokenMap],
+    ) -> ResponseScanResult:
+        """Synchronous implementation of scan_response (called from executor)."""
         policy = policy or self.output_policy
 
         # Detokenize if authorized and map provided
@@ -349,6 +416,17 @@ class RAGSecurityMiddleware:
             reason=reason,
         )
 
+    @staticmethod
+    async def _run_in_executor(func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking scan in the default executor.
+
+        Pattern matching is CPU-bound; off-loading it keeps the event loop
+        responsive, and the RE2 backend releases the GIL while matching so
+        concurrent scans can run in parallel.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
     def update_policy(
         self,
         layer: SecurityLayer,
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional
 
-from datadetector.models import Match, RedactionStrategy
+from datadetector.models import DATACLASS_SLOTS, Match, RedactionStrategy
 
 
 class SecurityLayer(str, Enum):
@@ -85,7 +85,7 @@ class TokenMap:
         return self.tokens.get(token)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SecurityScanResult:
     """Result of security scan with policy applied."""
 
@@ -109,14 +109,14 @@ class SecurityScanResult:
         return len(self.matches)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QueryScanResult(SecurityScanResult):
     """Result for input layer query scanning."""
 
     pass
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DocumentScanResult(SecurityScanResult):
     """Result for storage layer document scanning."""
 
@@ -124,7 +124,7 @@ class DocumentScanResult(SecurityScanResult):
     total_chunks: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ResponseScanResult(SecurityScanResult):
     """Result for output layer response scanning."""
 
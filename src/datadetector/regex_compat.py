@@ -5,7 +5,8 @@ when available, with automatic fallback to Python's standard re module.
 
 RE2 guarantees linear-time matching, preventing ReDoS attacks. When RE2 is not
 available, the standard re module is used (which may be vulnerable to ReDoS
-with certain patterns).
+with certain patterns). In AUTO mode, patterns using features RE2 lacks
+(lookaround, backreferences) are compiled with the standard re module too.
 
 Note: RE2's \\b (word boundary) only works with ASCII word characters. For Unicode
 patterns (Korean, Chinese, Japanese, etc.), \\b is automatically removed as these
@@ -14,10 +15,32 @@ languages use whitespace boundaries naturally.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re as std_re
+import sys
+import threading
 from enum import Enum
-from typing import Iterator, List, Optional, Union
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if sys.version_info >= (3, 11):
+    from re import _constants as _sre_constants  # type: ignore[attr-defined]
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+else:  # pragma: no cover - Python < 3.11
+    import sre_constants as _sre_constants
+    import sre_parse as _sre_parse
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +51,7 @@ class RegexEngine(Enum):
     AUTO = "auto"  # Use RE2 if available, fallback to standard re
     RE2 = "re2"  # Force RE2 (error if unavailable)
     STANDARD = "standard"  # Force standard re module
+    PCRE2 = "pcre2"  # Force JIT-compiled PCRE2 (error if unavailable)
 
 
 # Try to import google-re2, fall back to standard re if unavailable
@@ -44,25 +68,51 @@ except ImportError:
         "Install google-re2 for ReDoS protection: pip install google-re2"
     )
 
+# Try to import pcre2 for JIT-compiled backtracking matching (optional)
+try:
+    import pcre2
+
+    HAS_PCRE2 = True
+except ImportError:
+    pcre2 = None
+    HAS_PCRE2 = False
+
+# Try to import hyperscan for one-pass multi-pattern prefiltering (optional)
+try:
+    import hyperscan
+
+    HAS_HYPERSCAN = True
+except ImportError:
+    hyperscan = None
+    HAS_HYPERSCAN = False
+
 # Module-level engine preference (default: AUTO)
 _engine_preference: RegexEngine = RegexEngine.AUTO
 
+# Process-wide cache of compiled patterns, shared by every registry/Engine.
+# Keyed by (pattern, flags, pattern_id, backend) so switching engines never
+# returns a pattern compiled for another backend.
+_compile_cache: Dict[Tuple[str, int, str, str], "CompiledPattern"] = {}
+_compile_cache_lock = threading.Lock()
+
 
 def set_engine(engine: RegexEngine) -> None:
     """
     Set the preferred regex engine.
 
     Args:
-        engine: RegexEngine.AUTO (default), RegexEngine.RE2, or RegexEngine.STANDARD
+        engine: RegexEngine.AUTO (default), RegexEngine.RE2,
+            RegexEngine.STANDARD, or RegexEngine.PCRE2
 
     Raises:
-        ValueError: If RE2 is requested but not available
+        ValueError: If RE2 or PCRE2 is requested but not available
 
     Example:
         >>> from datadetector.regex_compat import set_engine, RegexEngine
         >>> set_engine(RegexEngine.STANDARD)  # Force standard re for small texts
         >>> set_engine(RegexEngine.RE2)       # Force RE2 for large texts
         >>> set_engine(RegexEngine.AUTO)      # Use RE2 if available (default)
+        >>> set_engine(RegexEngine.PCRE2)     # JIT-compiled, for match-dense texts
     """
     global _engine_preference
     if engine == RegexEngine.RE2 and not HAS_RE2:
@@ -70,6 +120,10 @@ def set_engine(engine: RegexEngine) -> None:
             "RE2 engine requested but google-re2 is not installed. "
             "Install it with: pip install google-re2"
         )
+    if engine == RegexEngine.PCRE2 and not HAS_PCRE2:
+        raise ValueError(
+            "PCRE2 engine requested but pcre2 is not installed. Install it with: pip install pcre2"
+        )
     _engine_preference = engine
     logger.info(f"Regex engine preference set to: {engine.value}")
 
@@ -86,7 +140,7 @@ def get_engine() -> RegexEngine:
 
 def _should_use_re2() -> bool:
     """Determine if RE2 should be used based on preference and availability."""
-    if _engine_preference == RegexEngine.STANDARD:
+    if _engine_preference in (RegexEngine.STANDARD, RegexEngine.PCRE2):
         return False
     if _engine_preference == RegexEngine.RE2:
         return True  # Already validated in set_engine
@@ -94,6 +148,15 @@ def _should_use_re2() -> bool:
     return HAS_RE2
 
 
+def _select_backend() -> str:
+    """Return the backend new patterns are compiled with: "re2", "pcre2" or "re"."""
+    if _should_use_re2():
+        return "re2"
+    if _engine_preference == RegexEngine.PCRE2:
+        return "pcre2"  # Already validated in set_engine
+    return "re"
+
+
 # Flag constants (same values as standard re module for compatibility)
 IGNORECASE = 2  # re.IGNORECASE
 MULTILINE = 8  # re.MULTILINE
@@ -243,6 +306,18 @@ def _convert_flags_to_std_re(flags: int) -> int:
     return std_flags
 
 
+def _convert_flags_to_pcre2(flags: int) -> int:
+    """Convert internal flag values to pcre2 module flags."""
+    pcre2_flags = 0
+    if flags & IGNORECASE:
+        pcre2_flags |= pcre2.IGNORECASE
+    if flags & MULTILINE:
+        pcre2_flags |= pcre2.MULTILINE
+    if flags & DOTALL:
+        pcre2_flags |= pcre2.DOTALL
+    return pcre2_flags
+
+
 def _apply_multiline_flag(pattern: str, flags: int) -> str:
     """Apply MULTILINE flag by adding (?m) prefix if needed."""
     if flags & MULTILINE:
@@ -252,11 +327,724 @@ def _apply_multiline_flag(pattern: str, flags: int) -> str:
     return pattern
 
 
+# Literal prefilter ---------------------------------------------------------
+#
+# A requirement is a set of strings of which at least one must occur in any
+# text the pattern can match (e.g. {"@"} for an email pattern). Checking them
+# with `in` is far cheaper than running the regex, so texts that cannot match
+# are skipped without a scan.
+
+# Requirement for "at least one decimal digit". Checked with a Unicode-aware
+# \d search (a superset of RE2's ASCII \d) rather than member by member.
+_DIGIT_REQUIREMENT: FrozenSet[str] = frozenset("0123456789")
+_ANY_DIGIT = std_re.compile(r"\d")
+
+# Character classes larger than this are not worth turning into requirements
+_MAX_CLASS_REQUIREMENT = 16
+
+_REPEAT_OPS = tuple(
+    op
+    for op in (
+        _sre_constants.MAX_REPEAT,
+        _sre_constants.MIN_REPEAT,
+        getattr(_sre_constants, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+
+
+def _is_cased(text: str) -> bool:
+    """Return True if any character in text has distinct upper/lower forms."""
+    return text.lower() != text.upper()
+
+
+def _class_requirement(items: List[Any], ignorecase: bool) -> Optional[FrozenSet[str]]:
+    """Return the requirement for a [...] character class, if it has one."""
+    chars = set()
+    has_digit_category = False
+    for op, av in items:
+        if op is _sre_constants.LITERAL:
+            chars.add(chr(av))
+        elif op is _sre_constants.RANGE:
+            low, high = av
+            if high - low >= _MAX_CLASS_REQUIREMENT:
+                return None
+            chars.update(chr(c) for c in range(low, high + 1))
+        elif op is _sre_constants.CATEGORY and av is _sre_constants.CATEGORY_DIGIT:
+            has_digit_category = True
+        else:
+            # NEGATE, other categories (\w, \s, ...) etc.
+            return None
+
+    if chars and chars <= _DIGIT_REQUIREMENT:
+        return _DIGIT_REQUIREMENT
+    if has_digit_category:
+        return _DIGIT_REQUIREMENT if not chars else None
+    if not chars or len(chars) > _MAX_CLASS_REQUIREMENT:
+        return None
+    if ignorecase and any(_is_cased(c) for c in chars):
+        return None
+    return frozenset(chars)
+
+
+def _implies_digit(requirement: FrozenSet[str]) -> bool:
+    """Return True if satisfying a requirement means the text has a digit."""
+    return requirement is _DIGIT_REQUIREMENT or all(
+        _ANY_DIGIT.search(literal) for literal in requirement
+    )
+
+
+def _collect_requirements(items: List[Any], ignorecase: bool) -> List[FrozenSet[str]]:
+    """Collect requirements from a parsed (sre_parse) item sequence."""
+    requirements: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    def flush() -> None:
+        if not run:
+            return
+        literal = "".join(run)
+        run.clear()
+        if not ignorecase:
+            requirements.append(frozenset([literal]))
+            return
+        # Case-insensitive: only uncased substrings are reliable
+        for part in std_re.split(r"[^\W\d_]+", literal):
+            if part and not _is_cased(part):
+                requirements.append(frozenset([part]))
+
+    for op, av in items:
+        if op is _sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+
+        if op is _sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            sub_ignorecase = bool(
+                (ignorecase or add_flags & std_re.IGNORECASE) and not del_flags & std_re.IGNORECASE
+            )
+            requirements.extend(_collect_requirements(list(sub), sub_ignorecase))
+        elif op in _REPEAT_OPS:
+            min_count, _, sub = av
+            if min_count >= 1:
+                requirements.extend(_collect_requirements(list(sub), ignorecase))
+        elif op is _sre_constants.BRANCH:
+            # Any one branch may match: require the union of one
+            # requirement from each branch (only if every branch has one)
+            branch_requirements = [_collect_requirements(list(b), ignorecase) for b in av[1]]
+            if all(branch_requirements):
+                firsts = [reqs[0] for reqs in branch_requirements]
+                if _DIGIT_REQUIREMENT not in firsts:
+                    requirements.append(frozenset().union(*firsts))
+                elif all(any(map(_implies_digit, reqs)) for reqs in branch_requirements):
+                    # Every branch needs a digit (e.g. "90|[1-8]?\d")
+                    requirements.append(_DIGIT_REQUIREMENT)
+        elif op is _sre_constants.IN:
+            requirement = _class_requirement(av, ignorecase)
+            if requirement is not None:
+                requirements.append(requirement)
+
+    flush()
+    return requirements
+
+
+def required_literals(pattern: str, flags: int = 0) -> Tuple[FrozenSet[str], ...]:
+    """
+    Derive the literal requirements every match of a pattern must satisfy.
+
+    Args:
+        pattern: Regex pattern string
+        flags: Regex flags (IGNORECASE, MULTILINE, DOTALL)
+
+    Returns:
+        Tuple of requirements; each is a set of strings of which at least one
+        must occur in the text. Empty if nothing could be derived (including
+        patterns the standard parser does not understand).
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, _convert_flags_to_std_re(flags))
+    except (std_re.error, OverflowError, RecursionError):
+        return ()
+
+    ignorecase = bool(parsed.state.flags & std_re.IGNORECASE)
+    requirements = _collect_requirements(parsed.data, ignorecase)
+    return tuple(dict.fromkeys(requirements))
+
+
+# Texts shorter than this are checked for literals directly: building their
+# character set costs more than it saves
+_CHAR_SET_MIN_TEXT = 512
+
+
+def literal_chars(text: str) -> Optional[Set[str]]:
+    """
+    Get the character set literals_present() uses to rule out literals quickly.
+
+    Args:
+        text: Text about to be searched
+
+    Returns:
+        Set of the characters in text, or None for short texts, where
+        checking each literal directly is faster
+    """
+    return set(text) if len(text) >= _CHAR_SET_MIN_TEXT else None
+
+
+def literals_present(
+    requirements: Tuple[FrozenSet[str], ...],
+    text: str,
+    cache: Optional[Dict[FrozenSet[str], bool]] = None,
+    text_chars: Optional[AbstractSet[str]] = None,
+) -> bool:
+    """
+    Check whether text satisfies all literal requirements of a pattern.
+
+    Args:
+        requirements: Requirements from required_literals()
+        text: Text about to be searched
+        cache: Optional dict reused across patterns for the same text, so a
+               shared requirement (e.g. "contains a digit") is checked once
+        text_chars: Optional set of the characters in text, from
+                    literal_chars(). Literals whose first character is
+                    missing are then ruled out without scanning text (most
+                    literals are absent from most texts).
+
+    Returns:
+        False if the pattern cannot possibly match text
+    """
+    for requirement in requirements:
+        present = cache.get(requirement) if cache is not None else None
+        if present is None:
+            if requirement is _DIGIT_REQUIREMENT:
+                present = _ANY_DIGIT.search(text) is not None
+            elif text_chars is not None:
+                present = any(
+                    literal[0] in text_chars and literal in text for literal in requirement
+                )
+            else:
+                present = any(literal in text for literal in requirement)
+            if cache is not None:
+                cache[requirement] = present
+        if not present:
+            return False
+    return True
+
+
+# Backtracking analysis -----------------------------------------------------
+#
+# A backtracking engine (re, PCRE2) takes exponential time on some inputs when
+# an unbounded repeat can match the same string in many ways: its body is
+# itself ambiguous, as in (a|a)+ or (\w+\w+)+, or a repeat inside it can take
+# characters from the next iteration, as in (a+)+ or (\w+\s?)+. This is a
+# static approximation of the exponential degree of ambiguity check: character
+# classes are compared on a sample alphabet, so it may miss exotic cases, but
+# the common shapes are caught without running the regex. RE2 is linear-time
+# and needs no check.
+
+# ASCII plus one sample of the non-ASCII classes patterns commonly use
+_SAMPLE_ALPHABET: Tuple[str, ...] = tuple(map(chr, range(128))) + tuple(
+    "\u00a0\u00e9\u00c9\u0663\u2028\u3000\u3042\u4e2d\uac00\uff10\uff21"
+)
+
+_CATEGORY_TESTS = {
+    _sre_constants.CATEGORY_DIGIT: str.isdecimal,
+    _sre_constants.CATEGORY_NOT_DIGIT: lambda c: not c.isdecimal(),
+    _sre_constants.CATEGORY_SPACE: str.isspace,
+    _sre_constants.CATEGORY_NOT_SPACE: lambda c: not c.isspace(),
+    _sre_constants.CATEGORY_WORD: lambda c: c.isalnum() or c == "_",
+    _sre_constants.CATEGORY_NOT_WORD: lambda c: not (c.isalnum() or c == "_"),
+}
+
+_EMPTY_CHARS: FrozenSet[str] = frozenset()
+
+# Repeats and groups the engine never backtracks into
+_ATOMIC_OPS = tuple(
+    op
+    for op in (
+        getattr(_sre_constants, "POSSESSIVE_REPEAT", None),
+        getattr(_sre_constants, "ATOMIC_GROUP", None),
+    )
+    if op is not None
+)
+
+
+class _Shape:
+    """What the ambiguity check needs to know about a parsed sub-pattern."""
+
+    __slots__ = ("nullable", "first", "last", "head_repeats", "tail_repeats", "ambiguous")
+
+    def __init__(
+        self,
+        nullable: bool,
+        first: FrozenSet[str] = _EMPTY_CHARS,
+        last: FrozenSet[str] = _EMPTY_CHARS,
+        head_repeats: FrozenSet[str] = _EMPTY_CHARS,
+        tail_repeats: FrozenSet[str] = _EMPTY_CHARS,
+        ambiguous: bool = False,
+    ) -> None:
+        # Whether it matches the empty string; characters that can start and
+        # end its matches; characters of the unbounded repeats at its start
+        # (end), which can trade them with neighbouring repeats; whether some
+        # string matches it in two ways
+        self.nullable = nullable
+        self.first = first
+        self.last = last
+        self.head_repeats = head_repeats
+        self.tail_repeats = tail_repeats
+        self.ambiguous = ambiguous
+
+
+class _ExponentialRepeatError(Exception):
+    """Raised by _item_shape() on finding an exponentially ambiguous repeat."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _class_chars(items: Tuple[Any, ...], ignorecase: bool) -> FrozenSet[str]:
+    """Get the sample characters a [...] class matches (\\d, \\w, ... recur often)."""
+    negate = False
+    tests: List[Any] = []
+    for op, av in items:
+        if op is _sre_constants.NEGATE:
+            negate = True
+        elif op is _sre_constants.LITERAL:
+            tests.append(chr(av).__eq__)
+        elif op is _sre_constants.RANGE:
+            low, high = av
+            tests.append(lambda c, low=low, high=high: low <= ord(c) <= high)
+        elif op is _sre_constants.CATEGORY:
+            tests.append(_CATEGORY_TESTS.get(av, lambda c: True))
+        else:
+            tests.append(lambda c: True)
+
+    def matches(char: str) -> bool:
+        return any(test(char) for test in tests)
+
+    if ignorecase:
+        found = {c for c in _SAMPLE_ALPHABET if any(map(matches, {c, c.lower(), c.upper()}))}
+    else:
+        found = {c for c in _SAMPLE_ALPHABET if matches(c)}
+    if negate:
+        return frozenset(_SAMPLE_ALPHABET).difference(found)
+    return frozenset(found)
+
+
+def _char_shape(chars: FrozenSet[str]) -> _Shape:
+    """Shape of a single-character item."""
+    return _Shape(False, chars, chars)
+
+
+def _sequence_shape(items: List[Any], flags: int) -> _Shape:
+    """Shape of a concatenation of parsed items."""
+    shape = _Shape(True)
+    for op, av in items:
+        item = _item_shape(op, av, flags)
+        # Two unbounded repeats, with only optional items between them, that
+        # can trade characters: the text between them splits several ways
+        ambiguous = (
+            shape.ambiguous or item.ambiguous or bool(shape.tail_repeats & item.head_repeats)
+        )
+        shape = _Shape(
+            shape.nullable and item.nullable,
+            shape.first | item.first if shape.nullable else shape.first,
+            item.last | shape.last if item.nullable else item.last,
+            shape.head_repeats | item.head_repeats if shape.nullable else shape.head_repeats,
+            item.tail_repeats | shape.tail_repeats if item.nullable else item.tail_repeats,
+            ambiguous,
+        )
+    return shape
+
+
+def _branch_shape(branches: List[_Shape]) -> _Shape:
+    """Shape of an alternation."""
+    ambiguous = any(b.ambiguous for b in branches)
+    for i, a in enumerate(branches):
+        for b in branches[i + 1 :]:
+            # Branches that can start and end alike probably share a match
+            if (a.nullable and b.nullable) or (a.first & b.first and a.last & b.last):
+                ambiguous = True
+    return _Shape(
+        any(b.nullable for b in branches),
+        frozenset().union(*(b.first for b in branches)),
+        frozenset().union(*(b.last for b in branches)),
+        frozenset().union(*(b.head_repeats for b in branches)),
+        frozenset().union(*(b.tail_repeats for b in branches)),
+        ambiguous,
+    )
+
+
+def _item_shape(op: Any, av: Any, flags: int) -> _Shape:
+    """Shape of one parsed (sre_parse) item."""
+    ignorecase = bool(flags & std_re.IGNORECASE)
+    if op is _sre_constants.LITERAL:
+        char = chr(av)
+        return _char_shape(frozenset({char, char.lower(), char.upper()} if ignorecase else {char}))
+    if op is _sre_constants.NOT_LITERAL:
+        return _char_shape(frozenset(_SAMPLE_ALPHABET).difference({chr(av)}))
+    if op is _sre_constants.ANY:
+        dotall = flags & std_re.DOTALL
+        return _char_shape(frozenset(c for c in _SAMPLE_ALPHABET if dotall or c != "\n"))
+    if op is _sre_constants.IN:
+        return _char_shape(_class_chars(tuple(av), ignorecase))
+    if op is _sre_constants.SUBPATTERN:
+        _, add_flags, del_flags, sub = av
+        return _sequence_shape(list(sub), (flags | add_flags) & ~del_flags)
+    if op is _sre_constants.BRANCH:
+        return _branch_shape([_sequence_shape(list(b), flags) for b in av[1]])
+    if op is _sre_constants.GROUPREF_EXISTS:
+        _, yes, no = av
+        return _branch_shape(
+            [_sequence_shape(list(yes), flags), _sequence_shape(list(no or []), flags)]
+        )
+    if op in _ATOMIC_OPS:
+        # Matched once and never revisited, so it adds no ambiguity
+        repeat = op in _REPEAT_OPS
+        inner = _sequence_shape(list(av[2] if repeat else av), flags)
+        nullable = inner.nullable or (repeat and av[0] == 0)
+        return _Shape(nullable, inner.first, inner.last)
+    if op in _REPEAT_OPS:
+        min_count, max_count, sub = av
+        body = _sequence_shape(list(sub), flags)
+        nullable = min_count == 0 or body.nullable
+        if max_count == 0:
+            return _Shape(True)
+        # Can a repeat inside the body take characters from the neighbouring
+        # iteration? Then the boundaries between iterations can shift
+        shifting = bool(body.tail_repeats & body.first or body.head_repeats & body.last)
+        if max_count == _sre_constants.MAXREPEAT:
+            if body.ambiguous or shifting:
+                raise _ExponentialRepeatError()
+            repeated = body.first | body.last
+            return _Shape(
+                nullable,
+                body.first,
+                body.last,
+                body.head_repeats | repeated,
+                body.tail_repeats | repeated,
+            )
+        return _Shape(
+            nullable,
+            body.first,
+            body.last,
+            body.head_repeats,
+            body.tail_repeats,
+            body.ambiguous or (max_count > 1 and shifting),
+        )
+    if op is _sre_constants.GROUPREF:
+        # Could be anything the group matched
+        everything = frozenset(_SAMPLE_ALPHABET)
+        return _Shape(True, everything, everything)
+    # Anchors and lookaround assertions consume nothing
+    return _Shape(True)
+
+
+def has_exponential_backtracking(pattern: str, flags: int = 0) -> bool:
+    """
+    Check whether a pattern can take exponential time on a backtracking engine.
+
+    Args:
+        pattern: Regex pattern string
+        flags: Regex flags (IGNORECASE, MULTILINE, DOTALL)
+
+    Returns:
+        True if an unbounded repeat can match the same text in exponentially
+        many ways (e.g. (a+)+, (a|a)*, (\\w+\\s?)+). False otherwise, including
+        for patterns the standard parser does not understand.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, _convert_flags_to_std_re(flags))
+    except (std_re.error, OverflowError, RecursionError):
+        return False
+
+    try:
+        _sequence_shape(parsed.data, parsed.state.flags)
+    except _ExponentialRepeatError:
+        return True
+    except RecursionError:
+        return False
+    return False
+
+
+# Union prefilter ------------------------------------------------------------
+#
+# A union (?:p1)|(?:p2)|... of several patterns finds, in a single scan, the
+# leftmost offset at which any of them matches. Texts without a union match
+# need no per-pattern scans at all, and the per-pattern scans can start at
+# that offset. Only patterns that keep their meaning when embedded in a larger
+# regex are combined.
+
+_GROUP_REF_OPS = (_sre_constants.GROUPREF, _sre_constants.GROUPREF_EXISTS)
+
+# Inline flags that would act globally if they appeared inside a union
+_GLOBAL_INLINE_FLAGS = std_re.IGNORECASE | std_re.MULTILINE | std_re.DOTALL | std_re.VERBOSE
+
+
+def _subpatterns(value: Any) -> Iterator[Any]:
+    """Yield the sub-patterns nested in a parsed node's argument."""
+    if isinstance(value, _sre_parse.SubPattern):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _subpatterns(item)
+
+
+def _uses_group_refs(parsed: Any) -> bool:
+    """Return True if a parsed pattern contains backreferences or conditionals."""
+    for op, av in parsed:
+        if op in _GROUP_REF_OPS:
+            return True
+        if any(_uses_group_refs(sub) for sub in _subpatterns(av)):
+            return True
+    return False
+
+
+def _is_embeddable(pattern: "CompiledPattern") -> bool:
+    """Check whether a pattern keeps its meaning as one branch of a union."""
+    std_flags = _convert_flags_to_std_re(pattern.flags)
+    try:
+        parsed = _sre_parse.parse(pattern._transformed_pattern_str, std_flags)
+    except (std_re.error, OverflowError, RecursionError):
+        return False
+
+    # Group numbers and names would shift or collide across branches
+    if parsed.state.groupdict or _uses_group_refs(parsed):
+        return False
+    # A leading (?i) etc. cannot be placed inside a branch
+    if parsed.state.flags & ~std_flags & _GLOBAL_INLINE_FLAGS:
+        return False
+    return True
+
+
+def compile_union(patterns: Sequence[Any]) -> Optional[Any]:
+    """
+    Compile a single regex matching wherever any of several patterns matches.
+
+    The union is only meant for search(): the start of its leftmost match is
+    the leftmost offset at which one of the patterns matches, so texts without
+    a union match cannot match any of them. It does not tell which pattern
+    matched, nor find every match.
+
+    Args:
+        patterns: CompiledPattern objects compiled with the same backend
+
+    Returns:
+        Compiled union (re2 or re pattern object), or None if the patterns
+        cannot be combined safely
+    """
+    if not patterns or not all(isinstance(p, CompiledPattern) for p in patterns):
+        return None
+    using_re2 = patterns[0]._using_re2
+    if any(p._using_re2 != using_re2 for p in patterns):
+        return None
+    if not all(_is_embeddable(p) for p in patterns):
+        return None
+
+    branches = []
+    for p in patterns:
+        # Per-pattern flags become scoped inline flags on its branch
+        inline = "".join(
+            letter
+            for flag, letter in ((IGNORECASE, "i"), (MULTILINE, "m"), (DOTALL, "s"))
+            if p.flags & flag
+        )
+        branches.append(f"(?{inline}:{p._transformed_pattern_str})")
+    union = "|".join(branches)
+
+    try:
+        if using_re2:
+            return re2.compile(union)
+        return std_re.compile(union)
+    except Exception as e:
+        logger.debug(f"Could not compile union of {len(patterns)} patterns: {e}")
+        return None
+
+
+# Hyperscan prefilter -------------------------------------------------------
+#
+# Hyperscan compiles many patterns into one automaton and reports in a single
+# pass which of them match. In HS_FLAG_PREFILTER mode every pattern is widened
+# into a form Hyperscan supports, so a pattern it does not report cannot match.
+# Its classes follow PCRE rather than Python's str semantics, which only agree
+# on ASCII: the prefilter is limited to ASCII patterns and ASCII text, and to
+# texts without the separators re's \s matches beyond PCRE's (\x1c-\x1f).
+
+_HS_UNSAFE_CHARS = ("\x0b", "\x1c", "\x1d", "\x1e", "\x1f")
+
+# Hyperscan databases are slow to compile, so they are shared by every
+# prefilter over the same patterns: ((pattern, flags), ...) -> (database,
+# positions of the patterns it contains)
+_hs_db_cache: Dict[Tuple[Tuple[str, int], ...], Tuple[Any, Tuple[int, ...]]] = {}
+_hs_db_cache_lock = threading.Lock()
+
+
+class MultiPatternPrefilter:
+    """
+    One-pass check of which of several patterns can match a text (Hyperscan).
+
+    Patterns that cannot be compiled into the Hyperscan database (non-ASCII
+    sources, plain re objects) are always reported as candidates.
+    """
+
+    def __init__(self, patterns: Sequence[Any]) -> None:
+        """
+        Compile the Hyperscan database.
+
+        Args:
+            patterns: Compiled patterns (CompiledPattern objects are prefiltered)
+
+        Raises:
+            ImportError: If hyperscan is not installed
+        """
+        if not HAS_HYPERSCAN:
+            raise ImportError("hyperscan is not installed. Install with: pip install hyperscan")
+
+        filterable: List[CompiledPattern] = []
+        self._unfiltered: Set[Any] = set()
+        for pattern in patterns:
+            if isinstance(pattern, CompiledPattern) and pattern._transformed_pattern_str.isascii():
+                filterable.append(pattern)
+            else:
+                self._unfiltered.add(pattern)
+
+        key = tuple((p._transformed_pattern_str, p.flags) for p in filterable)
+        with _hs_db_cache_lock:
+            cached = _hs_db_cache.get(key)
+            if cached is None:
+                cached = self._build_db(key)
+                _hs_db_cache[key] = cached
+        self._db, accepted = cached
+
+        self._filtered: List[Any] = [filterable[i] for i in accepted]
+        accepted_set = set(accepted)
+        self._unfiltered.update(p for i, p in enumerate(filterable) if i not in accepted_set)
+
+        # Scratch space must not be shared between concurrent scans
+        self._local = threading.local()
+
+    @classmethod
+    def _build_db(cls, sources: Sequence[Tuple[str, int]]) -> Tuple[Any, Tuple[int, ...]]:
+        """
+        Compile the patterns Hyperscan accepts into one database.
+
+        Args:
+            sources: (pattern, flags) of each pattern
+
+        Returns:
+            (database or None, positions of the patterns it contains)
+        """
+        try:
+            return cls._compile_db(sources), tuple(range(len(sources)))
+        except hyperscan.error:
+            pass
+
+        # Find the patterns Hyperscan rejects and leave them unfiltered
+        accepted = []
+        for i, source in enumerate(sources):
+            try:
+                cls._compile_db([source])
+                accepted.append(i)
+            except hyperscan.error as e:
+                logger.debug(f"Pattern {source[0]!r} not prefiltered by Hyperscan: {e}")
+        return cls._compile_db([sources[i] for i in accepted]), tuple(accepted)
+
+    @classmethod
+    def _compile_db(cls, sources: Sequence[Tuple[str, int]]) -> Any:
+        """Compile patterns into a Hyperscan block-mode database (None if empty)."""
+        if not sources:
+            return None
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pattern.encode("ascii") for pattern, _ in sources],
+            ids=list(range(len(sources))),
+            elements=len(sources),
+            flags=[cls._hs_flags(flags) for _, flags in sources],
+        )
+        return db
+
+    @staticmethod
+    def _hs_flags(flags: int) -> int:
+        """Convert internal flag values to Hyperscan prefilter flags."""
+        hs_flags = (
+            hyperscan.HS_FLAG_PREFILTER
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_ALLOWEMPTY
+        )
+        if flags & IGNORECASE:
+            hs_flags |= hyperscan.HS_FLAG_CASELESS
+        if flags & MULTILINE:
+            hs_flags |= hyperscan.HS_FLAG_MULTILINE
+        if flags & DOTALL:
+            hs_flags |= hyperscan.HS_FLAG_DOTALL
+        return hs_flags
+
+    def candidates(self, text: str) -> Optional[Set[Any]]:
+        """
+        Get the patterns that may match text.
+
+        Args:
+            text: Text about to be searched
+
+        Returns:
+            Set of patterns that may match (any pattern not in it cannot), or
+            None if the text is outside what the prefilter handles
+        """
+        if self._db is None or not text.isascii():
+            return None
+        if any(char in text for char in _HS_UNSAFE_CHARS):
+            return None
+
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._db)
+            self._local.scratch = scratch
+
+        found: Set[Any] = set(self._unfiltered)
+        filtered = self._filtered
+
+        def on_match(index: int, start: int, end: int, flags: int, context: Any) -> None:
+            found.add(filtered[index])
+
+        self._db.scan(text.encode("ascii"), match_event_handler=on_match, scratch=scratch)
+        return found
+
+
+# Bytes-mode scanning -------------------------------------------------------
+#
+# Scanning an ASCII text as bytes spares RE2 and PCRE2 re-encoding it for every
+# pattern, and byte offsets equal character offsets. ASCII patterns find the
+# same spans in both modes on ASCII text, except that re's str-mode \s also
+# matches \x1c-\x1f: texts containing those (or \x0b) keep the str path.
+
+
+def ascii_buffer(text: str) -> Optional[bytes]:
+    """
+    Encode a text for bytes-mode scanning (CompiledPattern.bytes_pattern).
+
+    Args:
+        text: Text about to be searched
+
+    Returns:
+        The text as ASCII bytes, or None if it must be scanned as str
+    """
+    if not text.isascii() or any(char in text for char in _HS_UNSAFE_CHARS):
+        return None
+    return text.encode("ascii")
+
+
+def _compiles_with_re(pattern: str, flags: int) -> bool:
+    """Return True if the standard re module accepts a pattern."""
+    try:
+        std_re.compile(pattern, _convert_flags_to_std_re(flags))
+    except std_re.error:
+        return False
+    return True
+
+
 class CompiledPattern:
     """Wrapper for compiled regex pattern with fullmatch support.
 
     Uses RE2 when available for ReDoS protection, otherwise falls back
-    to Python's standard re module.
+    to Python's standard re module, or JIT-compiled PCRE2 if selected with
+    set_engine(RegexEngine.PCRE2). backend tells which one compiled it.
     """
 
     def __init__(
@@ -276,7 +1064,8 @@ class CompiledPattern:
         self.pattern_str = pattern
         self.flags = flags
         self.pattern_id = pattern_id
-        self._using_re2 = _should_use_re2()
+        self._backend = _select_backend()
+        self._using_re2 = self._backend == "re2"
 
         # Transform pattern for Unicode compatibility
         # First convert \uXXXX escapes to actual characters
@@ -284,43 +1073,129 @@ class CompiledPattern:
         # Then handle \b word boundaries for Unicode patterns
         transformed_pattern = _transform_word_boundaries(transformed_pattern)
         self._transformed_pattern_str = transformed_pattern
+        self.required_literals = required_literals(transformed_pattern, flags)
 
         if self._using_re2:
-            # Apply MULTILINE flag via (?m) prefix for RE2
-            re2_pattern = _apply_multiline_flag(transformed_pattern, flags)
+            try:
+                self._compile_re2(transformed_pattern, flags)
+            except re2.error as e:
+                # In AUTO mode, patterns using features RE2 lacks (lookaround,
+                # backreferences) fall back to the standard re module
+                if _engine_preference != RegexEngine.AUTO or not _compiles_with_re(
+                    transformed_pattern, flags
+                ):
+                    raise
+                logger.debug(
+                    "Pattern %s not supported by RE2, using standard re: %s",
+                    pattern_id or pattern,
+                    e,
+                )
+                self._backend = "re"
+                self._using_re2 = False
+        elif self._backend == "pcre2":
+            try:
+                self._compile_pcre2(transformed_pattern, flags)
+            except pcre2.error as e:
+                # re syntax PCRE2 does not accept (e.g. \N{...} escapes)
+                logger.debug(
+                    "Pattern %s not supported by PCRE2, using standard re: %s",
+                    pattern_id or pattern,
+                    e,
+                )
+                self._backend = "re"
+
+        if self._backend == "re":
+            # Use standard re module
+            std_flags = _convert_flags_to_std_re(flags)
+            self._pattern: Union[re2._Pattern, std_re.Pattern[str]] = std_re.compile(
+                transformed_pattern, std_flags
+            )
+            self._anchored_pattern_str = f"^(?:{transformed_pattern})$"
+            self._anchored_pattern: Union[re2._Pattern, std_re.Pattern[str]] = std_re.compile(
+                self._anchored_pattern_str, std_flags
+            )
 
-            # Create options from flags
-            options = _create_options(flags, using_re2=True)
+        # RE2 is linear-time; backtracking backends may blow up on these
+        self.exponential_backtracking = self._backend != "re2" and has_exponential_backtracking(
+            transformed_pattern, flags
+        )
+        self.bytes_pattern = self._compile_bytes(transformed_pattern, flags)
 
-            # Compile the main pattern with RE2
-            self._pattern: Union[re2._Pattern, std_re.Pattern[str]] = re2.compile(
-                re2_pattern, options=options
-            )
+    def _compile_bytes(self, transformed_pattern: str, flags: int) -> Any:
+        """
+        Compile a bytes-mode copy of an ASCII pattern with the same backend.
+
+        The copy is meant for ascii_buffer() texts, where it finds the same
+        spans as the str pattern without decoding or re-encoding the text.
 
-            # Pre-compile anchored version for fullmatch emulation
-            # Wrap in non-capturing group to preserve alternation behavior
-            self._anchored_pattern_str = f"^(?:{re2_pattern})$"
-            self._anchored_pattern: Union[re2._Pattern, std_re.Pattern[str]] = re2.compile(
-                self._anchored_pattern_str, options=options
+        Returns:
+            Compiled bytes pattern, or None for non-ASCII patterns (their
+            classes and literals only keep their meaning in str mode) and
+            patterns the backend rejects in bytes mode
+        """
+        if not transformed_pattern.isascii():
+            return None
+        try:
+            if self._backend == "re2":
+                source = _apply_multiline_flag(transformed_pattern, flags).encode("ascii")
+                return re2.compile(source, options=_create_options(flags, using_re2=True))
+            source = transformed_pattern.encode("ascii")
+            if self._backend == "pcre2":
+                return pcre2.compile(source, _convert_flags_to_pcre2(flags), jit=True)
+            return std_re.compile(source, _convert_flags_to_std_re(flags))
+        except Exception as e:
+            logger.debug(
+                "Pattern %s has no bytes-mode copy: %s", self.pattern_id or self.pattern_str, e
             )
-        else:
-            # Use standard re module
-            std_flags = _convert_flags_to_std_re(flags)
-            self._pattern = std_re.compile(transformed_pattern, std_flags)
-            self._anchored_pattern_str = f"^(?:{transformed_pattern})$"
-            self._anchored_pattern = std_re.compile(self._anchored_pattern_str, std_flags)
+            return None
 
-    def finditer(self, text: str) -> Iterator[Union["re2._Match", std_re.Match[str]]]:
-        """Find all matches in text."""
-        return self._pattern.finditer(text)
+    def _compile_re2(self, transformed_pattern: str, flags: int) -> None:
+        """Compile the main and anchored patterns with RE2."""
+        # Apply MULTILINE flag via (?m) prefix for RE2
+        re2_pattern = _apply_multiline_flag(transformed_pattern, flags)
+
+        # Create options from flags
+        options = _create_options(flags, using_re2=True)
+
+        # Compile the main pattern with RE2
+        self._pattern = re2.compile(re2_pattern, options=options)
+
+        # Pre-compile anchored version for fullmatch emulation
+        # Wrap in non-capturing group to preserve alternation behavior
+        self._anchored_pattern_str = f"^(?:{re2_pattern})$"
+        self._anchored_pattern = re2.compile(self._anchored_pattern_str, options=options)
+
+    def _compile_pcre2(self, transformed_pattern: str, flags: int) -> None:
+        """Compile the main and anchored patterns with JIT-enabled PCRE2."""
+        pcre2_flags = _convert_flags_to_pcre2(flags)
+        self._pattern = pcre2.compile(transformed_pattern, pcre2_flags, jit=True)
+        self._anchored_pattern_str = f"^(?:{transformed_pattern})$"
+        self._anchored_pattern = pcre2.compile(self._anchored_pattern_str, pcre2_flags, jit=True)
+
+    def finditer(self, text: str, pos: int = 0) -> Iterator[Union["re2._Match", std_re.Match[str]]]:
+        """
+        Find all matches in text.
+
+        Args:
+            text: Text to search
+            pos: Offset to start scanning at. As with re, anchors and
+                 lookbehinds still see the text before it.
+        """
+        return self._pattern.finditer(text, pos)
 
     def findall(self, text: str) -> List[str]:
         """Find all matches and return as list."""
         return self._pattern.findall(text)
 
-    def search(self, text: str) -> Optional[Union["re2._Match", std_re.Match[str]]]:
-        """Search for pattern in text."""
-        return self._pattern.search(text)
+    def search(self, text: str, pos: int = 0) -> Optional[Union["re2._Match", std_re.Match[str]]]:
+        """
+        Search for pattern in text.
+
+        Args:
+            text: Text to search
+            pos: Offset to start scanning at, as for finditer()
+        """
+        return self._pattern.search(text, pos)
 
     def match(self, text: str) -> Optional[Union["re2._Match", std_re.Match[str]]]:
         """Match pattern at start of text."""
@@ -350,10 +1225,19 @@ class CompiledPattern:
         """Return the original pattern string."""
         return self.pattern_str
 
+    @property
+    def using_re2(self) -> bool:
+        """Return True if compiled with RE2, False for the standard re module."""
+        return self._using_re2
+
+    @property
+    def backend(self) -> str:
+        """Return the backend the pattern was compiled with: "re2", "pcre2" or "re"."""
+        return self._backend
+
     def __repr__(self) -> str:
         """String representation."""
-        backend = "re2" if self._using_re2 else "re"
-        return f"CompiledPattern({self.pattern_str!r}, flags={self.flags}, backend={backend})"
+        return f"CompiledPattern({self.pattern_str!r}, flags={self.flags}, backend={self._backend})"
 
 
 def compile(
@@ -364,6 +1248,10 @@ def compile(
     """
     Compile a regex pattern using RE2.
 
+    Compiled patterns are cached process-wide, so loading the same pattern
+    files again (e.g. several registries or engines in one process) reuses
+    the already-compiled automata instead of recompiling them.
+
     Args:
         pattern: Regex pattern string
         flags: Regex flags (IGNORECASE, MULTILINE, DOTALL)
@@ -373,9 +1261,25 @@ def compile(
         CompiledPattern wrapper
 
     Raises:
-        re2.error: If pattern is invalid or uses unsupported features
+        re2.error: If pattern is invalid, or uses features RE2 lacks while
+            RE2 is forced (set_engine(RegexEngine.RE2))
     """
-    return CompiledPattern(pattern, flags, pattern_id)
+    key = (pattern, flags, pattern_id, _select_backend())
+    compiled = _compile_cache.get(key)
+    if compiled is not None:
+        return compiled
+
+    compiled = CompiledPattern(pattern, flags, pattern_id)
+    with _compile_cache_lock:
+        return _compile_cache.setdefault(key, compiled)
+
+
+def clear_cache() -> None:
+    """Drop all cached compiled patterns (including Hyperscan databases)."""
+    with _compile_cache_lock:
+        _compile_cache.clear()
+    with _hs_db_cache_lock:
+        _hs_db_cache.clear()
 
 
 def convert_flags(flag_names: List[str]) -> int:
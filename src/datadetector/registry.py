@@ -1,8 +1,11 @@
 """Pattern registry for loading and managing regex patterns."""
 
+import functools
+import itertools
 import logging
+import operator
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import jsonschema
 import yaml
@@ -16,10 +19,14 @@ from datadetector.models import (
     Policy,
     Severity,
 )
+from datadetector.utils.yaml_utils import SafeLoader
 from datadetector.verification import get_verification_function
 
 logger = logging.getLogger(__name__)
 
+# Detection order: lower priority value first, ties broken by full id
+_PRIORITY_ORDER = operator.attrgetter("priority", "full_id")
+
 
 class PatternRegistry:
     """Registry for compiled patterns."""
@@ -29,6 +36,11 @@ class PatternRegistry:
         self.patterns: Dict[str, Pattern] = {}  # full_id -> Pattern
         self.namespaces: Dict[str, List[Pattern]] = {}  # namespace -> [Pattern]
         self._version: int = 0
+        # namespaces -> patterns in detection order, and the same split into
+        # priority groups with their union prefilters (reset on changes)
+        self._sorted_by_ns: Dict[Tuple[str, ...], List[Pattern]] = {}
+        self._groups_by_ns: Dict[Tuple[str, ...], List[Tuple[Any, List[Pattern]]]] = {}
+        self._prefilter_by_ns: Dict[Tuple[str, ...], Optional[Any]] = {}
 
     def add_pattern(self, pattern: Pattern) -> None:
         """Add a pattern to the registry."""
@@ -45,6 +57,9 @@ class PatternRegistry:
             self.namespaces[pattern.namespace].append(pattern)
 
         self._version += 1
+        self._sorted_by_ns.clear()
+        self._groups_by_ns.clear()
+        self._prefilter_by_ns.clear()
 
     def get_pattern(self, ns_id: str) -> Optional[Pattern]:
         """Get pattern by full namespace/id."""
@@ -54,6 +69,97 @@ class PatternRegistry:
         """Get all patterns for a namespace."""
         return self.namespaces.get(namespace, [])
 
+    def get_sorted_patterns(self, namespaces: Sequence[str]) -> List[Pattern]:
+        """
+        Get the patterns of several namespaces in detection order.
+
+        Patterns are ordered by priority (lower = higher priority), then full id.
+        The result is cached per namespace list until the registry changes, so
+        callers must not modify it.
+
+        Args:
+            namespaces: Namespaces to include
+
+        Returns:
+            Sorted list of patterns (shared, read-only)
+        """
+        key = tuple(namespaces)
+        patterns = self._sorted_by_ns.get(key)
+        if patterns is None:
+            patterns = []
+            for ns in key:
+                patterns.extend(self.get_namespace_patterns(ns))
+            patterns.sort(key=_PRIORITY_ORDER)
+            self._sorted_by_ns[key] = patterns
+        return patterns
+
+    def get_priority_groups(self, namespaces: Sequence[str]) -> List[Tuple[Any, List[Pattern]]]:
+        """
+        Get the patterns of several namespaces split into priority groups.
+
+        Groups follow detection order (see get_sorted_patterns()). Each comes
+        with a union regex (regex_compat.compile_union()) whose search() finds
+        the leftmost offset at which any pattern of the group matches, or None
+        for single-pattern groups and patterns that cannot be combined.
+
+        Unions are only built for RE2 patterns: RE2 scans the text once however
+        many branches there are, while the backtracking re module tries every
+        branch at every offset, so a union costs as much as the separate scans.
+        The result is cached like get_sorted_patterns(); callers must not
+        modify it.
+
+        Args:
+            namespaces: Namespaces to include
+
+        Returns:
+            List of (union or None, patterns) tuples
+        """
+        key = tuple(namespaces)
+        groups = self._groups_by_ns.get(key)
+        if groups is None:
+            groups = []
+            patterns = self.get_sorted_patterns(key)
+            for _, group_iter in itertools.groupby(patterns, key=operator.attrgetter("priority")):
+                group = list(group_iter)
+                union = None
+                if len(group) > 1 and all(_runs_on_re2(p) for p in group):
+                    union = regex_compat.compile_union([p.compiled for p in group])
+                groups.append((union, group))
+            self._groups_by_ns[key] = groups
+        return groups
+
+    def get_multi_prefilter(
+        self, namespaces: Sequence[str]
+    ) -> Optional[regex_compat.MultiPatternPrefilter]:
+        """
+        Get a Hyperscan prefilter over the patterns of several namespaces.
+
+        Built on first use (compiling the Hyperscan database takes a while)
+        and cached until the registry changes.
+
+        Args:
+            namespaces: Namespaces to include
+
+        Returns:
+            MultiPatternPrefilter, or None if hyperscan is not installed or
+            could not compile the patterns
+        """
+        if not regex_compat.HAS_HYPERSCAN:
+            return None
+
+        key = tuple(namespaces)
+        if key not in self._prefilter_by_ns:
+            compiled = [p.compiled for p in self.get_sorted_patterns(key)]
+            try:
+                prefilter: Optional[regex_compat.MultiPatternPrefilter] = (
+                    regex_compat.MultiPatternPrefilter(compiled)
+                )
+            except Exception as e:
+                logger.warning(f"Hyperscan prefilter unavailable: {e}")
+                prefilter = None
+            self._prefilter_by_ns[key] = prefilter
+        return self._prefilter_by_ns[key]
+
     def get_all_patterns(self) -> List[Pattern]:
         """Get all patterns in registry."""
         return list(self.patterns.values())
@@ -75,6 +181,18 @@ class PatternRegistry:
         )
 
 
+def _runs_on_re2(pattern: Pattern) -> bool:
+    """Return True if a pattern was compiled with the RE2 backend."""
+    compiled = pattern.compiled
+    return isinstance(compiled, regex_compat.CompiledPattern) and compiled.using_re2
+
+
+def _backtracks_exponentially(pattern: Pattern) -> bool:
+    """Return True if a pattern's backtracking backend may take exponential time."""
+    compiled = pattern.compiled
+    return isinstance(compiled, regex_compat.CompiledPattern) and compiled.exponential_backtracking
+
+
 def _get_project_root() -> Path:
     """Determine project root directory."""
     # 1. Try relative to this file
@@ -109,6 +227,7 @@ def load_registry(
     paths: Optional[List[str]] = None,
     validate_schema: bool = True,
     validate_examples: bool = True,
+    reject_exponential_backtracking: bool = True,
 ) -> PatternRegistry:
     """
     Load patterns from YAML files into registry.
@@ -119,15 +238,20 @@ def load_registry(
                If None, loads default patterns.
         validate_schema: Whether to validate against JSON schema
         validate_examples: Whether to validate examples against patterns
+        reject_exponential_backtracking: Whether to skip (with a warning) patterns
+               a backtracking backend (re, PCRE2) could take exponential time
+               on, e.g. (a+)+. Patterns compiled with RE2 are never skipped.
 
     Returns:
         PatternRegistry with loaded patterns
 
     Raises:
         FileNotFoundError: If pattern file not found
-        ValueError: If pattern validation fails
+        ValueError: If pattern validation fails. Example failures from all
+                    patterns are collected and reported together.
     """
     registry = PatternRegistry()
+    example_errors: List[str] = []
 
     if paths is None:
         # Load default patterns from package
@@ -180,23 +304,47 @@ def load_registry(
             patterns = _parse_pattern_file(data)
 
             for pattern in patterns:
+                if reject_exponential_backtracking and _backtracks_exponentially(pattern):
+                    logger.warning(
+                        f"Skipping pattern {pattern.full_id}: its regex can take exponential "
+                        f"time on the {pattern.compiled.backend} backend (catastrophic "
+                        "backtracking). Rewrite it or install google-re2."
+                    )
+                    continue
                 if validate_examples and pattern.examples:
-                    _validate_examples(pattern)
+                    errors = _example_errors(pattern)
+                    if errors:
+                        example_errors.append(_format_example_errors(pattern, errors))
                 registry.add_pattern(pattern)
 
+    if example_errors:
+        raise ValueError("\n\n".join(example_errors))
+
     logger.info(f"Loaded {len(registry)} patterns from {len(registry.namespaces)} namespaces")
     return registry
 
 
 def _load_yaml_file(path: Path) -> Dict[str, Any]:
     """Load YAML file."""
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    # Binary stream: the parser decodes and buffers the file itself
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=SafeLoader)
         if not isinstance(data, dict):
             raise ValueError(f"Expected YAML file to contain a dict, got {type(data)}")
         return data
 
 
+@functools.lru_cache(maxsize=None)
+def _get_schema_validator(schema_path: Path) -> Any:
+    """Load the pattern schema once and build a reusable validator for it."""
+    with open(schema_path, encoding="utf-8") as f:
+        schema = yaml.safe_load(f)
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def _validate_schema(data: Dict[str, Any]) -> None:
     """Validate pattern data against JSON schema."""
     schema_path = _get_project_root() / "schemas" / "pattern-schema.json"
@@ -205,13 +353,10 @@ def _validate_schema(data: Dict[str, Any]) -> None:
         logger.warning("Pattern schema not found, skipping validation")
         return
 
-    with open(schema_path, encoding="utf-8") as f:
-        schema = yaml.safe_load(f)
-
-    try:
-        jsonschema.validate(data, schema)
-    except jsonschema.ValidationError as e:
-        raise ValueError(f"Pattern schema validation failed: {e.message}") from e
+    validator = _get_schema_validator(schema_path)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
+        raise ValueError(f"Pattern schema validation failed: {error.message}")
 
 
 def _parse_pattern_file(data: Dict[str, Any]) -> List[Pattern]:
@@ -298,13 +443,20 @@ def _compile_pattern(namespace: str, data: Dict[str, Any]) -> Pattern:
         verification_func=verification_func,
         priority=priority,
         match_type=match_type,
+        required_literals=compiled.required_literals,
+        compiled_bytes=compiled.bytes_pattern,
     )
 
 
-def _validate_examples(pattern: Pattern) -> None:
-    """Validate pattern examples match/nomatch expectations."""
+def _format_example_errors(pattern: Pattern, errors: List[str]) -> str:
+    """Format example validation errors for one pattern."""
+    return f"Pattern {pattern.full_id} example validation failed:\n" + "\n".join(errors)
+
+
+def _example_errors(pattern: Pattern) -> List[str]:
+    """Return the example match/nomatch violations of a pattern."""
     if not pattern.examples:
-        return
+        return []
 
     errors = []
 
@@ -332,8 +484,4 @@ def _validate_examples(pattern: Pattern) -> None:
                 # No verification function, so regex match means it matched
                 errors.append(f"Example should NOT match but does: '{example}'")
 
-    if errors:
-        error_msg = f"Pattern {pattern.full_id} example validation failed:\n" + "\n".join(errors)
-        raise ValueError(error_msg)
-
-    logger.debug(f"Pattern {pattern.full_id} examples validated successfully")
+    return errors
@@ -15,7 +15,7 @@ else:
 
     async def to_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Compatibility function for asyncio.to_thread (Python 3.9+)."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
 
 
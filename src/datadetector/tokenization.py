@@ -1,14 +1,42 @@
 """Reversible PII tokenization for RAG storage layer."""
 
 import hashlib
+import itertools
+import json
 import logging
-from typing import Dict, List, Optional, Tuple
+import mmap
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from datadetector.engine import Engine
+from datadetector.engine import Engine, _apply_replacements
 from datadetector.rag_models import TokenMap
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for token map serialization when available (C extension,
+# several times faster than the stdlib json module)
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+
+def _dumps(tokens: Dict[str, str]) -> bytes:
+    """Serialize a token mapping to UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(tokens, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(tokens, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: Union[bytes, memoryview]) -> Any:
+    """Deserialize UTF-8 JSON bytes (or a buffer over them)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(bytes(data).decode("utf-8"))
+
 
 class SecureTokenizer:
     """
@@ -36,7 +64,8 @@ class SecureTokenizer:
         self.engine = engine
         self.token_prefix = token_prefix
         self.use_stable_tokens = use_stable_tokens
-        self._token_counter = 0
+        # itertools.count is safe to advance from concurrent executor threads
+        self._token_counter = itertools.count()
 
     def tokenize_with_map(
         self,
@@ -76,9 +105,9 @@ class SecureTokenizer:
 
         # Build token map
         token_map = TokenMap()
-        sanitized = text
+        replacements: List[Tuple[int, int, str]] = []
 
-        # Process matches in reverse order to preserve positions
+        # Process matches in reverse order (token numbering follows it)
         for match in reversed(result.matches):
             original_value = text[match.start : match.end]
 
@@ -91,9 +120,11 @@ class SecureTokenizer:
 
             # Add to map
             token_map.add(token, original_value)
+            replacements.append((match.start, match.end, token))
 
-            # Replace in text
-            sanitized = sanitized[: match.start] + token + sanitized[match.end :]
+        # Replace in text, in one pass over the position-sorted matches
+        replacements.reverse()
+        sanitized = _apply_replacements(text, replacements)
 
         # Generate hash for secure storage
         token_map.hash = self._hash_token_map(token_map.tokens)
@@ -158,8 +189,7 @@ class SecureTokenizer:
             return f"[{self.token_prefix}:{namespace}:{category}:{value_hash}]"
         else:
             # Random token
-            token_id = self._token_counter
-            self._token_counter += 1
+            token_id = next(self._token_counter)
             return f"[{self.token_prefix}:{namespace}:{category}:{token_id}]"
 
     def _hash_token_map(self, tokens: Dict[str, str]) -> str:
@@ -201,9 +231,7 @@ class SecureTokenizer:
 
         # TODO: Implement proper encryption using cryptography library
         # For now, just return JSON bytes
-        import json
-
-        data = json.dumps(token_map.tokens).encode()
+        data = self.to_bytes(token_map)
 
         logger.warning(
             "Token map encryption not implemented. "
@@ -234,10 +262,72 @@ class SecureTokenizer:
         _ = encryption_key  # Suppress unused parameter warning
 
         # TODO: Implement proper decryption
-        import json
+        return self.from_bytes(encrypted_data)
+
+    def to_bytes(self, token_map: TokenMap) -> bytes:
+        """
+        Serialize a token map to JSON bytes.
 
-        tokens = json.loads(encrypted_data.decode())
+        Uses orjson when installed, otherwise the stdlib json module.
+
+        Args:
+            token_map: Token map to serialize
+
+        Returns:
+            UTF-8 encoded JSON of the token -> original mapping
+        """
+        return _dumps(token_map.tokens)
+
+    def from_bytes(self, data: Union[bytes, memoryview]) -> TokenMap:
+        """
+        Rebuild a token map from bytes produced by to_bytes().
+
+        Args:
+            data: Serialized token map (bytes or any buffer over them)
+
+        Returns:
+            TokenMap with its verification hash recomputed
+        """
+        tokens = _loads(data)
         token_map = TokenMap(tokens=tokens)
         token_map.hash = self._hash_token_map(tokens)
 
         return token_map
+
+    def save_token_map(self, token_map: TokenMap, path: Union[str, Path]) -> None:
+        """
+        Persist a token map to disk for later reversal.
+
+        Args:
+            token_map: Token map to store
+            path: Destination file path
+        """
+        Path(path).write_bytes(self.to_bytes(token_map))
+
+    def load_token_map(self, path: Union[str, Path]) -> TokenMap:
+        """
+        Load a token map written by save_token_map().
+
+        The file is memory-mapped and, with orjson, parsed straight from the
+        mapping without copying it into an intermediate bytes object.
+
+        Args:
+            path: Path of the stored token map
+
+        Returns:
+            Loaded TokenMap
+
+        Raises:
+            ValueError: If the file is empty or not a serialized token map
+        """
+        with open(path, "rb") as f:
+            # save_token_map() always writes at least "{}", and an empty file
+            # cannot be memory-mapped
+            if Path(path).stat().st_size == 0:
+                raise ValueError(f"Token map file is empty: {path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return self.from_bytes(view)
+                finally:
+                    view.release()
@@ -0,0 +1,55 @@
+"""Span bookkeeping helpers for match overlap checks."""
+
+from bisect import bisect_right, insort
+from sys import maxsize
+from typing import List, Tuple
+
+
+class SpanSet:
+    """
+    Set of mutually non-overlapping (start, end) spans.
+
+    Accepted spans never overlap, so ordering them by end also orders them by
+    start: a candidate can only overlap the first accepted span ending after
+    its start. overlaps() and add() are O(log n) searches instead of a scan
+    over every accepted span.
+
+    Overlap follows the engines' _spans_overlap(): spans that merely touch do
+    not overlap, and an empty span overlaps a span strictly containing it.
+    """
+
+    __slots__ = ("_spans",)
+
+    def __init__(self) -> None:
+        """Initialize an empty span set."""
+        self._spans: List[Tuple[int, int]] = []  # (end, start), sorted
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """
+        Check whether a span overlaps any span in the set.
+
+        Args:
+            start: Span start offset
+            end: Span end offset (exclusive)
+
+        Returns:
+            True if the span overlaps an accepted span
+        """
+        # First accepted span with end > start; ties on end are ordered by
+        # start, so it also has the smallest start among them
+        idx = bisect_right(self._spans, (start, maxsize))
+        return idx < len(self._spans) and self._spans[idx][1] < end
+
+    def add(self, start: int, end: int) -> None:
+        """
+        Add a span, which must not overlap the spans already in the set.
+
+        Args:
+            start: Span start offset
+            end: Span end offset (exclusive)
+        """
+        insort(self._spans, (end, start))
+
+    def __len__(self) -> int:
+        """Return number of spans."""
+        return len(self._spans)
@@ -1,13 +1,39 @@
 """YAML file read/write utilities for data-detector."""
 
+import copy
+import functools
 import logging
+import os
+import shutil
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml-backed C loader/dumper when PyYAML was built with it,
+# fall back to the pure-Python implementations otherwise
+try:
+    from yaml import CDumper as Dumper
+    from yaml import CSafeLoader as SafeLoader
+
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import Dumper, SafeLoader  # type: ignore[assignment]
+
+    HAS_LIBYAML = False
+    logger.info(
+        "libyaml not available, using the pure-Python YAML parser. "
+        "Install PyYAML with libyaml support for faster pattern file loading."
+    )
+
+
+# Emitter line width large enough that no scalar is ever wrapped (libyaml takes a C int)
+_NO_LINE_WRAP = 2**31 - 1
+
 
 class YAMLHandler:
     """Handler for reading and writing YAML files."""
@@ -32,9 +58,11 @@ class YAMLHandler:
         if not path.exists():
             raise FileNotFoundError(f"YAML file not found: {path}")
 
-        with open(path, encoding="utf-8") as f:
+        # Hand the binary stream straight to the parser: it detects the encoding
+        # and buffers reads itself, without a Python-level decode step
+        with open(path, "rb") as f:
             try:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
             except yaml.YAMLError as e:
                 raise ValueError(f"Invalid YAML in {path}: {e}") from e
 
@@ -75,16 +103,35 @@ class YAMLHandler:
         # Create parent directory if it doesn't exist
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.dump(
-                data,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=sort_keys,
-                indent=2,
-            )
-
+        # Write to a temporary file next to the target and rename it into place,
+        # so concurrent readers see either the old or the new file, never a
+        # partially written one
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=Dumper,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                    sort_keys=sort_keys,
+                    indent=2,
+                    # Never fold long scalars (e.g. regexes) across lines
+                    width=_NO_LINE_WRAP,
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            if path.exists():
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+        # In-process writes can land within the filesystem's mtime granularity
+        _parse_yaml_cached.cache_clear()
         logger.info(f"Successfully wrote YAML file: {path}")
 
     @staticmethod
@@ -120,6 +167,36 @@ class YAMLHandler:
         return data
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, mtime, size); the result is shared."""
+    return YAMLHandler.read_yaml(path)
+
+
+def _read_yaml_cached(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read YAML file through the parse cache.
+
+    Modifying the file changes its mtime/size and therefore misses the cache.
+    The returned dictionary is shared between callers and must not be mutated.
+
+    Args:
+        file_path: Path to YAML file
+
+    Returns:
+        Dictionary containing YAML contents
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    path = Path(file_path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found: {path}") from None
+    return _parse_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 class PatternFileHandler:
     """Handler for creating and managing pattern YAML files."""
 
@@ -170,6 +247,37 @@ class PatternFileHandler:
         YAMLHandler.write_yaml(file_path, data, overwrite=overwrite)
         logger.info(f"Created pattern file: {file_path}")
 
+    @staticmethod
+    @contextmanager
+    def edit(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+        """
+        Load a pattern file once, yield it for changes and write it back once.
+
+        Use this to batch several modifications into a single read/write cycle.
+        The file is left untouched if the block raises.
+
+        Args:
+            file_path: Path to pattern file
+
+        Yields:
+            File contents, with a "patterns" list always present
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+
+        Example:
+            >>> with PatternFileHandler.edit("my_patterns.yml") as data:
+            ...     data["patterns"].append(new_pattern)
+            ...     data["patterns"][0]["policy"]["severity"] = "high"
+        """
+        data = YAMLHandler.read_yaml(file_path)
+        data.setdefault("patterns", [])
+
+        yield data
+
+        YAMLHandler.write_yaml(file_path, data, overwrite=True)
+        logger.info(f"Saved edits to {file_path}")
+
     @staticmethod
     def add_pattern_to_file(
         file_path: Union[str, Path],
@@ -305,14 +413,15 @@ class PatternFileHandler:
         Returns:
             Pattern dictionary if found, None otherwise
         """
-        data = YAMLHandler.read_yaml(file_path)
+        data = _read_yaml_cached(file_path)
 
         if "patterns" not in data:
             return None
 
         for pattern in data["patterns"]:
             if pattern.get("id") == pattern_id:
-                return pattern
+                # Copy so callers cannot modify the cached file contents
+                return copy.deepcopy(pattern)
 
         return None
 
@@ -329,7 +438,7 @@ class PatternFileHandler:
         Returns:
             List of pattern IDs
         """
-        data = YAMLHandler.read_yaml(file_path)
+        data = _read_yaml_cached(file_path)
 
         if "patterns" not in data:
             return []
@@ -360,3 +469,17 @@ def update_yaml(
 ) -> Dict[str, Any]:
     """Update YAML file. Convenience wrapper for YAMLHandler.update_yaml()."""
     return YAMLHandler.update_yaml(file_path, updates, merge=merge)
+
+
+# SafeLoader and Dumper are the libyaml-backed classes when available; other
+# modules import SafeLoader from here to share that choice
+__all__ = [
+    "HAS_LIBYAML",
+    "SafeLoader",
+    "Dumper",
+    "YAMLHandler",
+    "PatternFileHandler",
+    "read_yaml",
+    "write_yaml",
+    "update_yaml",
+]
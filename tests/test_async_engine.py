@@ -1,11 +1,20 @@
 """Tests for AsyncEngine."""
 
 import asyncio
+import hashlib
 
 import pytest
 
-from datadetector import AsyncEngine, load_registry
-from datadetector.models import RedactionStrategy
+from datadetector import AsyncEngine, load_registry, regex_compat
+from datadetector.models import (
+    ActionOnMatch,
+    Category,
+    Pattern,
+    Policy,
+    RedactionStrategy,
+    Severity,
+)
+from datadetector.registry import PatternRegistry
 
 
 @pytest.fixture
@@ -16,8 +25,9 @@ def registry():
 
 @pytest.fixture
 def async_engine(registry):
-    """Create async engine."""
-    return AsyncEngine(registry)
+    """Create async engine, shutting its executor down afterwards."""
+    with AsyncEngine(registry) as engine:
+        yield engine
 
 
 class TestAsyncFind:
@@ -72,6 +82,62 @@ class TestAsyncFind:
         # Should only find Korean patterns
         assert all(m.namespace == "kr" for m in result.matches)
 
+    @pytest.mark.asyncio
+    async def test_find_overlap_handling(self, async_engine):
+        """Test accepted matches never overlap unless overlaps are allowed."""
+        text = "Call 010-9876-5432 or mail kim.jisoo@corpmail.net, card 4111111111111111"
+
+        result = await async_engine.find(text)
+        spans = sorted(m.span for m in result.matches)
+        assert spans
+        assert all(prev[1] <= cur[0] for prev, cur in zip(spans, spans[1:]))
+
+        with_overlaps = await async_engine.find(text, allow_overlaps=True)
+        assert len(with_overlaps.matches) >= len(result.matches)
+
+    @pytest.mark.asyncio
+    async def test_verification_runs_once_per_value(self):
+        """Test verification skips overlapping spans and repeated values."""
+        verified = []
+
+        def verify(value):
+            verified.append(value)
+            return value != "2222"
+
+        registry = PatternRegistry()
+        for pattern_id, priority, regex, verification_func in [
+            ("long_01", 10, r"\d{6}", None),
+            ("short_01", 20, r"\d{4}", verify),
+        ]:
+            registry.add_pattern(
+                Pattern(
+                    id=pattern_id,
+                    namespace="test",
+                    location="test",
+                    category=Category.OTHER,
+                    pattern=regex,
+                    compiled=regex_compat.compile(regex),
+                    description="Test",
+                    flags=[],
+                    mask=None,
+                    examples=None,
+                    policy=Policy(
+                        store_raw=False,
+                        action_on_match=ActionOnMatch.REDACT,
+                        severity=Severity.LOW,
+                    ),
+                    metadata={},
+                    verification=None,
+                    verification_func=verification_func,
+                    priority=priority,
+                )
+            )
+
+        result = await AsyncEngine(registry).find("123456 1111 1111 2222 2222")
+
+        assert [m.pattern_id for m in result.matches] == ["long_01", "short_01", "short_01"]
+        assert verified == ["1111", "2222"]
+
 
 class TestAsyncFindBatch:
     """Tests for batch async find operations."""
@@ -115,6 +181,22 @@ class TestAsyncFindBatch:
         results = await async_engine.find_batch([])
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [1, 3, 100])
+    async def test_find_batch_chunk_size(self, async_engine, chunk_size):
+        """Test results keep the input order whatever the chunk size."""
+        texts = [f"Email{i}: user{i}@corpmail.net" if i % 2 else "no pii" for i in range(7)]
+        results = await async_engine.find_batch(texts, chunk_size=chunk_size)
+
+        assert [r.text for r in results] == texts
+        assert [r.has_matches for r in results] == [i % 2 == 1 for i in range(7)]
+
+    @pytest.mark.asyncio
+    async def test_find_batch_invalid_chunk_size(self, async_engine):
+        """Test non-positive chunk sizes are rejected."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            await async_engine.find_batch(["text"], chunk_size=0)
+
 
 class TestAsyncValidate:
     """Tests for async validate operations."""
@@ -224,6 +306,20 @@ class TestAsyncRedact:
         assert "[TOKEN:" in result.redacted_text
         assert "user@example.com" not in result.redacted_text
 
+    @pytest.mark.asyncio
+    async def test_redact_mask_uses_span_length(self, registry):
+        """Test that masks follow the pattern mask or the span length."""
+        engine = AsyncEngine(registry, default_mask_char="#")
+        text = "Email: joe@corpmail.net, Phone: 010-9876-5432"
+        result = await engine.redact(text)
+
+        expected = text
+        for match in reversed(result.matches):
+            mask = match.mask or "#" * (match.end - match.start)
+            expected = expected[: match.start] + mask + expected[match.end :]
+        assert result.redaction_count >= 2
+        assert result.redacted_text == expected
+
     @pytest.mark.asyncio
     async def test_redact_no_pii(self, async_engine):
         """Test redaction with no PII."""
@@ -278,10 +374,37 @@ class TestAsyncRedactBatch:
         # Should complete reasonably quickly
         assert batch_time < 5.0
 
+    @pytest.mark.asyncio
+    async def test_redact_batch_chunk_size(self, async_engine):
+        """Test chunked redaction matches redacting texts one by one."""
+        texts = [f"Email: user{i}@corpmail.net" for i in range(5)]
+        results = await async_engine.redact_batch(texts, chunk_size=2)
+        expected = [await async_engine.redact(text) for text in texts]
+
+        assert [r.redacted_text for r in results] == [r.redacted_text for r in expected]
+
 
 class TestAsyncEngineConfiguration:
     """Tests for async engine configuration."""
 
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_executor(self, registry):
+        """Test leaving an async with block shuts the executor down."""
+        async with AsyncEngine(registry) as engine:
+            result = await engine.find("Email: user@example.com")
+
+        assert result.has_matches
+        with pytest.raises(RuntimeError):
+            await engine.find("Email: user@example.com")
+
+    def test_context_manager_closes_executor(self, registry):
+        """Test leaving a with block shuts the executor down."""
+        with AsyncEngine(registry) as engine:
+            assert asyncio.run(engine.find("Email: user@example.com")).has_matches
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(engine.find("Email: user@example.com"))
+
     @pytest.mark.asyncio
     async def test_custom_mask_char(self, registry):
         """Test custom mask character."""
@@ -301,6 +424,56 @@ class TestAsyncEngineConfiguration:
 
         assert "[HASH:" in result.redacted_text
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("algorithm", ["sha256", "blake2b", "SHA256"])
+    async def test_hash_digest(self, registry, algorithm):
+        """Test hashed values use the configured algorithm."""
+        engine = AsyncEngine(registry, hash_algorithm=algorithm)
+        value = "user@corpmail.net"
+        result = await engine.redact(f"Email: {value}", strategy=RedactionStrategy.HASH)
+
+        expected = hashlib.new(algorithm, value.encode("utf-8")).hexdigest()[:16]
+        assert result.redacted_text == f"Email: [HASH:{expected}]"
+
+    @pytest.mark.asyncio
+    async def test_hash_algorithm_reassigned(self, registry):
+        """Test changing hash_algorithm after construction takes effect."""
+        engine = AsyncEngine(registry)
+        engine.hash_algorithm = "md5"
+        value = "user@corpmail.net"
+        result = await engine.redact(value, strategy=RedactionStrategy.HASH)
+
+        assert result.redacted_text == f"[HASH:{hashlib.md5(value.encode()).hexdigest()[:16]}]"
+
+    @pytest.mark.asyncio
+    async def test_runs_on_own_executor(self, registry, monkeypatch):
+        """Test matching runs on the engine's executor, sized by max_workers."""
+        import threading
+
+        engine = AsyncEngine(registry, max_workers=2)
+        thread_names = []
+        find_sync = engine._find_sync
+
+        def record(*args):
+            thread_names.append(threading.current_thread().name)
+            return find_sync(*args)
+
+        monkeypatch.setattr(engine, "_find_sync", record)
+        await engine.find_batch(["a", "b", "c"], chunk_size=1)
+        engine.close()
+
+        assert engine._executor._max_workers == 2
+        assert thread_names and all(n.startswith("datadetector") for n in thread_names)
+
+    @pytest.mark.asyncio
+    async def test_closed_engine_rejects_calls(self, registry):
+        """Test close() shuts the executor down."""
+        engine = AsyncEngine(registry)
+        engine.close()
+
+        with pytest.raises(RuntimeError):
+            await engine.find("text")
+
 
 class TestAsyncPerformance:
     """Performance-related tests for async engine."""
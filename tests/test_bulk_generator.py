@@ -1,12 +1,13 @@
 """Tests for bulk data generator."""
 
+import io
 import json
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from datadetector import BulkDataGenerator, FakeDataGenerator
+from datadetector import BulkDataGenerator, FakeDataGenerator, bulk_generator
 
 
 @pytest.fixture
@@ -69,6 +70,45 @@ class TestLabeledRecordGeneration:
         pattern_ids = [item["pattern_id"] for item in record["pii_items"]]
         assert all(pid in patterns for pid in pattern_ids)
 
+    def test_random_patterns_listed_once(self, bulk_gen, monkeypatch):
+        """Test records pick random patterns without listing them again."""
+
+        def fail():
+            raise AssertionError("supported_patterns() called per record")
+
+        monkeypatch.setattr(bulk_gen.gen, "supported_patterns", fail)
+        record = bulk_gen.generate_labeled_record(num_pii_items=3)
+
+        assert len(record["metadata"]["patterns_used"]) == 3
+
+    def test_generate_labeled_record_templates(self, bulk_gen):
+        """Test PII values are placed in one of the context sentences."""
+        for _ in range(30):
+            record = bulk_gen.generate_labeled_record(include_patterns=["us/ssn_01"])
+            value = record["pii_items"][0]["value"]
+
+            assert record["text"].endswith(
+                (
+                    f"Contact information: {value}",
+                    f"Please use {value} for identification",
+                    f"Their ssn 01 is {value}",
+                    f"You can reach them at {value}",
+                    f"Use this: {value}",
+                    f" {value}",
+                )
+            )
+
+    def test_start_hint_points_at_sentence(self, bulk_gen):
+        """Test start_hint is the offset of each item's sentence in the text."""
+        record = bulk_gen.generate_labeled_record(num_pii_items=8)
+        text = record["text"]
+
+        for item in record["pii_items"]:
+            sentence = text[item["start_hint"] :]
+            assert text[item["start_hint"] - 1] == " "
+            assert sentence.startswith(("Contact", "Please", "Their", "You", "Use", item["value"]))
+            assert item["value"] in sentence
+
 
 class TestBulkGeneration:
     """Tests for bulk data generation."""
@@ -97,6 +137,41 @@ class TestBulkGeneration:
             num_pii = record["metadata"]["num_pii_items"]
             assert 0 <= num_pii <= 4  # May be 0 if generation fails
 
+    def test_generate_bulk_labeled_data_in_workers(self, bulk_gen, monkeypatch):
+        """Test records generated by worker processes come back in order."""
+        monkeypatch.setattr(bulk_generator, "_MIN_CHUNK_RECORDS", 4)
+        # More chunks than are kept in flight at once
+        records = bulk_gen.generate_bulk_labeled_data(
+            num_records=30, patterns_per_record=(1, 2), num_workers=2
+        )
+
+        assert [r["record_id"] for r in records] == list(range(1, 31))
+        assert all(1 <= len(r["metadata"]["patterns_used"]) <= 2 for r in records)
+
+    def test_small_jobs_stay_in_process(self, bulk_gen, monkeypatch):
+        """Test jobs smaller than one chunk do not start worker processes."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("worker processes started")
+
+        monkeypatch.setattr(bulk_generator, "ProcessPoolExecutor", fail)
+        records = bulk_gen.generate_bulk_labeled_data(num_records=20, num_workers=4)
+
+        assert len(records) == 20
+
+    def test_default_stays_in_process(self, bulk_gen, temp_dir, monkeypatch):
+        """Test worker processes are only used when asked for."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("worker processes started")
+
+        monkeypatch.setattr(bulk_generator, "ProcessPoolExecutor", fail)
+        monkeypatch.setattr(bulk_generator, "_MIN_CHUNK_RECORDS", 4)
+        records = bulk_gen.generate_bulk_labeled_data(num_records=30, patterns_per_record=(1, 2))
+        bulk_gen.save_bulk_data_jsonl(temp_dir / "data.jsonl", num_records=30)
+
+        assert len(records) == 30
+
 
 class TestJSONLFormat:
     """Tests for JSONL format output."""
@@ -132,6 +207,60 @@ class TestJSONLFormat:
         assert "pii_items" in record
         assert "metadata" in record
 
+    def test_save_bulk_data_jsonl_streams_records(self, bulk_gen, temp_dir, monkeypatch):
+        """Test JSONL output is written without building the record list."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("record list built")
+
+        monkeypatch.setattr(bulk_gen, "generate_bulk_labeled_data", fail)
+        output_path = temp_dir / "test.jsonl"
+        bulk_gen.save_bulk_data_jsonl(output_path, num_records=4)
+
+        with open(output_path, encoding="utf-8") as f:
+            assert [json.loads(line)["record_id"] for line in f] == [1, 2, 3, 4]
+
+    def test_jsonl_written_in_batches(self, monkeypatch):
+        """Test JSON lines are collected into batches before writing."""
+        monkeypatch.setattr(bulk_generator, "_WRITE_BATCH_BYTES", 64)
+        writes = []
+
+        class Recorder(io.BytesIO):
+            def write(self, data):
+                writes.append(bytes(data))
+                return super().write(data)
+
+        records = [{"record_id": i, "text": "x" * 20} for i in range(10)]
+        f = Recorder()
+        bulk_generator._write_jsonl(f, records)
+
+        assert [json.loads(line) for line in f.getvalue().splitlines()] == records
+        assert 1 < len(writes) < len(records)
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_serializers_write_same_data(self, temp_dir, monkeypatch, use_orjson):
+        """Test orjson and the stdlib fallback write the same records."""
+        if use_orjson and not bulk_generator.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(bulk_generator, "HAS_ORJSON", use_orjson)
+        output_path = temp_dir / "test.jsonl"
+        BulkDataGenerator(seed=7).save_bulk_data_jsonl(output_path, num_records=3)
+
+        with open(output_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert [r["record_id"] for r in records] == [1, 2, 3]
+
+        # Non-ASCII text is written as UTF-8, not \u escapes
+        data = {"name": "김민수", "ids": (1, 2)}
+        assert bulk_generator._dumps(data).decode("utf-8") in (
+            '{"name":"김민수","ids":[1,2]}',
+            '{"name": "김민수", "ids": [1, 2]}',
+        )
+        assert json.loads(bulk_generator._dumps(data, indent=True)) == {
+            "name": "김민수",
+            "ids": [1, 2],
+        }
+
 
 class TestJSONFormat:
     """Tests for JSON format output."""
@@ -213,6 +342,20 @@ class TestCSVFormat:
         pii_items = json.loads(row["pii_items_json"])
         assert isinstance(pii_items, list)
 
+    def test_save_bulk_data_csv_streams_records(self, bulk_gen, temp_dir, monkeypatch):
+        """Test CSV output is written without building the record list."""
+        import csv
+
+        def fail(*args, **kwargs):
+            raise AssertionError("record list built")
+
+        monkeypatch.setattr(bulk_gen, "generate_bulk_labeled_data", fail)
+        output_path = temp_dir / "test.csv"
+        bulk_gen.save_bulk_data_csv(output_path, num_records=4)
+
+        with open(output_path, encoding="utf-8", newline="") as f:
+            assert [row["record_id"] for row in csv.DictReader(f)] == ["1", "2", "3", "4"]
+
 
 class TestDetectionPairs:
     """Tests for detection pairs generation."""
@@ -250,6 +393,31 @@ class TestDetectionPairs:
                 assert pair["label"] == 0
                 assert pair["pii_count"] == 0
 
+    def test_generate_detection_pairs_in_workers(self, bulk_gen, monkeypatch):
+        """Test pairs generated by worker processes keep their ids and labels."""
+        monkeypatch.setattr(bulk_generator, "_MIN_CHUNK_RECORDS", 4)
+        pairs = bulk_gen.generate_detection_pairs(num_pairs=30, positive_ratio=0.5, num_workers=2)
+
+        assert sorted(p["pair_id"] for p in pairs) == list(range(1, 31))
+        for pair in pairs:
+            assert pair["has_pii"] == (pair["pair_id"] <= 15)
+            assert pair["label"] == int(pair["has_pii"])
+
+    def test_unseeded_workers_generate_different_texts(self, monkeypatch):
+        """Test worker processes do not repeat each other's texts."""
+        from faker.generator import random as faker_random
+
+        monkeypatch.setattr(bulk_generator, "_worker_generator", None)
+        # Each forked worker starts from the same copy of Faker's shared random state
+        state = faker_random.getstate()
+        texts = []
+        for _ in range(2):
+            faker_random.setstate(state)
+            bulk_generator._init_bulk_worker("en_US")
+            texts.append(bulk_generator._worker_generator.faker.paragraph(nb_sentences=5))
+
+        assert texts[0] != texts[1]
+
     def test_save_detection_pairs_jsonl(self, bulk_gen, temp_dir):
         """Test saving detection pairs in JSONL."""
         output_path = temp_dir / "pairs.jsonl"
@@ -327,6 +495,25 @@ class TestStatistics:
         for pattern_id in stats["pattern_distribution"]:
             assert pattern_id in patterns
 
+    def test_generate_statistics_counts(self, bulk_gen):
+        """Test pattern counts over hand-built records."""
+        records = [
+            {
+                "metadata": {"num_pii_items": 2, "text_length": 30},
+                "pii_items": [{"pattern_id": "us/ssn_01"}, {"pattern_id": "comm/email_01"}],
+            },
+            {
+                "metadata": {"num_pii_items": 1, "text_length": 10},
+                "pii_items": [{"pattern_id": "us/ssn_01"}],
+            },
+        ]
+        stats = bulk_gen.generate_statistics(records)
+
+        assert stats["pattern_distribution"] == {"us/ssn_01": 2, "comm/email_01": 1}
+        assert stats["unique_patterns_used"] == 2
+        assert stats["avg_pii_per_record"] == 1.5
+        assert stats["avg_text_length"] == 20
+
 
 class TestConfiguration:
     """Tests for generator configuration."""
@@ -0,0 +1,264 @@
+"""Tests for keyword-based context analysis (ContextAnalyzer)."""
+
+import pytest
+
+from datadetector import analysis
+from datadetector.analysis import ContextAnalyzer
+from datadetector.models import Category, Match, ScoringConfig
+
+KEYWORDS_YAML = """
+categories:
+  email:
+    contexts:
+      - "email:"
+      - "mail"
+      - "contact"
+  phone:
+    contexts:
+      - "phone"
+      - "tel"
+"""
+
+
+@pytest.fixture(autouse=True)
+def context_cache_dir(tmp_path, monkeypatch):
+    """Keep the parsed-keyword cache out of the user's home directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.delenv(analysis.NO_CACHE_ENV, raising=False)
+    monkeypatch.setenv(analysis.CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(params=[True, False], ids=["ahocorasick", "fallback"])
+def analyzer(request, tmp_path, monkeypatch):
+    """ContextAnalyzer over a small keyword set, with and without pyahocorasick."""
+    if request.param and not analysis.HAS_AHOCORASICK:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(analysis, "HAS_AHOCORASICK", request.param)
+    (tmp_path / "keywords.yml").write_text(KEYWORDS_YAML, encoding="utf-8")
+    return ContextAnalyzer(context_dir=tmp_path)
+
+
+def _match(text, value, category=Category.EMAIL):
+    start = text.index(value)
+    return Match(
+        ns_id="comm/email_01",
+        pattern_id="email_01",
+        namespace="comm",
+        category=category,
+        start=start,
+        end=start + len(value),
+        score=0.5,
+    )
+
+
+class TestKeywordContext:
+    """Proximity scoring of context keywords around a match."""
+
+    def test_close_pre_keyword(self, analyzer):
+        """A keyword right before the match gets the close boost."""
+        text = "Email: jane@corpmail.net"
+        match = _match(text, "jane@corpmail.net")
+        result = analyzer._keyword_context_check(text, [match])
+
+        sc = ScoringConfig()
+        assert result[0].score == pytest.approx(0.5 + sc.keyword_pre_close_boost)
+        assert "email (dist: -2)" in result[0].context_evidence
+        assert "mail (dist: -2)" in result[0].context_evidence
+
+    def test_closest_occurrence_wins(self, analyzer):
+        """Distances are measured to the nearest occurrence on each side."""
+        text = "contact us, contact: jane@corpmail.net then contact and contact"
+        match = _match(text, "jane@corpmail.net")
+        result = analyzer._keyword_context_check(text, [match])
+
+        evidence = result[0].context_evidence
+        assert "contact (dist: -2)" in evidence
+        assert "contact (dist: +6)" in evidence
+        assert len(evidence) == 2
+
+    def test_far_post_keyword(self, analyzer):
+        """A keyword after the match, 10-30 chars away, gets the far boost."""
+        text = "jane@corpmail.net is the one to use for contact"
+        match = _match(text, "jane@corpmail.net")
+        result = analyzer._keyword_context_check(text, [match])
+
+        sc = ScoringConfig()
+        assert result[0].context_evidence == ["contact (dist: +23)"]
+        assert result[0].score == pytest.approx(0.5 + sc.keyword_post_far_boost)
+
+    def test_weak_boost_from_scoring_config(self, analyzer):
+        """Keywords 30+ chars away use the configured weak boost."""
+        analyzer.scoring_config = ScoringConfig(keyword_pre_weak_boost=0.2)
+        text = "contact" + " " * 40 + "jane@corpmail.net"
+        match = _match(text, "jane@corpmail.net")
+        result = analyzer._keyword_context_check(text, [match])
+
+        assert result[0].context_evidence == ["contact (dist: -40)"]
+        assert result[0].score == pytest.approx(0.7)
+
+    def test_other_category_keywords_ignored(self, analyzer):
+        """Keywords of unrelated categories give no boost."""
+        text = "phone tel jane@corpmail.net"
+        match = _match(text, "jane@corpmail.net")
+        result = analyzer._keyword_context_check(text, [match])
+
+        assert result[0].score == 0.5
+        assert result[0].context_evidence == []
+
+    def test_keyword_outside_window_ignored(self, analyzer):
+        """Keywords beyond the keyword window are not considered."""
+        text = "contact" + " " * 100 + "jane@corpmail.net"
+        match = _match(text, "jane@corpmail.net")
+        result = analyzer._keyword_context_check(text, [match])
+
+        assert result[0].context_evidence == []
+
+    def test_matches_share_document_scan(self, analyzer):
+        """Each match only sees the keywords inside its own window."""
+        first, second = "jane@corpmail.net", "john@corpmail.net"
+        text = f"contact: {first}" + " " * 80 + f"{second} by mail"
+        matches = [_match(text, first), _match(text, second)]
+        result = analyzer._keyword_context_check(text, matches)
+
+        assert result[0].context_evidence == ["contact (dist: -2)"]
+        assert result[1].context_evidence == ["mail (dist: +4)"]
+
+    def test_regex_metacharacters_matched_literally(self, analyzer):
+        """Keywords are matched as plain text, not as patterns."""
+        analyzer._add_contexts("email", ["e-mail (work)", "c.t"])
+        text = "e-mail (work) jane@corpmail.net cat"
+        match = _match(text, "jane@corpmail.net")
+        result = analyzer._keyword_context_check(text, [match])
+
+        assert sorted(result[0].context_evidence) == [
+            "e-mail (work) (dist: -1)",
+            "mail (dist: -8)",
+        ]
+
+    def test_offsets_kept_when_lowercase_is_longer(self, analyzer):
+        """Characters that lowercase to two code points do not shift offsets."""
+        text = "\u0130stanbul office, email: jane@corpmail.net"
+        match = _match(text, "jane@corpmail.net")
+        result = analyzer._keyword_context_check(text, [match])
+
+        assert "email (dist: -2)" in result[0].context_evidence
+
+    def test_address_uses_country_keywords(self, analyzer):
+        """Address matches also use the country-specific address keywords."""
+        analyzer._add_contexts("address_kr", ["주소"])
+        text = "주소: 서울시 중구 세종대로 110"
+        match = _match(text, "서울시 중구 세종대로 110", Category.ADDRESS)
+        result = analyzer._keyword_context_check(text, [match])
+
+        assert result[0].context_evidence == ["주소 (dist: -2)"]
+
+    def test_categories_without_keywords_skip_scan(self, analyzer, monkeypatch):
+        """The document is not lowercased or scanned when no match has keywords."""
+
+        def fail(*args):
+            raise AssertionError("document scanned")
+
+        monkeypatch.setattr(analysis, "_lower_keep_offsets", fail)
+        monkeypatch.setattr(analyzer, "_scan_text", fail)
+        text = "contact 123-45-6789"
+        match = _match(text, "123-45-6789", Category.SSN)
+        result = analyzer._keyword_context_check(text, [match])
+
+        assert result[0].context_evidence == []
+
+    def test_evidence_collection_optional(self, analyzer):
+        """Scores are the same without collecting evidence strings."""
+        text = "Email: jane@corpmail.net"
+        with_evidence = analyzer._keyword_context_check(text, [_match(text, "jane@corpmail.net")])
+        without = analyzer._keyword_context_check(
+            text, [_match(text, "jane@corpmail.net")], collect_evidence=False
+        )
+
+        assert without[0].score == with_evidence[0].score > 0.5
+        assert without[0].context_evidence == []
+
+    def test_merged_contexts_cached_per_group(self, analyzer):
+        """Matches of the same category reuse one merged context set."""
+        text = "mail a@corpmail.net mail b@corpmail.net"
+        matches = [_match(text, "a@corpmail.net"), _match(text, "b@corpmail.net")]
+        analyzer._keyword_context_check(text, matches)
+
+        assert list(analyzer._merged_cache.values()) == [{"email", "mail", "contact"}]
+
+
+class TestContextCache:
+    """JSON cache of parsed keyword directories."""
+
+    @pytest.fixture
+    def keyword_dir(self, tmp_path):
+        keyword_dir = tmp_path / "keyword"
+        keyword_dir.mkdir()
+        (keyword_dir / "keywords.yml").write_text(KEYWORDS_YAML, encoding="utf-8")
+        return keyword_dir
+
+    def test_second_load_uses_cache(self, keyword_dir, context_cache_dir, monkeypatch):
+        """The YAML files are parsed once; later analyzers read the cache."""
+        first = ContextAnalyzer(context_dir=keyword_dir)
+        assert len(list(context_cache_dir.glob("contexts-*.json"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parsed despite cache")
+
+        monkeypatch.setattr(analysis.yaml, "load", fail)
+        second = ContextAnalyzer(context_dir=keyword_dir)
+        assert second.context_map == first.context_map
+        assert second.context_map["phone"] == {"phone", "tel"}
+
+    def test_changed_file_invalidates_cache(self, keyword_dir):
+        """Editing a keyword file yields a new cache key."""
+        ContextAnalyzer(context_dir=keyword_dir)
+        (keyword_dir / "keywords.yml").write_text(
+            KEYWORDS_YAML + "  ssn:\n    contexts:\n      - social security\n",
+            encoding="utf-8",
+        )
+
+        analyzer = ContextAnalyzer(context_dir=keyword_dir)
+        assert analyzer.context_map["ssn"] == {"social security"}
+
+    def test_corrupt_cache_ignored(self, keyword_dir, context_cache_dir):
+        """An unreadable cache file falls back to parsing the YAML."""
+        ContextAnalyzer(context_dir=keyword_dir)
+        for cache_file in context_cache_dir.glob("contexts-*.json"):
+            cache_file.write_bytes(b"not json")
+
+        analyzer = ContextAnalyzer(context_dir=keyword_dir)
+        assert analyzer.context_map["email"] == {"email", "mail", "contact"}
+
+    def test_malformed_cache_ignored(self, keyword_dir, context_cache_dir):
+        """Valid JSON of the wrong shape falls back to parsing the YAML."""
+        ContextAnalyzer(context_dir=keyword_dir)
+        for cache_file in context_cache_dir.glob("contexts-*.json"):
+            cache_file.write_text('{"email": "mail"}', encoding="utf-8")
+
+        analyzer = ContextAnalyzer(context_dir=keyword_dir)
+        assert analyzer.context_map["email"] == {"email", "mail", "contact"}
+
+    def test_xdg_cache_home(self, keyword_dir, tmp_path, monkeypatch):
+        """Without an explicit directory the cache goes under XDG_CACHE_HOME."""
+        monkeypatch.delenv(analysis.CACHE_DIR_ENV)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+        ContextAnalyzer(context_dir=keyword_dir)
+        assert len(list((tmp_path / "xdg" / "datadetector").glob("contexts-*.json"))) == 1
+
+    def test_cache_dir_argument(self, keyword_dir, tmp_path, context_cache_dir):
+        """An explicit cache_dir takes precedence over the environment."""
+        ContextAnalyzer(context_dir=keyword_dir, cache_dir=tmp_path / "custom")
+
+        assert len(list((tmp_path / "custom").glob("contexts-*.json"))) == 1
+        assert not context_cache_dir.exists()
+
+    def test_cache_disabled(self, keyword_dir, context_cache_dir, monkeypatch):
+        """use_cache=False and DATADETECTOR_NO_CACHE skip the cache entirely."""
+        ContextAnalyzer(context_dir=keyword_dir, use_cache=False)
+        monkeypatch.setenv(analysis.NO_CACHE_ENV, "1")
+        analyzer = ContextAnalyzer(context_dir=keyword_dir)
+
+        assert analyzer.context_map["phone"] == {"phone", "tel"}
+        assert not context_cache_dir.exists()
@@ -3,12 +3,15 @@
 import pytest
 
 from datadetector import (
+    ContextFilter,
     ContextHint,
     Engine,
     KeywordRegistry,
+    context,
     create_context_from_field_name,
     load_registry,
 )
+from datadetector.context_presets import DATABASE_SSN, KOREAN_RRN, get_preset, list_presets
 
 
 @pytest.fixture
@@ -54,6 +57,20 @@ class TestContextHint:
         assert loose.strategy == "loose"
         assert none.strategy == "none"
 
+    def test_cache_key_ignores_order_and_case(self):
+        """Hints selecting the same patterns should share a cache key."""
+        first = ContextHint(keywords=["SSN", "email"], categories=["bank"])
+        second = ContextHint(keywords=["email", "ssn", "ssn"], categories=["BANK"])
+
+        assert first.cache_key() == second.cache_key()
+        assert first.cache_key() != ContextHint(keywords=["ssn"]).cache_key()
+        assert (
+            first.cache_key()
+            != ContextHint(
+                keywords=["ssn", "email"], categories=["bank"], strategy="strict"
+            ).cache_key()
+        )
+
 
 class TestKeywordRegistry:
     """Tests for KeywordRegistry."""
@@ -86,6 +103,37 @@ class TestKeywordRegistry:
         # Should find SSN patterns
         assert any("ssn" in p or "itin" in p for p in patterns)
 
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_get_patterns_for_keyword_matching(self, tmp_path, monkeypatch, use_automaton):
+        """Keywords match exactly or when either contains the other."""
+        if use_automaton and not context.HAS_AHOCORASICK:
+            pytest.skip("pyahocorasick not installed")
+        monkeypatch.setattr(context, "HAS_AHOCORASICK", use_automaton)
+        keywords_file = tmp_path / "keywords.yml"
+        keywords_file.write_text(
+            "keywords:\n"
+            "  email:\n"
+            "    patterns: [comm/email_01]\n"
+            "  email_address:\n"
+            "    patterns: [comm/email_02]\n"
+            "  phone-number:\n"
+            "    patterns: [us/phone_01]\n"
+            "categories: {}\n"
+        )
+        registry = KeywordRegistry(keywords_file)
+
+        assert registry.get_patterns_for_keyword("Email") == {"comm/email_01", "comm/email_02"}
+        assert registry.get_patterns_for_keyword("work_email_address") == {
+            "comm/email_01",
+            "comm/email_02",
+        }
+        assert registry.get_patterns_for_keyword("address") == {"comm/email_02"}
+        assert registry.get_patterns_for_keyword("PHONE_NUMBER") == {"us/phone_01"}
+        assert registry.get_patterns_for_keyword("fax") == set()
+        # Cached results are copied, so callers may modify them
+        registry.get_patterns_for_keyword("email").add("custom/pattern")
+        assert "custom/pattern" not in registry.get_patterns_for_keyword("email")
+
     def test_get_patterns_for_category(self, keyword_registry):
         """Should get patterns for a category."""
         ssn_patterns = keyword_registry.get_patterns_for_category("ssn")
@@ -112,6 +160,20 @@ class TestKeywordRegistry:
         # Should not include non-matching patterns
         assert "us/ssn_01" not in expanded
 
+    def test_expand_wildcards_inner_and_exact(self, keyword_registry):
+        """Should match wildcards anywhere in the ID and keep only known exact IDs."""
+        all_patterns = ["kr/bank_account_01", "kr/bank.account", "comm/email_01", "us/ssn_01"]
+
+        assert keyword_registry.expand_wildcards({"*email*"}, all_patterns) == {"comm/email_01"}
+        # '.' keeps its regex meaning, as in other wildcard IDs
+        assert keyword_registry.expand_wildcards({"kr/bank.account*"}, all_patterns) == {
+            "kr/bank_account_01",
+            "kr/bank.account",
+        }
+        assert keyword_registry.expand_wildcards({"us/ssn_01", "us/ssn_99"}, all_patterns) == {
+            "us/ssn_01"
+        }
+
     def test_korean_keywords(self, keyword_registry):
         """Should support Korean keywords."""
         patterns = keyword_registry.get_patterns_for_keyword("주민등록번호")
@@ -251,6 +313,62 @@ class TestContextFiltering:
         bank_matches = [m for m in result.matches if "bank_account" in m.ns_id]
         assert len(bank_matches) > 0
 
+    def test_filter_patterns_cached_by_hint_contents(self, keyword_registry):
+        """Repeated hints reuse cached results, which follow changes to the hint."""
+        context_filter = ContextFilter(keyword_registry)
+        all_patterns = ["us/ssn_01", "comm/email_01", "kr/phone_01"]
+        hint = ContextHint(pattern_ids=["us/ssn_01", "kr/phone_01"], strategy="strict")
+
+        filtered = context_filter.filter_patterns(hint, all_patterns)
+        assert filtered == ["us/ssn_01", "kr/phone_01"]
+        filtered.clear()
+        assert context_filter.filter_patterns(hint, all_patterns) == ["us/ssn_01", "kr/phone_01"]
+        assert context_filter._filter_cached.cache_info().hits == 1
+
+        hint.exclude_patterns.append("kr/phone_01")
+        assert context_filter.filter_patterns(hint, all_patterns) == ["us/ssn_01"]
+        all_patterns.remove("us/ssn_01")
+        assert context_filter.filter_patterns(hint, all_patterns) == []
+
+    def test_engine_reuses_selection_for_equal_hints(self, engine, monkeypatch):
+        """Engine.find should filter patterns once per distinct hint and registry version."""
+        calls = []
+        original = engine.context_filter.filter_patterns
+
+        def counting_filter(hint, all_patterns):
+            calls.append(hint)
+            return original(hint, all_patterns)
+
+        monkeypatch.setattr(engine.context_filter, "filter_patterns", counting_filter)
+        text = "SSN: 123-45-6789"
+
+        first = engine.find(text, context=ContextHint(keywords=["ssn"], strategy="strict"))
+        second = engine.find(text, context=ContextHint(keywords=["SSN"], strategy="strict"))
+        assert len(calls) == 1
+        assert [m.ns_id for m in first.matches] == [m.ns_id for m in second.matches]
+
+        engine.find(text, context=ContextHint(keywords=["email"], strategy="strict"))
+        assert len(calls) == 2
+
+        engine.registry.add_pattern(engine.registry.get_pattern("us/ssn_01"))
+        engine.find(text, context=ContextHint(keywords=["ssn"], strategy="strict"))
+        assert len(calls) == 3
+
+    def test_bind_presets_precomputes_selection(self, engine, monkeypatch):
+        """Engine.find with a bound preset should not filter patterns again."""
+        text = "SSN: 123-45-6789, email: user@corpmail.net"
+        expected = engine.find(text, context=DATABASE_SSN)
+
+        fresh = Engine(engine.registry)
+        assert fresh.bind_presets() == sum(len(names) for names in list_presets().values())
+
+        def failing_filter(hint, all_patterns):
+            raise AssertionError("preset selection was not precomputed")
+
+        monkeypatch.setattr(fresh.context_filter, "filter_patterns", failing_filter)
+        result = fresh.find(text, context=DATABASE_SSN)
+        assert [m.ns_id for m in result.matches] == [m.ns_id for m in expected.matches]
+
 
 class TestCreateContextFromFieldName:
     """Tests for create_context_from_field_name helper."""
@@ -286,6 +404,12 @@ class TestCreateContextFromFieldName:
         assert "a" not in context.keywords
         assert "b" not in context.keywords
 
+    def test_create_splits_on_all_delimiters(self):
+        """Should split on underscores, hyphens, dots and any whitespace."""
+        context = create_context_from_field_name("Billing-Zip.code__User\tSSN  id")
+
+        assert context.keywords == ["billing", "zip", "code", "user", "ssn", "id"]
+
 
 class TestPerformanceWithContext:
     """Tests to verify performance improvements with context filtering."""
@@ -363,3 +487,17 @@ class TestDisableContextFiltering:
         # Should still find SSN (context filtering disabled)
         ssn_matches = [m for m in result.matches if "ssn" in m.ns_id.lower()]
         assert len(ssn_matches) > 0
+
+
+class TestContextPresets:
+    """Test preset lookup."""
+
+    def test_get_preset_returns_shared_hint(self):
+        """get_preset should return the module-level preset objects."""
+        assert get_preset("database.ssn") is DATABASE_SSN
+        assert get_preset("korean.rrn") is KOREAN_RRN
+
+    def test_get_preset_unknown_name(self):
+        """Unknown preset names should raise ValueError listing the choices."""
+        with pytest.raises(ValueError, match="database.ssn"):
+            get_preset("database.unknown")
@@ -1,8 +1,11 @@
 """Tests for the core engine."""
 
+import hashlib
+
 import pytest
 
 from datadetector import Engine, ScoringConfig, load_registry
+from datadetector import engine as engine_module
 from datadetector.models import RedactionStrategy
 
 
@@ -121,6 +124,42 @@ class TestRedact:
         assert "test@example.com" not in result.redacted_text
         assert "[HASH:" in result.redacted_text
 
+    @pytest.mark.parametrize("algorithm", ["sha256", "blake2b", "SHA256"])
+    def test_redact_hash_digest(self, registry, algorithm):
+        """Test hashed values use the configured algorithm."""
+        engine = Engine(registry, hash_algorithm=algorithm)
+        value = "user@corpmail.net"
+        result = engine.redact(f"Email: {value}", strategy=RedactionStrategy.HASH)
+
+        expected = hashlib.new(algorithm, value.encode("utf-8")).hexdigest()[:16]
+        assert result.redacted_text == f"Email: [HASH:{expected}]"
+
+    def test_hash_algorithm_reassigned(self, registry):
+        """Test changing hash_algorithm after construction takes effect."""
+        engine = Engine(registry)
+        engine.hash_algorithm = "md5"
+        value = "user@corpmail.net"
+        result = engine.redact(value, strategy=RedactionStrategy.HASH)
+
+        assert result.redacted_text == f"[HASH:{hashlib.md5(value.encode()).hexdigest()[:16]}]"
+
+    @pytest.mark.skipif(not engine_module.HAS_BLAKE3, reason="blake3 not installed")
+    def test_redact_hash_blake3(self, registry):
+        """Test the optional blake3 hash algorithm."""
+        engine = Engine(registry, hash_algorithm="blake3")
+        value = "user@corpmail.net"
+        result = engine.redact(value, strategy=RedactionStrategy.HASH)
+
+        expected = engine_module.blake3.blake3(value.encode("utf-8")).hexdigest()[:16]
+        assert result.redacted_text == f"[HASH:{expected}]"
+
+    def test_blake3_unavailable_raises(self, registry, monkeypatch):
+        """Test requesting blake3 without the package fails at construction."""
+        monkeypatch.setattr(engine_module, "HAS_BLAKE3", False)
+
+        with pytest.raises(ValueError, match="blake3"):
+            Engine(registry, hash_algorithm="blake3")
+
     def test_redact_tokenize_strategy(self, engine):
         """Test redaction with tokenize strategy."""
         text = "SSN: 123-45-6789"
@@ -154,6 +193,21 @@ class TestRedact:
         assert result.redacted_text.startswith("Start ")
         assert result.redacted_text.endswith(" End")
 
+    @pytest.mark.parametrize(
+        "strategy",
+        [RedactionStrategy.MASK, RedactionStrategy.HASH, RedactionStrategy.TOKENIZE],
+    )
+    def test_redact_streaming_matches_spliced_replacements(self, engine, strategy):
+        """Test the single-pass rewrite equals splicing each replacement in."""
+        text = "Call 010-1234-5678 or email test@example.com today"
+        result = engine.redact(text, namespaces=["kr", "comm"], strategy=strategy)
+
+        replacements = [
+            (m.start, m.end, engine._get_replacement(text, m, strategy)) for m in result.matches
+        ]
+        assert result.redaction_count == 2
+        assert result.redacted_text == engine_module._apply_replacements(text, replacements)
+
 
 class TestEdgeCases:
     """Tests for edge cases."""
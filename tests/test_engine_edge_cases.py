@@ -1,11 +1,17 @@
 """Tests for engine edge cases to improve coverage."""
 
+import dataclasses
 import re
+import sys
 
+import pytest
+
+from datadetector import regex_compat
 from datadetector.engine import Engine
 from datadetector.models import (
     ActionOnMatch,
     Category,
+    Match,
     Pattern,
     Policy,
     RedactionStrategy,
@@ -14,6 +20,24 @@ from datadetector.models import (
 from datadetector.registry import PatternRegistry
 
 
+def _make_order_engine(regex: str, **engine_kwargs) -> Engine:
+    """Create an engine over a single test/order_01 pattern."""
+    compiled = regex_compat.compile(regex)
+    registry = PatternRegistry()
+    registry.add_pattern(
+        Pattern(
+            id="order_01",
+            namespace="test",
+            location="test",
+            category=Category.OTHER,
+            pattern=regex,
+            compiled=compiled,
+            required_literals=compiled.required_literals,
+        )
+    )
+    return Engine(registry, **engine_kwargs)
+
+
 class TestEngineStoreRawPolicy:
     """Test engine with store_raw policy."""
 
@@ -164,3 +188,400 @@ class TestRedactionStrategies:
         result_token = engine.redact("test@example.com", strategy=RedactionStrategy.TOKENIZE)
         assert result_token.redaction_count == 1
         assert "[TOKEN:" in result_token.redacted_text
+
+
+class TestLiteralPrefilter:
+    """Test that the literal prefilter skips patterns that cannot match."""
+
+    def test_pattern_skipped_without_literal(self, monkeypatch):
+        """Test that the regex is not run when a required literal is absent."""
+        engine = _make_order_engine(r"ORD-\d{6}")
+        pattern = engine.registry.get_pattern("test/order_01")
+
+        def fail_finditer(text):
+            raise AssertionError("regex scan should have been skipped")
+
+        monkeypatch.setattr(pattern.compiled, "finditer", fail_finditer)
+
+        result = engine.find("No order numbers in this text", namespaces=["test"])
+        assert result.match_count == 0
+
+    def test_pattern_runs_with_literal(self):
+        """Test that matching still works when the literals are present."""
+        engine = _make_order_engine(r"ORD-\d{6}")
+
+        result = engine.find("Your order ORD-482913 shipped", namespaces=["test"])
+
+        assert result.match_count == 1
+        assert result.matches[0].span == (11, 21)
+
+
+class TestMultiPatternPrefilter:
+    """Test that find() skips patterns the Hyperscan prefilter rules out."""
+
+    def test_pattern_skipped_when_not_candidate(self, monkeypatch):
+        """Test that the regex is not run for patterns outside the candidates."""
+        engine = _make_order_engine(r"ORD-\d{6}")
+        pattern = engine.registry.get_pattern("test/order_01")
+
+        class NoCandidates:
+            def candidates(self, text):
+                return set()
+
+        def fail_finditer(text):
+            raise AssertionError("regex scan should have been skipped")
+
+        monkeypatch.setattr(engine.registry, "get_multi_prefilter", lambda ns: NoCandidates())
+        monkeypatch.setattr(pattern.compiled, "finditer", fail_finditer)
+
+        result = engine.find("Your order ORD-482913 shipped", namespaces=["test"])
+        assert result.match_count == 0
+
+    @pytest.mark.skipif(not regex_compat.HAS_HYPERSCAN, reason="Hyperscan not available")
+    def test_hyperscan_prefilter_keeps_matches(self, monkeypatch):
+        """Test that matches are the same with and without the prefilter."""
+        engine = _make_order_engine(r"ORD-\d{6}")
+        text = "Your order ORD-482913 shipped, ORD-100200 is pending"
+        assert engine.registry.get_multi_prefilter(["test"]) is not None
+
+        with_prefilter = [m.span for m in engine.find(text, namespaces=["test"]).matches]
+        monkeypatch.setattr(engine.registry, "get_multi_prefilter", lambda ns: None)
+        without_prefilter = [m.span for m in engine.find(text, namespaces=["test"]).matches]
+
+        assert with_prefilter == without_prefilter == [(11, 21), (31, 41)]
+
+
+class TestPriorityGroupUnion:
+    """Test that find() scans each priority group from its union match."""
+
+    @staticmethod
+    def _make_engine() -> Engine:
+        registry = PatternRegistry()
+        for pattern_id, regex in (("order_01", r"ORD-\d{6}"), ("invoice_01", r"INV-\d{6}")):
+            registry.add_pattern(
+                Pattern(
+                    id=pattern_id,
+                    namespace="test",
+                    location="test",
+                    category=Category.OTHER,
+                    pattern=regex,
+                    compiled=regex_compat.compile(regex),
+                )
+            )
+        return Engine(registry)
+
+    @staticmethod
+    def _use_union(monkeypatch, engine: Engine, union) -> None:
+        groups = [(union, group) for _, group in engine.registry.get_priority_groups(["test"])]
+        monkeypatch.setattr(engine.registry, "get_priority_groups", lambda ns: groups)
+
+    def test_group_skipped_without_union_match(self, monkeypatch):
+        """Test that no pattern of the group is scanned when the union finds nothing."""
+        engine = self._make_engine()
+
+        class NoMatchUnion:
+            def search(self, text):
+                return None
+
+        self._use_union(monkeypatch, engine, NoMatchUnion())
+
+        text = "Order ORD-482913, invoice INV-778812"
+        assert engine.find(text, namespaces=["test"]).match_count == 0
+
+    def test_union_keeps_every_match(self, monkeypatch):
+        """Test that group scans from the union offset find all matches."""
+        engine = self._make_engine()
+        text = "Order ORD-482913, invoice INV-778812, order ORD-100200"
+        without_union = [m.span for m in engine.find(text, namespaces=["test"]).matches]
+
+        patterns = engine.registry.get_sorted_patterns(["test"])
+        self._use_union(
+            monkeypatch, engine, regex_compat.compile_union([p.compiled for p in patterns])
+        )
+        with_union = [m.span for m in engine.find(text, namespaces=["test"]).matches]
+
+        assert with_union == without_union == [(6, 16), (26, 36), (44, 54)]
+
+
+class TestOverlapResolution:
+    """Test that overlapping matches keep the higher-priority pattern."""
+
+    def test_many_matches_resolved_by_priority(self):
+        """Test overlap checks across many accepted matches."""
+        registry = PatternRegistry()
+        for pattern_id, regex, priority in (
+            ("order_01", r"ORD-\d{6}", 10),
+            ("suffix_01", r"\d{6}-X", 20),
+        ):
+            registry.add_pattern(
+                Pattern(
+                    id=pattern_id,
+                    namespace="test",
+                    location="test",
+                    category=Category.OTHER,
+                    pattern=regex,
+                    compiled=regex_compat.compile(regex),
+                    priority=priority,
+                )
+            )
+        engine = Engine(registry)
+        text = "ORD-482913-X 705182-X " * 200
+
+        matches = engine.find(text, namespaces=["test"]).matches
+
+        assert [m.pattern_id for m in matches] == ["order_01", "suffix_01"] * 200
+        assert [m.span for m in matches[:2]] == [(0, 10), (13, 21)]
+        overlapping = engine.find(text, namespaces=["test"], allow_overlaps=True).matches
+        assert len(overlapping) == 600
+
+    def test_overlapping_match_not_verified(self):
+        """Test that verification is skipped for matches an accepted match covers."""
+        verified = []
+
+        def verify(value):
+            verified.append(value)
+            return True
+
+        registry = PatternRegistry()
+        for pattern_id, regex, priority, verification_func in (
+            ("order_01", r"ORD-\d{6}", 10, None),
+            ("digits_01", r"\d{6}", 20, verify),
+        ):
+            registry.add_pattern(
+                Pattern(
+                    id=pattern_id,
+                    namespace="test",
+                    location="test",
+                    category=Category.OTHER,
+                    pattern=regex,
+                    compiled=regex_compat.compile(regex),
+                    priority=priority,
+                    verification_func=verification_func,
+                )
+            )
+        engine = Engine(registry)
+
+        matches = engine.find("ORD-482913 and 705182", namespaces=["test"]).matches
+
+        assert [(m.pattern_id, m.verified) for m in matches] == [
+            ("order_01", False),
+            ("digits_01", True),
+        ]
+        assert verified == ["705182"]
+
+
+class TestStopOnFirstMatch:
+    """Test find() with stop_on_first_match."""
+
+    def test_resumes_after_rejected_first_match(self):
+        """Test that a rejected first match falls back to the pattern's later matches."""
+        registry = PatternRegistry()
+        registry.add_pattern(
+            Pattern(
+                id="order_01",
+                namespace="test",
+                location="test",
+                category=Category.OTHER,
+                pattern=r"ORD-\d{6}",
+                compiled=regex_compat.compile(r"ORD-\d{6}"),
+                verification_func=lambda value: not value.endswith("0"),
+            )
+        )
+        engine = Engine(registry)
+        text = "ORD-482910, ORD-705182, ORD-913377"
+
+        result = engine.find(text, namespaces=["test"], stop_on_first_match=True)
+
+        assert [m.span for m in result.matches] == [(12, 22)]
+        assert engine.find("no orders", namespaces=["test"], stop_on_first_match=True).matches == []
+
+
+class TestParallelScan:
+    """Test find() with a scan pool."""
+
+    def test_matches_sequential_scan(self):
+        """Test that pooled scans of a large text give the sequential results."""
+        registry = PatternRegistry()
+        for number in range(10):
+            regex = rf"ID{number}-\d{{6}}"
+            registry.add_pattern(
+                Pattern(
+                    id=f"id_{number:02d}",
+                    namespace="test",
+                    location="test",
+                    category=Category.OTHER,
+                    pattern=regex,
+                    compiled=regex_compat.compile(regex),
+                )
+            )
+        text = " ".join(f"ID{n % 10}-{482913 + n} filler text" for n in range(400))
+        expected = Engine(registry).find(text, namespaces=["test"]).matches
+
+        with Engine(registry, scan_workers=4) as engine:
+            matches = engine.find(text, namespaces=["test"]).matches
+
+        assert len(matches) == 400
+        assert [(m.ns_id, m.span) for m in matches] == [(m.ns_id, m.span) for m in expected]
+        # Leaving the with block shut the scan pool down
+        with pytest.raises(RuntimeError):
+            engine._scan_pool.submit(len, "")
+
+
+class TestDetectionCache:
+    """Test memoization of find() results."""
+
+    def test_repeated_redact_reuses_detection(self, monkeypatch):
+        """Test that redacting the same text twice scans it only once."""
+        engine = _make_order_engine(r"ORD-\d{6}", detection_cache_size=8)
+        pattern = engine.registry.get_pattern("test/order_01")
+        scans = []
+        original_finditer = pattern.compiled.finditer
+
+        def counting_finditer(text, pos=0):
+            scans.append(text)
+            return original_finditer(text, pos)
+
+        monkeypatch.setattr(pattern.compiled, "finditer", counting_finditer)
+
+        text = "Your order ORD-482913 shipped"
+        masked = engine.redact(text, strategy=RedactionStrategy.MASK)
+        hashed = engine.redact(text, strategy=RedactionStrategy.HASH)
+
+        assert len(scans) == 1
+        assert masked.redaction_count == hashed.redaction_count == 1
+        assert "ORD-482913" not in hashed.redacted_text
+
+    def test_registry_change_invalidates_cache(self):
+        """Test that adding a pattern drops memoized results."""
+        from datadetector import regex_compat
+
+        engine = _make_order_engine(r"ORD-\d{6}", detection_cache_size=8)
+        text = "Order ORD-482913, invoice INV-778812"
+        assert engine.find(text, namespaces=["test"]).match_count == 1
+
+        engine.registry.add_pattern(
+            Pattern(
+                id="invoice_01",
+                namespace="test",
+                location="test",
+                category=Category.OTHER,
+                pattern=r"INV-\d{6}",
+                compiled=regex_compat.compile(r"INV-\d{6}"),
+            )
+        )
+
+        assert engine.find(text, namespaces=["test"]).match_count == 2
+
+    def test_cache_disabled_by_default(self):
+        """Test that engines do not memoize unless asked to."""
+        engine = _make_order_engine(r"ORD-\d{6}")
+        engine.find("Your order ORD-482913 shipped", namespaces=["test"])
+
+        assert len(engine._detection_cache) == 0
+
+    def test_repeated_validate_reuses_result(self, monkeypatch):
+        """Test that validating the same token twice matches it only once."""
+        engine = _make_order_engine(r"ORD-\d{6}", detection_cache_size=8)
+        pattern = engine.registry.get_pattern("test/order_01")
+        calls = []
+        original_fullmatch = pattern.compiled.fullmatch
+
+        def counting_fullmatch(text):
+            calls.append(text)
+            return original_fullmatch(text)
+
+        monkeypatch.setattr(pattern.compiled, "fullmatch", counting_fullmatch)
+
+        first = engine.validate("ORD-482913", "test/order_01")
+        second = engine.validate("ORD-482913", "test/order_01")
+
+        assert calls == ["ORD-482913"]
+        assert first.is_valid and second.is_valid
+        assert second.match is first.match
+        assert not engine.validate("ORD-48291", "test/order_01").is_valid
+
+        engine.registry.add_pattern(pattern)
+        engine.validate("ORD-482913", "test/order_01")
+        assert len(calls) == 3
+
+
+class TestMaskRendering:
+    """Test the MASK strategy fast path in redact."""
+
+    def test_default_mask_matches_span_length(self):
+        """Test that unmasked patterns are replaced by one mask char per character."""
+        engine = _make_order_engine(r"ORD-\d{6}", default_mask_char="#")
+
+        result = engine.redact("Your order ORD-482913 shipped", strategy=RedactionStrategy.MASK)
+
+        assert result.redacted_text == "Your order ########## shipped"
+
+
+class TestMatchSlots:
+    """Test that per-match result objects are slotted."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_match_has_no_instance_dict(self):
+        """Test that Match instances use __slots__ instead of __dict__."""
+        match = Match(
+            ns_id="test/x_01",
+            pattern_id="x_01",
+            namespace="test",
+            category=Category.OTHER,
+            start=0,
+            end=1,
+        )
+
+        assert not hasattr(match, "__dict__")
+        with pytest.raises(AttributeError):
+            match.unexpected = True
+
+    def test_match_field_order(self):
+        """Test the field order the engines' positional Match construction relies on."""
+        names = [field.name for field in dataclasses.fields(Match)]
+
+        assert names[:11] == [
+            "ns_id",
+            "pattern_id",
+            "namespace",
+            "category",
+            "start",
+            "end",
+            "matched_text",
+            "mask",
+            "severity",
+            "score",
+            "verified",
+        ]
+
+
+class TestApplyReplacements:
+    """Test the single-pass replacement splicer used by redact."""
+
+    def test_non_overlapping(self):
+        """Test splicing several non-overlapping spans."""
+        from datadetector.engine import _apply_replacements
+
+        text = "a 111 b 2222 c"
+        result = _apply_replacements(text, [(2, 5, "[X]"), (8, 12, "[Y]")])
+
+        assert result == "a [X] b [Y] c"
+
+    def test_no_replacements(self):
+        """Test that an empty replacement list returns the text unchanged."""
+        from datadetector.engine import _apply_replacements
+
+        assert _apply_replacements("unchanged", []) == "unchanged"
+
+    def test_overlapping_matches_legacy_splicing(self):
+        """Test that overlapping spans are spliced from the end, as before."""
+        from datadetector.engine import _apply_replacements
+
+        text = "0123456789"
+        replacements = [(1, 5, "A"), (3, 8, "B")]
+
+        expected = text
+        for start, end, replacement in reversed(replacements):
+            expected = expected[:start] + replacement + expected[end:]
+
+        assert _apply_replacements(text, replacements) == expected
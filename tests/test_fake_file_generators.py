@@ -135,6 +135,23 @@ class TestOfficeFileGenerator:
         ws = wb.active
         assert ws.max_row == 1001  # 1 header + 1000 data rows
 
+    def test_create_excel_file_column_widths(self, generator, temp_dir):
+        """Test columns are sized to their longest value, capped at 50."""
+        pytest.importorskip("openpyxl")
+        from openpyxl import load_workbook
+
+        from datadetector.fake_file_generators import OfficeFileGenerator
+
+        office_gen = OfficeFileGenerator(generator)
+        excel_path = temp_dir / "test_widths.xlsx"
+        office_gen.create_excel_file(excel_path, rows=300, include_pii=True)
+
+        ws = load_workbook(excel_path).active
+        for column in ws.iter_cols():
+            longest = max(len(str(cell.value)) for cell in column)
+            letter = column[0].column_letter
+            assert ws.column_dimensions[letter].width == min(longest + 2, 50)
+
     def test_create_powerpoint_file_basic(self, generator, temp_dir):
         """Test creating basic PowerPoint file."""
         pytest.importorskip("pptx")
@@ -204,6 +221,16 @@ class TestImageGenerator:
         assert img_path.exists()
         assert img_path.stat().st_size > 0
 
+    def test_get_font_cached_with_fallback(self):
+        """Test fonts are loaded once per (path, size) and fall back to default."""
+        pytest.importorskip("PIL")
+        from datadetector.fake_file_generators import _get_font
+
+        font = _get_font("/nonexistent/font.ttf", 14)
+
+        assert font is not None
+        assert _get_font("/nonexistent/font.ttf", 14) is font
+
     def test_create_image_with_text_formats(self, generator, temp_dir):
         """Test creating images in different formats."""
         pytest.importorskip("PIL")
@@ -458,6 +485,16 @@ class TestPDFGenerator:
 
         assert invoice_path.exists()
 
+    def test_invoice_totals(self):
+        """Test invoice line totals and subtotal."""
+        from datadetector.fake_file_generators import _invoice_totals
+
+        line_totals, subtotal = _invoice_totals([2, 1, 3], [10.0, 4.5, 0.25])
+
+        assert line_totals == [20.0, 4.5, 0.75]
+        assert subtotal == pytest.approx(25.25)
+        assert _invoice_totals([], []) == ([], 0)
+
     def test_pdf_generator_missing_dependency(self, generator):
         """Test error handling when reportlab is not available."""
         # Would need to mock reportlab import to test this properly
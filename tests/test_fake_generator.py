@@ -8,7 +8,8 @@ from pathlib import Path
 
 import pytest
 
-from datadetector import FakeDataGenerator, load_registry
+from datadetector import FakeDataGenerator, fake_generator, load_registry
+from datadetector.fake_generator import FakeValuePool
 
 
 @pytest.fixture
@@ -81,6 +82,14 @@ class TestPatternGeneration:
         assert key.startswith("AIza")
         assert len(key) == 39
 
+    def test_secure_token_uses_whole_alphabet(self):
+        """Test token characters cover the alphabet at every position."""
+        tokens = [fake_generator._secure_token("abc", 8) for _ in range(200)]
+
+        assert all(len(token) == 8 for token in tokens)
+        for position in range(8):
+            assert {token[position] for token in tokens} == {"a", "b", "c"}
+
     def test_from_pattern_ipv4(self, generator):
         """Test generating IPv4 address."""
         ip = generator.from_pattern("comm/ipv4_01")
@@ -430,6 +439,47 @@ class TestGeneratorConfiguration:
         assert email1 != email2
 
 
+class TestFakeValuePool:
+    """Tests for the pooled fake value lookup used by the FAKE strategy."""
+
+    def test_same_original_same_fake(self, generator):
+        """Test that an original value always maps to the same fake value."""
+        pool = FakeValuePool(generator, size=64)
+
+        first = pool.get("comm/email_01", "alice@corp.com")
+        second = pool.get("comm/email_01", "alice@corp.com")
+
+        assert first == second
+        assert "@" in first
+
+    def test_pool_size_bounds_distinct_values(self, generator):
+        """Test that the pool never holds more values than its size."""
+        pool = FakeValuePool(generator, size=4)
+
+        values = {pool.get("comm/email_01", f"user{i}@corp.com") for i in range(50)}
+
+        assert len(values) <= 4
+
+    def test_prefill(self, generator):
+        """Test that prefill populates every slot."""
+        pool = FakeValuePool(generator, size=8)
+        pool.prefill(["us/ssn_01"])
+
+        assert len(pool._pools["us/ssn_01"]) == 8
+
+    def test_unsupported_pattern(self, generator):
+        """Test that unsupported patterns raise ValueError."""
+        pool = FakeValuePool(generator)
+
+        with pytest.raises(ValueError, match="not supported"):
+            pool.get("xx/unknown_01", "value")
+
+    def test_invalid_size(self, generator):
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            FakeValuePool(generator, size=0)
+
+
 class TestIntegrationWithDetector:
     """Tests for integration between generator and detector."""
 
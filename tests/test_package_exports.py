@@ -0,0 +1,50 @@
+"""Tests for the datadetector package exports."""
+
+import json
+import subprocess
+import sys
+
+import datadetector
+
+
+def _run_fresh(code: str) -> str:
+    """Run code in a fresh interpreter and return its last line of output."""
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return output.strip().splitlines()[-1]
+
+
+class TestPackageExports:
+    """Test that every public name resolves through a single export table."""
+
+    def test_all_names_resolve(self):
+        """Test that each name in __all__ is importable from the package."""
+        for name in datadetector.__all__:
+            assert getattr(datadetector, name) is not None, name
+
+    def test_each_name_has_one_source(self):
+        """Test that every export is either imported eagerly or listed as lazy."""
+        eager = set(
+            json.loads(
+                _run_fresh(
+                    "import datadetector, json; "
+                    "print(json.dumps([n for n in datadetector.__all__ "
+                    "if n in vars(datadetector)]))"
+                )
+            )
+        )
+
+        assert eager.isdisjoint(datadetector._LAZY)
+        assert eager | set(datadetector._LAZY) == set(datadetector.__all__)
+
+    def test_import_does_not_load_lazy_modules(self):
+        """Test that importing the package leaves optional submodules unloaded."""
+        loaded = _run_fresh(
+            "import sys, datadetector; "
+            "print(sorted(m for m in ('datadetector.rag_middleware', "
+            "'datadetector.fake_file_generators', 'datadetector.async_engine') "
+            "if m in sys.modules))"
+        )
+
+        assert loaded == "[]"
@@ -5,7 +5,13 @@ import pytest
 from datadetector import Engine, load_registry
 from datadetector.models import RedactionStrategy
 from datadetector.rag_middleware import RAGSecurityMiddleware
-from datadetector.rag_models import SecurityAction, SecurityLayer, SecurityPolicy, SeverityLevel
+from datadetector.rag_models import (
+    SecurityAction,
+    SecurityLayer,
+    SecurityPolicy,
+    SeverityLevel,
+    TokenMap,
+)
 from datadetector.tokenization import SecureTokenizer
 
 
@@ -97,6 +103,24 @@ class TestStorageLayerScanning:
         # Tokens should be present
         assert "TOKEN" in result.sanitized_text
 
+    @pytest.mark.asyncio
+    async def test_scan_documents_concurrently(self, middleware):
+        """Test scanning several documents concurrently keeps order and chunk info."""
+        documents = [
+            "Contact alice.kim@corpmail.net for details",
+            "Nothing sensitive in this chunk",
+            "Escalate to bob.lee@corpmail.net",
+        ]
+        results = await middleware.scan_documents(documents, namespaces=["comm"])
+
+        assert len(results) == 3
+        assert [r.original_text for r in results] == documents
+        assert [r.chunk_id for r in results] == [0, 1, 2]
+        assert all(r.total_chunks == 3 for r in results)
+        assert "alice.kim@corpmail.net" not in results[0].sanitized_text
+        assert results[1].sanitized_text == documents[1]
+        assert "bob.lee@corpmail.net" not in results[2].sanitized_text
+
     @pytest.mark.asyncio
     async def test_scan_document_blocking(self, middleware):
         """Test document blocking."""
@@ -159,6 +183,16 @@ class TestTokenization:
         assert len(token_map.tokens) >= 2
         assert token_map.hash is not None
 
+    def test_tokenize_many_matches_roundtrip(self, tokenizer):
+        """Test that every match is replaced in place and restored."""
+        text = "Mail joe@corpmail.net, ann@corpmail.net, bob@corpmail.net!"
+        sanitized, token_map = tokenizer.tokenize_with_map(text, namespaces=["comm"])
+
+        assert sanitized.startswith("Mail [TOKEN:")
+        assert sanitized.endswith("]!")
+        assert sanitized.count("[TOKEN:") == len(token_map.tokens) == 3
+        assert tokenizer.detokenize(sanitized, token_map) == text
+
     def test_detokenize(self, tokenizer):
         """Test token reversal."""
         original = "Email: john@example.com"
@@ -181,6 +215,39 @@ class TestTokenization:
         # Stable tokens should be identical
         assert sanitized1 == sanitized2
 
+    def test_token_map_bytes_roundtrip(self, tokenizer):
+        """Test token map serialization to and from bytes."""
+        token_map = TokenMap(tokens={"[TOKEN:comm:email:0]": "john@example.com"})
+
+        restored = tokenizer.from_bytes(tokenizer.to_bytes(token_map))
+
+        assert restored.tokens == token_map.tokens
+        assert restored.hash is not None
+
+    def test_save_and_load_token_map(self, tokenizer, tmp_path):
+        """Test persisting a token map and detokenizing with the reloaded copy."""
+        token_map = TokenMap(tokens={"[TOKEN:comm:email:0]": "홍길동@example.com"})
+
+        map_path = tmp_path / "token_map.json"
+        tokenizer.save_token_map(token_map, map_path)
+        loaded = tokenizer.load_token_map(map_path)
+
+        assert loaded.tokens == token_map.tokens
+        assert tokenizer.detokenize("Email: [TOKEN:comm:email:0]", loaded) == (
+            "Email: 홍길동@example.com"
+        )
+
+    def test_load_empty_token_map_file(self, tokenizer, tmp_path):
+        """Test an empty token map file is rejected rather than loaded without a hash."""
+        map_path = tmp_path / "token_map.json"
+        map_path.write_bytes(b"")
+
+        with pytest.raises(ValueError, match="empty"):
+            tokenizer.load_token_map(map_path)
+
+        tokenizer.save_token_map(TokenMap(), map_path)
+        assert tokenizer.load_token_map(map_path).hash is not None
+
 
 class TestPolicyManagement:
     """Tests for policy management."""
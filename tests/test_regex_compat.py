@@ -24,17 +24,17 @@ class TestCompile:
         with pytest.raises(regex_compat.error):
             regex_compat.compile(r"[")
 
-    @pytest.mark.skipif(not regex_compat.HAS_RE2, reason="RE2 not available")
-    def test_compile_lookahead_raises(self) -> None:
-        """Test that lookaheads are not supported in RE2."""
-        with pytest.raises(regex_compat.error):
-            regex_compat.compile(r"(?=\d)\d+")
+    def test_compile_lookahead_falls_back(self) -> None:
+        """Test that lookaheads (unsupported by RE2) compile with the re module."""
+        pattern = regex_compat.compile(r"\d+(?=\s*USD)")
+        assert pattern.using_re2 is False
+        assert pattern.search("100 USD").group() == "100"
 
-    @pytest.mark.skipif(not regex_compat.HAS_RE2, reason="RE2 not available")
-    def test_compile_lookbehind_raises(self) -> None:
-        """Test that lookbehinds are not supported in RE2."""
-        with pytest.raises(regex_compat.error):
-            regex_compat.compile(r"(?<=\d)\d+")
+    def test_compile_lookbehind_falls_back(self) -> None:
+        """Test that lookbehinds (unsupported by RE2) compile with the re module."""
+        pattern = regex_compat.compile(r"(?<=\$)\d+")
+        assert pattern.using_re2 is False
+        assert pattern.search("$100").group() == "100"
 
 
 class TestFullmatch:
@@ -121,6 +121,12 @@ class TestFinditer:
         matches = list(pattern.finditer("abcdef"))
         assert matches == []
 
+    def test_finditer_from_offset(self) -> None:
+        """Test finditer starting at an offset still sees preceding text."""
+        pattern = regex_compat.compile(r"\b\d+")
+        matches = list(pattern.finditer("12 345 6x7", 4))
+        assert [m.group() for m in matches] == ["6"]
+
 
 class TestFindall:
     """Tests for findall method."""
@@ -265,12 +271,41 @@ class TestEngineSelection:
         pattern = regex_compat.compile(r"\d+")
         assert pattern._using_re2 is True
 
+    @pytest.mark.skipif(not regex_compat.HAS_RE2, reason="RE2 not available")
+    def test_set_engine_re2_rejects_lookaround(self) -> None:
+        """Test that forcing RE2 disables the fallback for unsupported features."""
+        regex_compat.set_engine(regex_compat.RegexEngine.RE2)
+        with pytest.raises(regex_compat.error):
+            regex_compat.compile(r"(?=\d)\d+")
+        with pytest.raises(regex_compat.error):
+            regex_compat.compile(r"(?<=\d)\d+")
+
     @pytest.mark.skipif(regex_compat.HAS_RE2, reason="RE2 is available")
     def test_set_engine_re2_raises_when_unavailable(self) -> None:
         """Test that setting RE2 raises error when unavailable."""
         with pytest.raises(ValueError, match="google-re2 is not installed"):
             regex_compat.set_engine(regex_compat.RegexEngine.RE2)
 
+    @pytest.mark.skipif(not regex_compat.HAS_PCRE2, reason="pcre2 not available")
+    def test_set_engine_pcre2_matches_like_re(self) -> None:
+        """Test that PCRE2 patterns find the same matches as the re module."""
+        regex_compat.set_engine(regex_compat.RegexEngine.PCRE2)
+        pattern = regex_compat.compile(r"[a-z]{2}\d{3}", flags=regex_compat.IGNORECASE)
+        assert pattern.backend == "pcre2"
+        assert pattern.using_re2 is False
+
+        text = "ab123 CD456 ef78 gh901"
+        assert [m.span() for m in pattern.finditer(text)] == [(0, 5), (6, 11), (17, 22)]
+        assert [m.span() for m in pattern.finditer(text, 6)] == [(6, 11), (17, 22)]
+        assert pattern.fullmatch("Xy999") is not None
+        assert pattern.fullmatch("Xy9999") is None
+
+    @pytest.mark.skipif(regex_compat.HAS_PCRE2, reason="pcre2 is available")
+    def test_set_engine_pcre2_raises_when_unavailable(self) -> None:
+        """Test that setting PCRE2 raises error when unavailable."""
+        with pytest.raises(ValueError, match="pcre2 is not installed"):
+            regex_compat.set_engine(regex_compat.RegexEngine.PCRE2)
+
     def test_standard_mode_works_for_all_patterns(self) -> None:
         """Test that STANDARD mode compiles and matches patterns correctly."""
         regex_compat.set_engine(regex_compat.RegexEngine.STANDARD)
@@ -319,3 +354,249 @@ class TestEngineSelection:
         assert pattern1._using_re2 == original_using_re2
         # pattern2 should use standard re
         assert pattern2._using_re2 is False
+
+
+class TestCompileCache:
+    """Tests for the process-wide compiled pattern cache."""
+
+    def teardown_method(self) -> None:
+        """Reset engine and cache after each test."""
+        regex_compat.set_engine(regex_compat.RegexEngine.AUTO)
+        regex_compat.clear_cache()
+
+    def test_same_pattern_is_reused(self) -> None:
+        """Test that compiling the same pattern twice returns the cached object."""
+        first = regex_compat.compile(r"\d{3}", pattern_id="test/cache")
+        second = regex_compat.compile(r"\d{3}", pattern_id="test/cache")
+        assert first is second
+
+    def test_different_flags_not_shared(self) -> None:
+        """Test that flags are part of the cache key."""
+        plain = regex_compat.compile(r"abc")
+        ci = regex_compat.compile(r"abc", flags=regex_compat.IGNORECASE)
+        assert plain is not ci
+        assert ci.search("ABC") is not None
+        assert plain.search("ABC") is None
+
+    def test_engine_switch_bypasses_cache(self) -> None:
+        """Test that a pattern compiled for one backend is not reused by another."""
+        regex_compat.set_engine(regex_compat.RegexEngine.STANDARD)
+        pattern = regex_compat.compile(r"\d+")
+        assert pattern._using_re2 is False
+
+        regex_compat.set_engine(regex_compat.RegexEngine.AUTO)
+        assert regex_compat.compile(r"\d+")._using_re2 == regex_compat.HAS_RE2
+
+    def test_clear_cache(self) -> None:
+        """Test that clear_cache forces recompilation."""
+        first = regex_compat.compile(r"\w+")
+        regex_compat.clear_cache()
+        assert regex_compat.compile(r"\w+") is not first
+
+
+class TestRequiredLiterals:
+    """Tests for literal prefilter derivation."""
+
+    def test_plain_literal(self) -> None:
+        """Test that a literal run becomes a requirement."""
+        assert frozenset(["ORD-"]) in regex_compat.required_literals(r"ORD-\d+")
+
+    def test_optional_literal_ignored(self) -> None:
+        """Test that optional parts are not required."""
+        assert regex_compat.required_literals(r"\d{3}-?\d{4}") == (
+            regex_compat.required_literals(r"\d{3}\d{4}")
+        )
+
+    def test_alternation_union(self) -> None:
+        """Test that alternation requires one literal from any branch."""
+        requirements = regex_compat.required_literals(r"(?:sk|pk)_live")
+        assert frozenset(["sk", "pk"]) in requirements
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"(?:[0-9]{9}|[A-Z][0-9]{8})", r"-?(?:[1-8]?\d|90(?:\.0+)?)", r"(?:\d{6}|ID-\d{4})"],
+    )
+    def test_alternation_of_digit_branches(self, pattern) -> None:
+        """Test that alternations whose branches all need a digit require one."""
+        requirements = regex_compat.required_literals(pattern)
+        assert requirements
+        assert not regex_compat.literals_present(requirements, "no digits here")
+
+    def test_alternation_with_digit_free_branch(self) -> None:
+        """Test that one branch without a digit drops the requirement."""
+        assert regex_compat.required_literals(r"(?:\d{6}|[A-Z]{6})") == ()
+
+    def test_ignorecase_drops_cased_literals(self) -> None:
+        """Test that only uncased literals are kept under IGNORECASE."""
+        requirements = regex_compat.required_literals(r"user@host", flags=regex_compat.IGNORECASE)
+        assert requirements == (frozenset(["@"]),)
+
+    def test_unparseable_pattern_has_no_requirements(self) -> None:
+        """Test that RE2-only syntax disables the prefilter."""
+        assert regex_compat.required_literals(r"\p{Han}+") == ()
+
+    def test_literals_present(self) -> None:
+        """Test checking requirements against text."""
+        requirements = regex_compat.required_literals(r"\d{3}@x")
+        assert regex_compat.literals_present(requirements, "123@x")
+        assert not regex_compat.literals_present(requirements, "abc@x")
+        assert not regex_compat.literals_present(requirements, "123 x")
+
+    def test_literals_present_with_text_chars(self) -> None:
+        """Test the character set gives the same answers as scanning the text."""
+        requirements = regex_compat.required_literals(r"(?:東京都|大阪府)\d+|AKIA\w+")
+        # First character present but literal absent ("東京タワー") must not count
+        for text in ["大阪府123", "東京タワー 456", "AKIA1", "plain 789"]:
+            text_chars = set(text)
+            assert regex_compat.literals_present(
+                requirements, text, text_chars=text_chars
+            ) == regex_compat.literals_present(requirements, text)
+
+    def test_literal_chars_only_for_long_texts(self) -> None:
+        """Test short texts are checked without building a character set."""
+        assert regex_compat.literal_chars("short text") is None
+        assert regex_compat.literal_chars("ab" * 1000) == {"a", "b"}
+
+    def test_digit_requirement_accepts_unicode_digits(self) -> None:
+        """Test that the digit requirement accepts any Unicode digit."""
+        requirements = regex_compat.required_literals(r"\d+")
+        assert regex_compat.literals_present(requirements, "１２")
+
+
+_NEEDS_STD_RE = pytest.mark.skipif(regex_compat.HAS_RE2, reason="RE2 has no backreferences")
+
+
+class TestCompileUnion:
+    """Tests for union prefilter compilation."""
+
+    def test_union_finds_leftmost_match(self) -> None:
+        """Test the union matches where the earliest pattern matches."""
+        patterns = [regex_compat.compile(r"\d{3}"), regex_compat.compile(r"[a-z]+@x")]
+        union = regex_compat.compile_union(patterns)
+        assert union.search("AB abc@x 123").start() == 3
+        assert union.search("AB 12 AB") is None
+
+    def test_union_keeps_pattern_flags(self) -> None:
+        """Test per-pattern flags only apply to their own branch."""
+        patterns = [
+            regex_compat.compile(r"key", flags=regex_compat.IGNORECASE),
+            regex_compat.compile(r"token"),
+        ]
+        union = regex_compat.compile_union(patterns)
+        assert union.search("KEY").start() == 0
+        assert union.search("TOKEN") is None
+
+    @pytest.mark.parametrize(
+        "unsafe",
+        [
+            r"(?P<digits>\d+)",
+            pytest.param(r"(\d)\1", marks=_NEEDS_STD_RE),
+            pytest.param(r"(a)?(?(1)b|c)", marks=_NEEDS_STD_RE),
+        ],
+    )
+    def test_unsafe_patterns_not_combined(self, unsafe) -> None:
+        """Test patterns that change meaning inside a union are rejected."""
+        patterns = [regex_compat.compile(r"\d{3}"), regex_compat.compile(unsafe)]
+        assert regex_compat.compile_union(patterns) is None
+
+    def test_plain_re_patterns_not_combined(self) -> None:
+        """Test only CompiledPattern objects are combined."""
+        import re
+
+        assert regex_compat.compile_union([re.compile(r"a"), re.compile(r"b")]) is None
+
+
+@pytest.mark.skipif(not regex_compat.HAS_HYPERSCAN, reason="Hyperscan not available")
+class TestMultiPatternPrefilter:
+    """Test Hyperscan prefiltering of pattern sets."""
+
+    def test_candidates(self) -> None:
+        """Test only patterns that may match are returned."""
+        digits = regex_compat.compile(r"\d{3}-\d{4}")
+        email = regex_compat.compile(r"[a-z]+@corpmail\.net", flags=regex_compat.IGNORECASE)
+        prefilter = regex_compat.MultiPatternPrefilter([digits, email])
+
+        assert prefilter.candidates("call 555-0199") == {digits}
+        assert prefilter.candidates("JOE@CORPMAIL.NET") == {email}
+        assert prefilter.candidates("nothing here") == set()
+
+    def test_unscannable_text_returns_none(self) -> None:
+        """Test non-ASCII text and line separators skip the prefilter."""
+        prefilter = regex_compat.MultiPatternPrefilter([regex_compat.compile(r"\d{3}")])
+        assert prefilter.candidates("전화 555") is None
+        assert prefilter.candidates("555\x1c") is None
+
+    def test_non_ascii_patterns_always_candidates(self) -> None:
+        """Test patterns with non-ASCII sources are never filtered out."""
+        hangul = regex_compat.compile(r"전화")
+        digits = regex_compat.compile(r"\d{3}")
+        prefilter = regex_compat.MultiPatternPrefilter([hangul, digits])
+        assert prefilter.candidates("plain text") == {hangul}
+
+
+class TestBytesMode:
+    """Test bytes-mode copies of ASCII patterns."""
+
+    def test_ascii_pattern_has_bytes_copy(self) -> None:
+        """Test the bytes copy finds the same spans on ASCII text."""
+        pattern = regex_compat.compile(r"\b\d{3}-\d{4}\b")
+        text = "call 555-0199 or 555-0100"
+        buffer = regex_compat.ascii_buffer(text)
+        assert pattern.bytes_pattern is not None
+        assert [m.span() for m in pattern.bytes_pattern.finditer(buffer)] == [
+            m.span() for m in pattern.finditer(text)
+        ]
+
+    def test_non_ascii_pattern_has_no_bytes_copy(self) -> None:
+        """Test patterns with non-ASCII sources only scan in str mode."""
+        assert regex_compat.compile(r"전화\d+").bytes_pattern is None
+        assert regex_compat.compile(r"가+").bytes_pattern is None
+
+    def test_ascii_buffer(self) -> None:
+        """Test only ASCII texts without extra \\s separators are encoded."""
+        assert regex_compat.ascii_buffer("id 42") == b"id 42"
+        assert regex_compat.ascii_buffer("전화 555") is None
+        assert regex_compat.ascii_buffer("555\x1c") is None
+
+
+class TestExponentialBacktracking:
+    """Test static detection of catastrophic backtracking."""
+
+    def teardown_method(self) -> None:
+        """Reset engine to AUTO after each test."""
+        regex_compat.set_engine(regex_compat.RegexEngine.AUTO)
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"(a+)+", r"(a*)*", r"(a|a)*", r"^(\d+,?)+$", r"(\w+\s?)+$", r"(\w+\w+)+", r"(.*a)+"],
+    )
+    def test_ambiguous_repeats_detected(self, pattern) -> None:
+        """Test repeats that can match one text in many ways are flagged."""
+        assert regex_compat.has_exponential_backtracking(pattern) is True
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+            r"(?:[a-z0-9-]+\.)+[a-z]{2,}",
+            r"[A-Z][a-z]+(?: [A-Z][a-z]+)*",
+            r"(?:\d{3}-)+\d{4}",
+            r"(\w+\s)+",
+            r"(?>a+)+",
+        ],
+    )
+    def test_unambiguous_repeats_accepted(self, pattern) -> None:
+        """Test common PII shapes and atomic groups are not flagged."""
+        assert regex_compat.has_exponential_backtracking(pattern) is False
+
+    def test_only_backtracking_backends_flagged(self) -> None:
+        """Test compiled patterns report the risk only off RE2."""
+        regex_compat.set_engine(regex_compat.RegexEngine.STANDARD)
+        assert regex_compat.compile(r"(a+)+b").exponential_backtracking is True
+        assert regex_compat.compile(r"a+b").exponential_backtracking is False
+
+    @pytest.mark.skipif(not regex_compat.HAS_RE2, reason="RE2 not available")
+    def test_re2_patterns_not_flagged(self) -> None:
+        """Test RE2's linear-time matching needs no rejection."""
+        regex_compat.set_engine(regex_compat.RegexEngine.RE2)
+        assert regex_compat.compile(r"(a+)+b").exponential_backtracking is False
@@ -5,6 +5,7 @@ import re
 
 import pytest
 
+from datadetector import regex_compat
 from datadetector.models import ActionOnMatch, Category, Pattern, Policy, Severity
 from datadetector.registry import (
     PatternRegistry,
@@ -307,6 +308,79 @@ class TestPatternRegistryMethods:
         registry = PatternRegistry()
         assert registry.get_namespace_patterns("nonexistent") == []
 
+    @staticmethod
+    def _make_pattern(pattern_id, namespace, priority, compiled=None):
+        return Pattern(
+            id=pattern_id,
+            namespace=namespace,
+            location=namespace,
+            category=Category.EMAIL,
+            pattern=r"test",
+            compiled=compiled or re.compile(r"test"),
+            description="Test",
+            flags=[],
+            mask="***",
+            examples=None,
+            policy=Policy(
+                store_raw=False,
+                action_on_match=ActionOnMatch.REDACT,
+                severity=Severity.MEDIUM,
+            ),
+            metadata={},
+            verification=None,
+            verification_func=None,
+            priority=priority,
+        )
+
+    def test_get_sorted_patterns(self):
+        """Test patterns are ordered by priority then id, cached until changed."""
+        registry = PatternRegistry()
+        registry.add_pattern(self._make_pattern("b_01", "kr", 100))
+        registry.add_pattern(self._make_pattern("a_01", "us", 100))
+        registry.add_pattern(self._make_pattern("c_01", "us", 10))
+
+        patterns = registry.get_sorted_patterns(["kr", "us"])
+        assert [p.full_id for p in patterns] == ["us/c_01", "kr/b_01", "us/a_01"]
+        assert registry.get_sorted_patterns(["kr", "us"]) is patterns
+        assert [p.full_id for p in registry.get_sorted_patterns(["kr"])] == ["kr/b_01"]
+
+        registry.add_pattern(self._make_pattern("d_01", "kr", 1))
+        patterns = registry.get_sorted_patterns(["kr", "us"])
+        assert patterns[0].full_id == "kr/d_01"
+
+    def test_get_priority_groups(self):
+        """Test patterns are split by priority, with unions on RE2 only."""
+        registry = PatternRegistry()
+        for pattern_id, priority, regex in [
+            ("a_01", 100, r"\d{3}"),
+            ("b_01", 100, r"[a-z]+@x"),
+            ("c_01", 10, r"key"),
+        ]:
+            compiled = regex_compat.compile(regex)
+            registry.add_pattern(self._make_pattern(pattern_id, "us", priority, compiled))
+
+        groups = registry.get_priority_groups(["us"])
+        assert [[p.full_id for p in group] for _, group in groups] == [
+            ["us/c_01"],
+            ["us/a_01", "us/b_01"],
+        ]
+        assert groups[0][0] is None
+        assert (groups[1][0] is not None) == regex_compat.HAS_RE2
+        assert registry.get_priority_groups(["us"]) is groups
+
+    def test_get_multi_prefilter(self, monkeypatch):
+        """Test the Hyperscan prefilter is optional and cached per namespace list."""
+        registry = PatternRegistry()
+        compiled = regex_compat.compile(r"\d{3}")
+        registry.add_pattern(self._make_pattern("a_01", "us", 100, compiled))
+
+        prefilter = registry.get_multi_prefilter(["us"])
+        assert (prefilter is not None) == regex_compat.HAS_HYPERSCAN
+        assert registry.get_multi_prefilter(["us"]) is prefilter
+
+        monkeypatch.setattr(regex_compat, "HAS_HYPERSCAN", False)
+        assert PatternRegistry().get_multi_prefilter(["us"]) is None
+
     def test_load_registry_with_validation_disabled(self, tmp_path):
         """Test loading registry with validation disabled."""
         pattern_file = tmp_path / "pattern.yml"
@@ -336,3 +410,69 @@ patterns:
             paths=[str(pattern_file)], validate_schema=False, validate_examples=False
         )
         assert len(registry) == 1
+
+    def test_example_failures_reported_together(self, tmp_path):
+        """Test that example failures from all patterns are raised in one error."""
+        pattern_file = tmp_path / "pattern.yml"
+        pattern_file.write_text(
+            """
+namespace: test
+patterns:
+  - id: digits_01
+    location: test
+    category: other
+    pattern: '[0-9]+'
+    examples:
+      match:
+        - "abc"
+  - id: letters_01
+    location: test
+    category: other
+    pattern: '[a-z]+'
+    examples:
+      nomatch:
+        - "abc"
+"""
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            load_registry(paths=[str(pattern_file)], validate_schema=False)
+
+        message = str(exc_info.value)
+        assert "test/digits_01 example validation failed" in message
+        assert "test/letters_01 example validation failed" in message
+
+    def test_exponential_backtracking_pattern_skipped(self, tmp_path, caplog):
+        """Test patterns that can backtrack exponentially are not registered."""
+        pattern_file = tmp_path / "pattern.yml"
+        pattern_file.write_text(
+            """
+namespace: test
+patterns:
+  - id: words_01
+    location: test
+    category: other
+    pattern: '(\\w+\\s?)+$'
+  - id: digits_01
+    location: test
+    category: other
+    pattern: '[0-9]+'
+"""
+        )
+
+        regex_compat.set_engine(regex_compat.RegexEngine.STANDARD)
+        try:
+            with caplog.at_level(logging.WARNING):
+                registry = load_registry(paths=[str(pattern_file)], validate_schema=False)
+            assert registry.get_pattern("test/words_01") is None
+            assert registry.get_pattern("test/digits_01") is not None
+            assert "Skipping pattern test/words_01" in caplog.text
+
+            registry = load_registry(
+                paths=[str(pattern_file)],
+                validate_schema=False,
+                reject_exponential_backtracking=False,
+            )
+            assert registry.get_pattern("test/words_01") is not None
+        finally:
+            regex_compat.set_engine(regex_compat.RegexEngine.AUTO)
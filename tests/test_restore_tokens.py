@@ -194,3 +194,113 @@ patterns:
         # Check other patterns preserved
         assert "github_token" in new_content
         assert "aws_key" in new_content
+
+    def test_restore_keeps_surrounding_layout(self, tmp_path):
+        """Test that only the stripe_key_01 lines are rewritten."""
+        tokens_file = tmp_path / "tokens.yml"
+        tokens_file.write_text(
+            """patterns:
+  - id: stripe_key_01
+    location: comm
+    pattern: 'rk_(live|test)_[A-Za-z0-9]{24,}'
+
+  # trailing comment
+  - id: aws_key
+    location: comm
+"""
+        )
+
+        assert restore_tokens_yml(str(tokens_file)) is True
+
+        new_content = tokens_file.read_text()
+        assert new_content.startswith("patterns:\n  - id: stripe_key_01\n")
+        assert new_content.endswith(
+            'type: "API Key"\n\n  # trailing comment\n  - id: aws_key\n    location: comm\n'
+        )
+        assert "rk_(live|test)_" not in new_content
+        assert not (tmp_path / "tokens.yml.tmp").exists()
+
+    def test_restore_is_idempotent(self, tmp_path):
+        """Test that a second run finds nothing to change."""
+        tokens_file = tmp_path / "tokens.yml"
+        tokens_file.write_text(
+            """patterns:
+  - id: stripe_key_01
+    pattern: 'rk_(live|test)_[A-Za-z0-9]{24,}'
+"""
+        )
+
+        assert restore_tokens_yml(str(tokens_file)) is True
+        restored = tokens_file.read_text()
+
+        assert restore_tokens_yml(str(tokens_file)) is True
+        assert tokens_file.read_text() == restored
+
+    def test_restore_column_zero_list(self, tmp_path):
+        """Test list items at column 0 with 2-space properties, as in the bundled file."""
+        tokens_file = tmp_path / "tokens.yml"
+        tokens_file.write_text(
+            """patterns:
+- id: stripe_key_01
+  location: comm
+  pattern: rk_(live|test)_[A-Za-z0-9]{24,}
+  priority: 1
+  langs:
+    python: rk_(live|test)_[A-Za-z0-9]{24,}
+- id: aws_key
+  location: comm
+"""
+        )
+
+        assert restore_tokens_yml(str(tokens_file)) is True
+
+        new_content = tokens_file.read_text()
+        assert new_content.startswith("patterns:\n- id: stripe_key_01\n  location: comm\n")
+        assert new_content.endswith('    type: "API Key"\n- id: aws_key\n  location: comm\n')
+        assert "rk_(live|test)_" not in new_content
+        assert "priority: 1\n" not in new_content
+
+    def test_restore_section_with_blank_line(self, tmp_path):
+        """Test a blank or comment line inside the section leaves nothing behind."""
+        tokens_file = tmp_path / "tokens.yml"
+        tokens_file.write_text(
+            """patterns:
+  - id: stripe_key_01
+    pattern: 'rk_(live|test)_[A-Za-z0-9]{24,}'
+
+    # tuning
+    priority: 1
+  - id: aws_key
+"""
+        )
+
+        assert restore_tokens_yml(str(tokens_file)) is True
+
+        new_content = tokens_file.read_text()
+        assert "priority: 1\n" not in new_content
+        assert "# tuning" not in new_content
+        assert new_content.endswith('      type: "API Key"\n  - id: aws_key\n')
+
+    def test_restore_keeps_crlf_line_endings(self, tmp_path):
+        """Test a CRLF file keeps CRLF endings throughout."""
+        tokens_file = tmp_path / "tokens.yml"
+        tokens_file.write_bytes(
+            b"patterns:\r\n"
+            b"  - id: stripe_key_01\r\n"
+            b"    pattern: 'rk_(live|test)_[A-Za-z0-9]{24,}'\r\n"
+            b"  - id: aws_key\r\n"
+        )
+
+        assert restore_tokens_yml(str(tokens_file)) is True
+
+        new_content = tokens_file.read_bytes()
+        assert new_content.count(b"\n") == new_content.count(b"\r\n")
+        assert new_content.endswith(b'      type: "API Key"\r\n  - id: aws_key\r\n')
+
+    def test_restore_missing_section_fails(self, tmp_path):
+        """Test a file without stripe_key_01 is reported as an error."""
+        tokens_file = tmp_path / "tokens.yml"
+        tokens_file.write_text("patterns:\n  - id: aws_key\n    location: comm\n")
+
+        assert restore_tokens_yml(str(tokens_file)) is False
+        assert tokens_file.read_text() == "patterns:\n  - id: aws_key\n    location: comm\n"
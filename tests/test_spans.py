@@ -0,0 +1,50 @@
+"""Tests for span overlap bookkeeping."""
+
+import random
+
+from datadetector.utils.spans import SpanSet
+
+
+def _spans_overlap(span1, span2):
+    start1, end1 = span1
+    start2, end2 = span2
+    return not (end1 <= start2 or end2 <= start1)
+
+
+class TestSpanSet:
+    """Test SpanSet overlap checks."""
+
+    def test_touching_spans_do_not_overlap(self):
+        """Spans sharing only a boundary are both accepted."""
+        spans = SpanSet()
+        spans.add(5, 10)
+        assert not spans.overlaps(0, 5)
+        assert not spans.overlaps(10, 12)
+        assert spans.overlaps(9, 11)
+        assert spans.overlaps(0, 20)
+
+    def test_empty_spans(self):
+        """Empty spans overlap only spans strictly containing them."""
+        spans = SpanSet()
+        spans.add(0, 5)
+        spans.add(5, 5)
+        assert spans.overlaps(3, 3)
+        assert spans.overlaps(3, 4)
+        assert not spans.overlaps(5, 7)
+        assert not spans.overlaps(0, 0)
+
+    def test_matches_pairwise_check(self):
+        """Accepting spans greedily gives the same result as a pairwise scan."""
+        rng = random.Random(7)
+        for _ in range(200):
+            spans = SpanSet()
+            accepted = []
+            for _ in range(30):
+                start = rng.randint(0, 50)
+                end = start + rng.randint(0, 6)
+                expected = any(_spans_overlap((start, end), other) for other in accepted)
+                assert spans.overlaps(start, end) == expected
+                if not expected:
+                    spans.add(start, end)
+                    accepted.append((start, end))
+            assert len(spans) == len(accepted)
@@ -89,6 +89,18 @@ class TestLuhn:
         assert luhn("4532-0151-1283-0366")
         assert luhn("5425 2334 3010 9903")
 
+    def test_non_ascii_digits(self):
+        """Test Luhn with full-width digits and non-ASCII separators."""
+        assert luhn("４５３２０１５１１２８３０３６６")
+        assert not luhn("４５３２０１５１１２８３０３６７")
+        assert luhn("4532—0151—1283—0366")
+
+    def test_single_digit(self):
+        """Test that only the digits at even positions from the right are doubled."""
+        assert luhn("0")
+        assert luhn("18")
+        assert not luhn("81")
+
 
 class TestHighEntropyToken:
     """Test high entropy token verification."""
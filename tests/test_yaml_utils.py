@@ -32,6 +32,14 @@ patterns:
         assert data["description"] == "Test patterns"
         assert len(data["patterns"]) == 1
 
+    def test_read_yaml_non_ascii(self, tmp_path):
+        """Test that UTF-8 content is decoded when reading."""
+        yaml_file = tmp_path / "test.yml"
+        yaml_file.write_bytes("namespace: kr\ndescription: 주민등록번호\n".encode())
+
+        data = YAMLHandler.read_yaml(yaml_file)
+        assert data["description"] == "주민등록번호"
+
     def test_read_yaml_file_not_found(self, tmp_path):
         """Test reading non-existent file raises error."""
         with pytest.raises(FileNotFoundError):
@@ -110,6 +118,32 @@ patterns:
         data = YAMLHandler.read_yaml(yaml_file)
         assert data == {"new": "data"}
 
+    def test_write_yaml_does_not_wrap_long_strings(self, tmp_path):
+        """Test that long scalars stay on one line and round-trip unchanged."""
+        yaml_file = tmp_path / "test.yml"
+        pattern = "(?:" + "|".join(f"ID{i:04d}-[A-Z]{{2}}\\d{{6}}" for i in range(20)) + ")"
+
+        YAMLHandler.write_yaml(yaml_file, {"pattern": pattern})
+
+        assert len(yaml_file.read_text().splitlines()) == 1
+        assert YAMLHandler.read_yaml(yaml_file) == {"pattern": pattern}
+
+    def test_write_yaml_is_atomic(self, tmp_path, monkeypatch):
+        """Test that a failed write leaves the existing file and no temp files."""
+        yaml_file = tmp_path / "test.yml"
+        YAMLHandler.write_yaml(yaml_file, {"key": "old"})
+
+        def failing_dump(*args, **kwargs):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr("datadetector.utils.yaml_utils.yaml.dump", failing_dump)
+
+        with pytest.raises(RuntimeError):
+            YAMLHandler.write_yaml(yaml_file, {"key": "new"}, overwrite=True)
+
+        assert YAMLHandler.read_yaml(yaml_file) == {"key": "old"}
+        assert [p.name for p in tmp_path.iterdir()] == ["test.yml"]
+
     def test_write_yaml_not_dict_raises_error(self, tmp_path):
         """Test writing non-dict raises error."""
         yaml_file = tmp_path / "test.yml"
@@ -404,6 +438,83 @@ class TestPatternFileHandler:
 
         assert pattern_ids == []
 
+    def test_edit_writes_once(self, tmp_path):
+        """Test that several changes inside edit() are saved together."""
+        yaml_file = tmp_path / "patterns.yml"
+        pattern = {"id": "test_01", "location": "test", "category": "other", "pattern": "x"}
+        PatternFileHandler.create_pattern_file(
+            yaml_file, namespace="test", description="Test", patterns=[pattern]
+        )
+
+        with PatternFileHandler.edit(yaml_file) as data:
+            data["patterns"].append(dict(pattern, id="test_02"))
+            data["patterns"][0]["pattern"] = "y"
+
+        assert PatternFileHandler.list_patterns_in_file(yaml_file) == ["test_01", "test_02"]
+        assert PatternFileHandler.get_pattern_from_file(yaml_file, "test_01")["pattern"] == "y"
+
+    def test_edit_discards_changes_on_error(self, tmp_path):
+        """Test that the file is not written when the edit block raises."""
+        yaml_file = tmp_path / "patterns.yml"
+        PatternFileHandler.create_pattern_file(yaml_file, namespace="test", description="Test")
+
+        with pytest.raises(RuntimeError):
+            with PatternFileHandler.edit(yaml_file) as data:
+                data["patterns"].append({"id": "test_01"})
+                raise RuntimeError("abort")
+
+        assert PatternFileHandler.list_patterns_in_file(yaml_file) == []
+
+    def test_lookups_parse_file_once(self, tmp_path, monkeypatch):
+        """Test that repeated lookups on an unchanged file reuse one parse."""
+        yaml_file = tmp_path / "patterns.yml"
+        patterns = [
+            {"id": f"test_0{i}", "location": "test", "category": "other", "pattern": "x"}
+            for i in range(3)
+        ]
+        PatternFileHandler.create_pattern_file(
+            yaml_file, namespace="test", description="Test", patterns=patterns
+        )
+
+        parses = []
+        original_read = YAMLHandler.read_yaml
+
+        def counting_read(file_path):
+            parses.append(file_path)
+            return original_read(file_path)
+
+        monkeypatch.setattr(YAMLHandler, "read_yaml", staticmethod(counting_read))
+
+        for pid in PatternFileHandler.list_patterns_in_file(yaml_file):
+            PatternFileHandler.get_pattern_from_file(yaml_file, pid)
+
+        assert len(parses) == 1
+
+    def test_lookup_sees_file_changes(self, tmp_path):
+        """Test that writes to the file invalidate cached lookups."""
+        yaml_file = tmp_path / "patterns.yml"
+        pattern = {"id": "test_01", "location": "test", "category": "other", "pattern": "x"}
+        PatternFileHandler.create_pattern_file(
+            yaml_file, namespace="test", description="Test", patterns=[pattern]
+        )
+        assert PatternFileHandler.get_pattern_from_file(yaml_file, "test_01")["pattern"] == "x"
+
+        PatternFileHandler.update_pattern_in_file(yaml_file, "test_01", {"pattern": "y"})
+
+        assert PatternFileHandler.get_pattern_from_file(yaml_file, "test_01")["pattern"] == "y"
+
+    def test_returned_pattern_is_a_copy(self, tmp_path):
+        """Test that mutating a returned pattern does not affect later lookups."""
+        yaml_file = tmp_path / "patterns.yml"
+        pattern = {"id": "test_01", "location": "test", "category": "other", "pattern": "x"}
+        PatternFileHandler.create_pattern_file(
+            yaml_file, namespace="test", description="Test", patterns=[pattern]
+        )
+
+        PatternFileHandler.get_pattern_from_file(yaml_file, "test_01")["pattern"] = "changed"
+
+        assert PatternFileHandler.get_pattern_from_file(yaml_file, "test_01")["pattern"] == "x"
+
 
 class TestConvenienceFunctions:
     """Test convenience functions."""